@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Altitude filter benchmark: added lag versus jitter
+
+Feeds a hand-height trace through AltitudeControl with different filters
+(no filter, exponential smoothing, One-Euro settings) and reports, in
+screen pixels and milliseconds:
+  - lag: delay that best aligns the output with the reference (the true
+    path for synthetic traces, the raw trace for recordings)
+  - jitter: RMS of the output's frame-to-frame wobble (output minus its
+    own 5-frame centered average)
+  - error: RMS distance from the true path (synthetic traces only)
+
+Usage:
+    python benchmarks/altitude_filter_benchmark.py [--data recording.npz]
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from config import *
+from altitude_control import AltitudeControl, OneEuroFilter
+from landmark_data import load_landmarks
+
+class ExponentialFilter:
+    """Plain exponential smoothing, for comparison"""
+
+    def __init__(self, alpha):
+        self.alpha = alpha
+        self.value = None
+
+    def reset(self):
+        self.value = None
+
+    def __call__(self, x, t):
+        self.value = x if self.value is None else self.alpha * x + (1 - self.alpha) * self.value
+        return self.value
+
+def synthetic_trace(seconds=30.0, fps=30.0, noise=0.004, seed=0):
+    """
+    Hand moving between random heights (minimum-jerk moves, then holds)
+    with camera-like timing jitter and landmark noise
+
+    Returns: (timestamps, true heights, measured heights) as fractions of frame
+    """
+    rng = np.random.default_rng(seed)
+    t = np.cumsum(rng.normal(1.0 / fps, 0.002, int(seconds * fps)))
+    truth = np.empty_like(t)
+    start, height = 0.0, 0.5
+    while start < t[-1]:
+        hold = rng.uniform(0.3, 1.5)
+        move = rng.uniform(0.25, 0.8)
+        target = rng.uniform(0.2, 0.8)
+        holding = (t >= start) & (t < start + hold)
+        truth[holding] = height
+        moving = (t >= start + hold) & (t < start + hold + move)
+        s = (t[moving] - start - hold) / move
+        truth[moving] = height + (target - height) * (10 * s**3 - 15 * s**4 + 6 * s**5)
+        start += hold + move
+        height = target
+    return t, truth, truth + rng.normal(0, noise, len(t))
+
+def recorded_trace(paths):
+    """Hand-center heights from recorded landmarks (needs timestamps)"""
+    data = load_landmarks(*paths)
+    if 'timestamps' not in data:
+        raise SystemExit("Recording has no timestamps; record with tools/record_landmarks.py")
+    landmarks = data['landmarks']
+    # Same center as HandGestureDetector.get_hand_center
+    y = (landmarks[:, HAND_LANDMARKS['WRIST'], 1] +
+         landmarks[:, HAND_LANDMARKS['MIDDLE_TIP'], 1]) / 2 / CAMERA_HEIGHT
+    return data['timestamps'], None, y
+
+def run_control(make_filter, t, measured):
+    """Returns: target altitude (pixels) per sample"""
+    control = AltitudeControl()
+    control.filter = make_filter()
+    return np.array([control.update(y, ts) for y, ts in zip(measured, t)])
+
+def lag_ms(t, output, reference, max_ms=300):
+    """Delay (ms) that best aligns output with the reference signal"""
+    delays = np.arange(0, max_ms + 1, 2)
+    errors = [np.mean((output - np.interp(t - d / 1000, t, reference)) ** 2) for d in delays]
+    return float(delays[int(np.argmin(errors))])
+
+def jitter_px(output):
+    """RMS wobble: output minus its 5-frame centered moving average"""
+    smooth = np.convolve(output, np.ones(5) / 5, mode='same')
+    return float(np.sqrt(np.mean((output - smooth)[2:-2] ** 2)))
+
+FILTERS = [
+    ('none', lambda: ExponentialFilter(1.0)),
+    ('exp 0.5', lambda: ExponentialFilter(0.5)),
+    ('exp 0.2', lambda: ExponentialFilter(0.2)),
+    ('1euro 0.5/0.5', lambda: OneEuroFilter(0.5, 0.5)),
+    ('1euro 1.0/2.0', lambda: OneEuroFilter(1.0, 2.0)),
+    ('1euro 1.0/8.0', lambda: OneEuroFilter(1.0, 8.0)),
+    ('1euro 1.0/16.0', lambda: OneEuroFilter(1.0, 16.0)),
+    ('config', lambda: OneEuroFilter()),
+]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--data', nargs='*', help='landmark recordings (.npz)')
+    parser.add_argument('--noise', type=float, default=0.004,
+                        help='synthetic landmark noise (fraction of frame)')
+    args = parser.parse_args()
+
+    if args.data:
+        t, truth, measured = recorded_trace(args.data)
+    else:
+        t, truth, measured = synthetic_trace(noise=args.noise)
+
+    control = AltitudeControl()
+    reference = np.vectorize(control.to_altitude)(truth if truth is not None else measured)
+
+    print(f"{len(t)} samples over {t[-1] - t[0]:.1f} s, dead zone "
+          f"{ALTITUDE_DEAD_ZONE} px")
+    print(f"{'filter':16} {'lag ms':>7} {'jitter px':>10} {'error px':>9}")
+    for name, make_filter in FILTERS:
+        output = run_control(make_filter, t, measured)
+        error = (f"{np.sqrt(np.mean((output - reference) ** 2)):9.2f}"
+                 if truth is not None else f"{'-':>9}")
+        print(f"{name:16} {lag_ms(t, output, reference):7.0f} "
+              f"{jitter_px(output):10.2f} {error}")
+
+if __name__ == "__main__":
+    main()
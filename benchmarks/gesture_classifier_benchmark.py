@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Gesture classifier benchmark: per-frame latency and accuracy
+
+Compares the rule heuristics with the nearest-centroid classifier on
+labelled landmarks (a recording, or synthetic hands with random rotation
+and handedness by default). Latency includes feature extraction.
+
+Usage:
+    python benchmarks/gesture_classifier_benchmark.py [--data rec.npz]
+                                                      [--model model.npz]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from config import FLAP_GESTURES
+from gesture_classifier import CentroidClassifier, HeuristicClassifier
+from landmark_data import load_landmarks, synthetic_dataset
+
+BUDGET_US = 50.0
+
+def evaluate(classifier, landmarks, labels):
+    """Returns: (mean microseconds per frame, label accuracy, flap accuracy)"""
+    hands = [lm.tolist() for lm in landmarks]  # same input type as the detector
+    start = time.perf_counter()
+    predictions = [classifier.classify(hand) for hand in hands]
+    elapsed = time.perf_counter() - start
+
+    predictions = np.array(predictions)
+    flaps = np.isin(predictions, FLAP_GESTURES)
+    expected_flaps = np.isin(labels, FLAP_GESTURES)
+    return (
+        elapsed / len(hands) * 1e6,
+        float(np.mean(predictions == labels)),
+        float(np.mean(flaps == expected_flaps)),
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--data', nargs='*', help='labelled .npz recordings')
+    parser.add_argument('--model', help='trained model (default: train on '
+                        'synthetic hands, or on half the recording)')
+    parser.add_argument('--samples', type=int, default=5000)
+    args = parser.parse_args()
+
+    if args.data:
+        data = load_landmarks(*args.data)
+    else:
+        data = synthetic_dataset(args.samples, seed=1)
+
+    if args.model:
+        model = CentroidClassifier.load(args.model)
+        test = data
+    elif args.data:
+        half = len(data['labels']) // 2
+        model = CentroidClassifier().fit(data['landmarks'][:half], data['labels'][:half])
+        test = {k: v[half:] for k, v in data.items()}
+    else:
+        train = synthetic_dataset(args.samples, seed=0)
+        model = CentroidClassifier().fit(train['landmarks'], train['labels'])
+        test = data
+
+    source = ', '.join(args.data) if args.data else 'synthetic hands'
+    print(f"Gesture classifier benchmark ({len(test['labels'])} samples, {source})")
+    print(f"  {'classifier':<12} {'us/frame':>9} {'label acc':>10} {'flap acc':>9}")
+    for name, classifier in [('heuristic', HeuristicClassifier()), ('centroid', model)]:
+        us, label_acc, flap_acc = evaluate(classifier, test['landmarks'], test['labels'])
+        flag = '' if us < BUDGET_US else f'  (over {BUDGET_US:.0f} us budget)'
+        print(f"  {name:<12} {us:9.1f} {label_acc:10.1%} {flap_acc:9.1%}{flag}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Idle CPU benchmark for Hand Gesture Flappy Bird
+
+Holds the game in the menu, paused and game over states for a few seconds
+each, with idle scheduling on and off, and reports process CPU use per
+state plus any camera resume latencies that were measured.
+
+Usage: python benchmarks/idle_benchmark.py [--seconds S] [--headless]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+def hold_state(game, state, seconds):
+    """Step the game loop in one state for the given wall time"""
+    from game_engine import GameState
+
+    game.start_game()
+    if state == GameState.PAUSED:
+        game.game_state = GameState.PAUSED
+    elif state == GameState.GAME_OVER:
+        game.game_over()
+    else:
+        game.game_state = state
+
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        game.step()
+
+    # Resume into play once so a resume latency can be recorded
+    if state != GameState.GAME_OVER:
+        game.game_state = GameState.PLAYING
+        game.step()
+
+def measure(idle_scheduling, seconds):
+    """Returns: scheduler stats for one full pass over the idle states"""
+    from game_engine import HandGestureFlappyBird, GameState
+
+    game = HandGestureFlappyBird()
+    game.camera_startup.wait(timeout=30)
+    game.scheduler.enabled = idle_scheduling
+    for state in (GameState.MENU, GameState.PAUSED, GameState.GAME_OVER):
+        hold_state(game, state, seconds)
+    stats = game.scheduler.stats()
+    game.cleanup()
+    return stats
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--seconds', type=float, default=3.0,
+                        help='time spent in each state')
+    parser.add_argument('--headless', action='store_true',
+                        help='use the SDL dummy video driver')
+    args = parser.parse_args()
+
+    if args.headless:
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+    results = {
+        'idle scheduling on': measure(True, args.seconds),
+        'idle scheduling off': measure(False, args.seconds),
+    }
+
+    print(f"Idle benchmark ({args.seconds:.1f} s per state)")
+    for label, stats in results.items():
+        print(f"  {label}:")
+        for name in ('MENU', 'PAUSED', 'GAME_OVER'):
+            state = stats['states'].get(name)
+            if state:
+                print(f"    {name:<10} CPU {state['cpu_percent']:6.1f} %")
+        latencies = stats['resume_latency_ms']
+        if latencies:
+            print(f"    resume latency: {', '.join(f'{t:.1f}' for t in latencies)} ms")
+        else:
+            print("    resume latency: n/a (no camera)")
+
+if __name__ == "__main__":
+    main()
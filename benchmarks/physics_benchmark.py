@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Physics benchmark: fixed-point versus float simulation, rollback and replay
+
+For the float VersusSim and the fixed-point FixedVersusSim, reports:
+  - step: microseconds per simulated tick (both birds, piloted flaps)
+  - save / load / checksum: microseconds per snapshot operation
+  - rollback: microseconds to restore a snapshot NET_MAX_ROLLBACK ticks back
+    and re-simulate to the present (what RollbackSession does)
+  - replay: ticks per second re-running a recorded match, snapshotting
+    and checksumming every tick (desync hunting)
+  - snapshot bytes
+and how often float runs end differently from the exact fixed-point run.
+
+Usage:
+    python benchmarks/physics_benchmark.py [--ticks 20000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from config import NET_COURSE_SEED, NET_MAX_ROLLBACK, PIPE_GAP, PIPE_WIDTH, SCREEN_HEIGHT
+from netplay import VersusSim
+from fixed_physics import FixedVersusSim, snapshot_table
+
+def playing_inputs(ticks, seed=NET_COURSE_SEED):
+    """
+    Flaps from a simple pilot (flap when below the next gap and falling),
+    so both birds stay alive and every tick does the full collision work
+    """
+    rng = random.Random(seed)
+    sim = VersusSim(seed)
+    inputs = []
+    while len(inputs) < ticks:
+        flaps = []
+        for bird in sim.birds:
+            ahead = [(x, gap) for _, x, gap in sim.pipes()
+                     if x + PIPE_WIDTH >= bird.x - bird.radius]
+            target = ahead[0][1] + PIPE_GAP / 2 + rng.uniform(0, 40) if ahead else SCREEN_HEIGHT / 2
+            flaps.append(bird.y > target and bird.velocity > 0)
+        inputs.append(tuple(flaps))
+        sim.step(inputs[-1])
+        if sim.over:
+            break
+    return inputs, sim.scores
+
+def per_call_us(function, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        function()
+    return (time.perf_counter() - start) / count * 1e6
+
+def measure(name, make, inputs):
+    sim = make()
+    start = time.perf_counter()
+    for flaps in inputs:
+        sim.step(flaps)
+    step_us = (time.perf_counter() - start) / len(inputs) * 1e6
+
+    sim = make()
+    for flaps in inputs[:len(inputs) // 2]:
+        sim.step(flaps)
+    snapshot = sim.save()
+    save_us = per_call_us(sim.save, 20000)
+    load_us = per_call_us(lambda: sim.load(snapshot), 20000)
+    checksum_us = per_call_us(sim.checksum, 20000)
+
+    resim = inputs[len(inputs) // 2:len(inputs) // 2 + NET_MAX_ROLLBACK]
+
+    def rollback():
+        sim.load(snapshot)
+        for flaps in resim:
+            sim.save()
+            sim.step(flaps)
+    rollback_us = per_call_us(rollback, 2000)
+
+    sim = make()
+    start = time.perf_counter()
+    snapshots, checksums = [], []
+    for flaps in inputs:
+        snapshots.append(sim.save())
+        checksums.append(sim.checksum())
+        sim.step(flaps)
+    replay_tps = len(snapshots) / (time.perf_counter() - start)
+
+    print(f"{name:6} {step_us:8.2f} {save_us:7.2f} {load_us:7.2f} {checksum_us:9.2f} "
+          f"{rollback_us:11.1f} {replay_tps:10.0f} {len(snapshot):6d}")
+    return snapshots
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--ticks', type=int, default=20000,
+                        help='longest match (ends earlier if both birds crash)')
+    parser.add_argument('--matches', type=int, default=200,
+                        help='piloted matches compared between float and fixed')
+    args = parser.parse_args()
+
+    print(f"{'mode':6} {'step us':>8} {'save us':>7} {'load us':>7} {'checksum':>9} "
+          f"{'rollback us':>11} {'replay t/s':>10} {'bytes':>6}")
+    inputs, scores = playing_inputs(args.ticks)
+    print(f"{len(inputs)}-tick match on course {NET_COURSE_SEED}, scores {scores}")
+    measure('float', VersusSim, inputs)
+    snapshots = measure('fixed', FixedVersusSim, inputs)
+
+    # A whole replay's snapshots compare at once as one int32 table
+    table = snapshot_table(snapshots)
+    start = time.perf_counter()
+    changed = (table[1:] != table[:-1]).sum(axis=0)
+    print(f"diff of {len(table)} fixed snapshots at once: "
+          f"{(time.perf_counter() - start) * 1e3:.2f} ms ({changed[0]} tick changes)")
+
+    differ = 0
+    pipes = 0
+    for seed in range(args.matches):
+        inputs, _ = playing_inputs(3000, seed)
+        runs = [VersusSim(seed), FixedVersusSim(seed)]
+        for flaps in inputs:
+            for sim in runs:
+                sim.step(flaps)
+            if runs[0].over and runs[1].over:
+                break
+        if (runs[0].alive, runs[0].scores, runs[0].tick) != \
+           (runs[1].alive, runs[1].scores, runs[1].tick) or any(
+               abs(a.y - b.y) > 1e-6 or abs(a.velocity - b.velocity) > 1e-6
+               for a, b in zip(runs[0].birds, runs[1].birds)):
+            differ += 1
+        pipes += sum(runs[1].scores)
+    print(f"float state drifted from the exact fixed-point state in "
+          f"{differ} of {args.matches} matches "
+          f"({pipes / args.matches / 2:.1f} pipes passed per bird on average)")
+
+if __name__ == "__main__":
+    main()
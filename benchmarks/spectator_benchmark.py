@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Spectator stream benchmark: game-loop overhead for 0, 1 and 10 viewers
+
+Runs the real game loop headless at the game's frame rate with the MJPEG
+server attached, connects local clients that read the stream as fast as
+it comes, and reports per-frame game-thread work time, JPEG encodes and
+frames each client received.
+
+Usage:
+    python benchmarks/spectator_benchmark.py [--seconds 5] [--clients 0 1 10]
+"""
+
+import argparse
+import http.client
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from config import FPS, SPECTATOR_MAX_FPS
+from input_sources import ScriptedInput
+from spectator_stream import SpectatorServer
+from turbo import TurboRunner
+
+class StreamReader(threading.Thread):
+    """A viewer: reads JPEG parts from the stream until told to stop"""
+
+    def __init__(self, address):
+        super().__init__(daemon=True)
+        self.conn = http.client.HTTPConnection(*address[:2], timeout=5)
+        self.conn.request('GET', '/game.mjpg')
+        self.response = self.conn.getresponse()
+        self.frames = 0
+        self.stopped = False
+
+    def run(self):
+        fp = self.response.fp
+        try:
+            while not self.stopped:
+                line = fp.readline()
+                if not line:
+                    break
+                if line.lower().startswith(b'content-length:'):
+                    length = int(line.split(b':')[1])
+                    fp.readline()
+                    fp.read(length)
+                    self.frames += 1
+        except OSError:
+            pass
+
+    def close(self):
+        self.stopped = True
+        self.conn.close()
+
+def measure(clients, seconds):
+    """Returns: dict of frame work times (ms), encodes and client frame rates"""
+    script = [(tick, 'flap') for tick in range(0, int(seconds * FPS) + 1, 18)]
+    runner = TurboRunner(ScriptedInput(script))
+    game = runner.game
+    game.scheduler.uncapped = False  # run at FPS, like play
+
+    server = SpectatorServer(port=0, hand=False).start()
+    game.spectator = server
+    readers = [StreamReader(server.address) for _ in range(clients)]
+    for reader in readers:
+        reader.start()
+    while server.channels['game'].clients < clients:
+        time.sleep(0.01)
+
+    # Work time: from the start of step() until it starts waiting for the
+    # next frame
+    work = []
+    step_start = [0.0]
+    wait = game.scheduler.wait
+
+    def timed_wait():
+        work.append(time.perf_counter() - step_start[0])
+        wait()
+
+    game.scheduler.wait = timed_wait
+
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    tick = 0
+    while time.perf_counter() - start < seconds:
+        if game.game_state.name != 'PLAYING':
+            game.start_game()
+        runner.input_source.begin_tick(tick)
+        step_start[0] = time.perf_counter()
+        game.step()
+        tick += 1
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu_start
+
+    for reader in readers:
+        reader.close()
+    stats = server.stats()['game']
+    runner.close()
+
+    work_ms = np.array(work) * 1000
+    return {
+        'clients': clients,
+        'fps': tick / elapsed,
+        'work_mean_ms': float(work_ms.mean()),
+        'work_p99_ms': float(np.percentile(work_ms, 99)),
+        'cpu_percent': cpu / elapsed * 100,
+        'encodes_per_second': stats['encoded'] / elapsed,
+        'client_fps': (np.mean([r.frames for r in readers]) / elapsed) if readers else 0.0,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--seconds', type=float, default=5.0)
+    parser.add_argument('--clients', type=int, nargs='+', default=[0, 1, 10])
+    args = parser.parse_args()
+
+    print(f"Game at {FPS} FPS, stream capped at {SPECTATOR_MAX_FPS} FPS")
+    print(f"{'clients':>7} {'fps':>6} {'work ms':>8} {'p99 ms':>7} {'cpu %':>6} "
+          f"{'encodes/s':>9} {'client fps':>10}")
+    for clients in args.clients:
+        r = measure(clients, args.seconds)
+        print(f"{r['clients']:7d} {r['fps']:6.1f} {r['work_mean_ms']:8.2f} "
+              f"{r['work_p99_ms']:7.2f} {r['cpu_percent']:6.1f} "
+              f"{r['encodes_per_second']:9.1f} {r['client_fps']:10.1f}")
+
+if __name__ == "__main__":
+    main()
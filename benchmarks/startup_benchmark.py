@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Startup time benchmark for Hand Gesture Flappy Bird
+
+Launches the game in fresh interpreters (cold boot each run) and reports:
+  - import time of game_engine
+  - time to first rendered frame (menu visible)
+  - time until the background camera/hand detector setup finished
+
+Usage: python benchmarks/startup_benchmark.py [--runs N] [--headless]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+PROBE = r"""
+import json, os, sys, time
+t0 = time.perf_counter()
+sys.path.insert(0, os.path.join({root!r}, 'src'))
+import game_engine
+t_import = time.perf_counter()
+game = game_engine.HandGestureFlappyBird()
+game.draw()
+t_first_frame = time.perf_counter()
+game.camera_startup.wait(timeout={timeout})
+t_camera = time.perf_counter()
+game.poll_camera_setup()
+print(json.dumps({{
+    'import_s': t_import - t0,
+    'first_frame_s': t_first_frame - t0,
+    'camera_setup_s': t_camera - t0,
+    'camera_available': game.camera_available,
+}}))
+game.cleanup()
+"""
+
+def run_once(timeout, headless):
+    """Run one cold start in a subprocess and return its timings"""
+    env = dict(os.environ)
+    if headless:
+        env['SDL_VIDEODRIVER'] = 'dummy'
+    env['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+    result = subprocess.run(
+        [sys.executable, '-c', PROBE.format(root=ROOT, timeout=timeout)],
+        env=env, capture_output=True, text=True, check=True
+    )
+    # The game prints status lines; the JSON result is the first line that parses
+    for line in result.stdout.splitlines():
+        if line.startswith('{'):
+            return json.loads(line)
+    raise RuntimeError(f"No timing output from probe:\n{result.stdout}{result.stderr}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--timeout', type=float, default=30.0,
+                        help='seconds to wait for camera setup per run')
+    parser.add_argument('--headless', action='store_true',
+                        help='use the SDL dummy video driver')
+    parser.add_argument('--json', action='store_true', help='print raw JSON')
+    args = parser.parse_args()
+
+    runs = [run_once(args.timeout, args.headless) for _ in range(args.runs)]
+
+    if args.json:
+        print(json.dumps(runs, indent=2))
+        return
+
+    print(f"Startup benchmark ({args.runs} cold runs, median / max)")
+    for key, label in [('import_s', 'Import game_engine'),
+                       ('first_frame_s', 'First frame'),
+                       ('camera_setup_s', 'Camera + detector ready')]:
+        values = [r[key] for r in runs]
+        print(f"  {label:<24} {statistics.median(values) * 1000:8.1f} ms"
+              f" / {max(values) * 1000:8.1f} ms")
+    print(f"  Camera available: {runs[-1]['camera_available']}")
+
+if __name__ == "__main__":
+    main()
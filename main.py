@@ -9,27 +9,219 @@ Requirements: Python 3.9+, OpenCV, MediaPipe, Pygame
 
 import sys
 import os
+import argparse
+import tempfile
+import time
 
 # Add src directory to Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
+from config import (
+    RUNTIME, CONTROL_MODE, NET_PORT, RECORDING_PREROLL, SPECTATOR_PORT,
+    AUTOPILOT_RESTART_DELAY
+)
 from game_engine import HandGestureFlappyBird
 
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Hand Gesture Flappy Bird")
+    parser.add_argument(
+        '--runtime', choices=['loop', 'async'], default=RUNTIME,
+        help="'loop' runs the classic serial game loop, 'async' runs capture, "
+             "inference, simulation and rendering as separate asyncio tasks"
+    )
+    parser.add_argument(
+        '--control', choices=['flap', 'altitude'], default=CONTROL_MODE,
+        help="'flap' flaps on gestures, 'altitude' makes the bird follow "
+             "the height of your hand"
+    )
+    parser.add_argument(
+        '--profile', action='store_true',
+        help="sample where frame time goes and dump slow frames to disk"
+    )
+    parser.add_argument(
+        '--turbo', type=int, metavar='TICKS',
+        help="run TICKS loop iterations headless and uncapped, then report"
+    )
+    parser.add_argument(
+        '--script', help="JSON input script ([tick, action] pairs) for --turbo"
+    )
+    parser.add_argument(
+        '--no-render', action='store_true',
+        help="with --turbo, only render the final frame"
+    )
+    parser.add_argument(
+        '--autopilot', metavar='POLICY',
+        help="let a trained policy (tools/train_autopilot.py) play, in the "
+             "window or with --turbo"
+    )
+    parser.add_argument(
+        '--relay', type=int, metavar='PORT', nargs='?', const=NET_PORT,
+        help="run the versus relay server that links two cabinets (PORT 0 "
+             "picks a free port)"
+    )
+    parser.add_argument(
+        '--versus', metavar='HOST[:PORT]',
+        help="race another cabinet through the relay at HOST"
+    )
+    parser.add_argument(
+        '--player', type=int, choices=[0, 1], default=0,
+        help="with --versus, this cabinet's player number"
+    )
+    parser.add_argument(
+        '--record', metavar='FILE',
+        help="record the game view to a video file (.avi) in the background"
+    )
+    parser.add_argument(
+        '--highlights', action='store_true',
+        help="keep the last seconds of play in memory and save them as a "
+             "clip after every new high score"
+    )
+    parser.add_argument(
+        '--spectate', type=int, metavar='PORT', nargs='?', const=SPECTATOR_PORT,
+        help="serve the game view and hand tracking as an MJPEG stream on "
+             "http://localhost:PORT/ (PORT 0 picks a free port)"
+    )
+    args = parser.parse_args()
+    if args.autopilot and args.highlights:
+        parser.error("--highlights can't be used with --autopilot")
+    return args
+
+def start_profiler(game):
+    """Attach a sampling profiler with slow-frame dumps to the game"""
+    from profiler import Profiler
+
+    game.profiler = Profiler().start()
+    print(f"Profiling: slow frames (> {game.profiler.slow_frame_ms:.1f} ms) "
+          f"are dumped to {game.profiler.directory}")
+    return game.profiler
+
+def finish_profiler(profiler):
+    """Stop profiling, print the report and save it next to the dumps"""
+    profiler.stop()
+    print(profiler.report())
+    print(f"Profile saved to {profiler.save_report()}")
+
+def run_turbo(args):
+    """Run a headless turbo session and print its report"""
+    from input_sources import ScriptedInput
+    from turbo import TurboRunner
+
+    if args.autopilot:
+        from autopilot import AutopilotInput
+        source = AutopilotInput.load(args.autopilot)
+    else:
+        source = ScriptedInput.load(args.script) if args.script else ScriptedInput()
+    runner = TurboRunner(source, render=not args.no_render)
+    profiler = start_profiler(runner.game) if args.profile else None
+    try:
+        report = runner.run(args.turbo)
+    finally:
+        runner.close()
+        if profiler:
+            finish_profiler(profiler)
+
+    print(f"Ticks: {report['ticks']} in {report['seconds']:.3f} s "
+          f"({report['ticks_per_second']:.0f} ticks/s)")
+    print(f"Final state: {report['state']}  score: {report['score']}")
+    print(f"Frame checksum: {report['checksum']:08x}")
+
+def run_relay(port):
+    """Run the versus relay server until interrupted"""
+    from netplay import RelayServer
+
+    relay = RelayServer(port, host='0.0.0.0').start()
+    print(f"Versus relay listening on UDP port {relay.address[1]} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        relay.stop()
+
+def run_versus_match(args):
+    """Play a rollback versus match against another cabinet"""
+    from netplay import UdpTransport, RollbackSession, run_versus
+    from fixed_physics import make_versus_sim
+
+    host, _, port = args.versus.partition(':')
+    transport = UdpTransport((host, int(port or NET_PORT)), bind_address=('0.0.0.0', 0))
+    session = RollbackSession(make_versus_sim(), args.player, transport)
+    game = HandGestureFlappyBird(control_mode='flap')
+    try:
+        metrics = run_versus(game, session)
+    finally:
+        transport.close()
+        game.cleanup()
+
+    print(f"Rollbacks: {metrics['rollbacks']} (mean depth "
+          f"{metrics['mean_rollback_depth']:.1f}, max {metrics['max_rollback_depth']})")
+    print(f"Re-simulation: {metrics['resim_us_per_tick']:.1f} us per tick, "
+          f"stalls: {metrics['stalls']}")
+    print(f"Network: {metrics['bytes_sent_per_second']:.0f} B/s sent, "
+          f"{metrics['bytes_received_per_second']:.0f} B/s received")
+
 def main():
     """Main function to start the game"""
+    args = parse_args()
+    if args.turbo:
+        run_turbo(args)
+        return
+    if args.relay is not None:
+        run_relay(args.relay)
+        return
+    if args.versus:
+        run_versus_match(args)
+        return
+
+    scores_dir = None
     try:
         print("Starting Hand Gesture Flappy Bird...")
         print("Make sure your camera is connected and working!")
         print("Controls:")
-        print("  - Raise 2+ fingers to make the bird flap")
+        if args.control == 'altitude':
+            print("  - Move your hand up and down to steer the bird")
+        else:
+            print("  - Raise 2+ fingers to make the bird flap")
         print("  - Keep hand in view of camera")
         print("  - Press Q in camera window to quit")
         print("  - Press SPACE to start game")
         print("  - Press R to restart after game over")
         print("-" * 50)
 
-        game = HandGestureFlappyBird()
-        game.run()
+        score_store = None
+        if args.autopilot:
+            # Attract mode: the autopilot's games stay off the player leaderboard
+            from score_store import ScoreStore
+            scores_dir = tempfile.TemporaryDirectory(prefix='flappy-autopilot-')
+            score_store = ScoreStore(os.path.join(scores_dir.name, 'scores.db'))
+        game = HandGestureFlappyBird(
+            use_camera=not args.autopilot, score_store=score_store,
+            control_mode=args.control
+        )
+        if args.autopilot:
+            from autopilot import AutopilotInput
+            game.input_source = AutopilotInput.load(
+                args.autopilot, restart_delay=AUTOPILOT_RESTART_DELAY
+            )
+        if args.record or args.highlights:
+            from video_recorder import VideoRecorder
+            game.recorder = VideoRecorder(
+                args.record, preroll=RECORDING_PREROLL if args.highlights else 0
+            )
+        if args.spectate is not None:
+            from spectator_stream import SpectatorServer
+            game.spectator = SpectatorServer(args.spectate, hand=not args.autopilot).start()
+            print(f"Spectator stream: {game.spectator.url}")
+        profiler = start_profiler(game) if args.profile else None
+        try:
+            if args.runtime == 'async':
+                from async_runtime import AsyncGameRunner
+                AsyncGameRunner(game).run()
+            else:
+                game.run()
+        finally:
+            if profiler:
+                finish_profiler(profiler)
 
     except KeyboardInterrupt:
         print("\nGame interrupted by user.")
@@ -38,6 +230,8 @@ def main():
         print("Make sure you have installed all requirements:")
         print("pip install -r requirements.txt")
     finally:
+        if scores_dir is not None:
+            scores_dir.cleanup()
         print("Thanks for playing!")
 
 if __name__ == "__main__":
@@ -6,16 +6,16 @@ Alternative to main.py with additional checks
 
 import sys
 import os
+import argparse
+import importlib.util
 
 def check_dependencies():
-    """Check if all required packages are installed"""
+    """Check if all required packages are installed (without importing them)"""
     required_packages = ['pygame', 'cv2', 'mediapipe', 'numpy']
     missing_packages = []
 
     for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
+        if importlib.util.find_spec(package) is None:
             missing_packages.append(package)
 
     if missing_packages:
@@ -28,25 +28,12 @@ def check_dependencies():
     print("✅ All dependencies found!")
     return True
 
-def check_camera():
-    """Check if camera is available"""
-    try:
-        import cv2
-        cap = cv2.VideoCapture(0)
-        ret, frame = cap.read()
-        cap.release()
-
-        if ret:
-            print("✅ Camera detected and working!")
-            return True
-        else:
-            print("⚠️  Camera detected but not working properly")
-            return False
-    except:
-        print("⚠️  Camera not available - keyboard controls will be used")
-        return False
-
 def main():
+    parser = argparse.ArgumentParser(description="Hand Gesture Flappy Bird - Quick Run")
+    parser.add_argument('--profile', action='store_true',
+                        help="sample where frame time goes and dump slow frames")
+    args = parser.parse_args()
+
     print("🖐️ Hand Gesture Flappy Bird - Quick Run")
     print("=" * 40)
 
@@ -54,15 +41,11 @@ def main():
     if not check_dependencies():
         sys.exit(1)
 
-    # Check camera
-    camera_ok = check_camera()
-
+    # The camera is opened once, in the background, by the game itself
     print()
-    if camera_ok:
-        print("🎮 Starting game with hand gesture control...")
-    else:
-        print("🎮 Starting game with keyboard control...")
-        print("   Use SPACE to flap the bird!")
+    print("🎮 Starting game...")
+    print("   Hand gesture control turns on as soon as the camera is ready")
+    print("   Use SPACE to flap the bird any time!")
 
     print("   Press Q to quit")
     print("=" * 40)
@@ -73,7 +56,17 @@ def main():
     try:
         from game_engine import HandGestureFlappyBird
         game = HandGestureFlappyBird()
-        game.run()
+        if args.profile:
+            from profiler import Profiler
+            game.profiler = Profiler().start()
+            print(f"📈 Profiling - slow frames go to {game.profiler.directory}")
+        try:
+            game.run()
+        finally:
+            if game.profiler:
+                game.profiler.stop()
+                print(game.profiler.report())
+                print(f"📈 Profile saved to {game.profiler.save_report()}")
     except KeyboardInterrupt:
         print("\n👋 Game interrupted by user")
     except Exception as e:
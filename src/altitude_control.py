@@ -0,0 +1,115 @@
+"""
+Altitude Control Module
+Continuous control: the hand's height sets a target altitude for the bird,
+smoothed by a One-Euro filter so the bird follows the hand without jitter
+"""
+
+import math
+from config import *
+
+class OneEuroFilter:
+    """
+    One-Euro filter (Casiez, Roussel and Vogel, CHI 2012)
+
+    A low-pass filter whose cutoff rises with the signal's speed: heavy
+    smoothing while the hand is still (no jitter), little smoothing while
+    it moves (little lag).
+    """
+
+    def __init__(self, min_cutoff=ALTITUDE_MIN_CUTOFF, beta=ALTITUDE_BETA,
+                 d_cutoff=1.0):
+        """
+        Args:
+            min_cutoff: cutoff frequency (Hz) at zero speed
+            beta: cutoff increase per unit of speed
+            d_cutoff: cutoff frequency (Hz) for the speed estimate
+        """
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+
+    def reset(self):
+        self.value = None
+        self.speed = 0.0
+        self.last_time = None
+
+    @staticmethod
+    def alpha(cutoff, dt):
+        """Smoothing factor of a first-order low-pass at cutoff Hz"""
+        tau = 1.0 / (2 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def __call__(self, x, t):
+        """Filter sample x taken at time t (seconds); returns the estimate"""
+        if self.value is None:
+            self.value = x
+            self.last_time = t
+            return x
+
+        dt = t - self.last_time
+        if dt <= 0:
+            return self.value
+        self.last_time = t
+
+        speed = (x - self.value) / dt
+        a_d = self.alpha(self.d_cutoff, dt)
+        self.speed = a_d * speed + (1 - a_d) * self.speed
+
+        cutoff = self.min_cutoff + self.beta * abs(self.speed)
+        a = self.alpha(cutoff, dt)
+        self.value = a * x + (1 - a) * self.value
+        return self.value
+
+class AltitudeControl:
+    def __init__(self, min_cutoff=ALTITUDE_MIN_CUTOFF, beta=ALTITUDE_BETA,
+                 dead_zone=ALTITUDE_DEAD_ZONE, hand_range=ALTITUDE_HAND_RANGE,
+                 hold_time=ALTITUDE_HOLD_TIME):
+        """
+        Turn hand heights into a target altitude for Bird.update
+
+        Args:
+            dead_zone: target changes smaller than this (pixels) are ignored
+            hand_range: (top, bottom) hand heights, as fractions of the
+                camera frame, mapped to the top and bottom of the screen
+            hold_time: seconds the last target is kept when the hand is lost
+        """
+        self.filter = OneEuroFilter(min_cutoff, beta)
+        self.dead_zone = dead_zone
+        self.hand_range = hand_range
+        self.hold_time = hold_time
+        self.target = None
+        self.last_seen = None
+
+    def reset(self):
+        self.filter.reset()
+        self.target = None
+        self.last_seen = None
+
+    def to_altitude(self, hand_y):
+        """Map a hand height (fraction of frame) to a screen y"""
+        top, bottom = self.hand_range
+        fraction = min(1.0, max(0.0, (hand_y - top) / (bottom - top)))
+        return BIRD_RADIUS + fraction * (SCREEN_HEIGHT - 2 * BIRD_RADIUS)
+
+    def update(self, hand_y, t):
+        """
+        Feed one detection result
+
+        Args:
+            hand_y: hand height as a fraction of the frame, or None if no
+                hand was found
+            t: detection time in seconds
+
+        Returns: target altitude in pixels, or None (no hand: normal flapping)
+        """
+        if hand_y is None:
+            if self.last_seen is not None and t - self.last_seen > self.hold_time:
+                self.reset()
+            return self.target
+
+        self.last_seen = t
+        altitude = self.to_altitude(self.filter(hand_y, t))
+        if self.target is None or abs(altitude - self.target) >= self.dead_zone:
+            self.target = altitude
+        return self.target
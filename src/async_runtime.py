@@ -0,0 +1,332 @@
+"""
+Async Runtime Module
+Runs capture, inference, simulation, rendering and telemetry as separate
+asyncio tasks linked by bounded queues, so a slow stage never stalls the
+others. HandGestureFlappyBird.run() remains the default serial loop.
+"""
+
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from config import *
+from game_engine import GameState
+
+class DropQueue:
+    """Bounded asyncio queue that drops items instead of blocking when full"""
+
+    def __init__(self, maxsize, policy='drop_oldest', on_drop=None):
+        """
+        Args:
+            maxsize: capacity of the queue
+            policy: 'drop_oldest' evicts the oldest item to make room (for
+                frames, where only the freshest matters); 'drop_newest'
+                discards the incoming item
+            on_drop: optional callback for each dropped item (e.g. to
+                release a shared frame)
+        """
+        if policy not in ('drop_oldest', 'drop_newest'):
+            raise ValueError(f"Unknown queue policy: {policy}")
+        self.policy = policy
+        self.on_drop = on_drop
+        self.queue = asyncio.Queue(maxsize)
+        self.dropped = 0
+
+    def put(self, item):
+        """Add an item without ever blocking the producer"""
+        if self.queue.full():
+            self.dropped += 1
+            if self.policy == 'drop_newest':
+                dropped = item
+            else:
+                dropped = self.queue.get_nowait()
+                self.queue.put_nowait(item)
+            if self.on_drop:
+                self.on_drop(dropped)
+            return
+        self.queue.put_nowait(item)
+
+    async def get(self):
+        """Wait for the next item"""
+        return await self.queue.get()
+
+    def drain(self):
+        """Remove and return everything currently queued"""
+        items = []
+        while not self.queue.empty():
+            items.append(self.queue.get_nowait())
+        return items
+
+class AsyncGameRunner:
+    def __init__(self, game, fps=FPS, max_ticks=None):
+        """
+        Args:
+            game: HandGestureFlappyBird instance to drive
+            fps: simulation tick rate
+            max_ticks: stop after this many ticks (None = until quit)
+        """
+        self.game = game
+        self.fps = fps
+        self.max_ticks = max_ticks
+        self.running = False
+
+        self.frames = DropQueue(
+            ASYNC_FRAME_QUEUE_SIZE, 'drop_oldest', on_drop=lambda frame: frame.release()
+        )
+        self.gestures = DropQueue(ASYNC_GESTURE_QUEUE_SIZE, 'drop_oldest')
+        self.renders = DropQueue(1, 'drop_oldest')
+
+        # One thread each, so a camera read and an inference can overlap but
+        # the capture and the detector are each only used by one thread
+        self.capture_pool = ThreadPoolExecutor(1, thread_name_prefix='capture')
+        self.inference_pool = ThreadPoolExecutor(1, thread_name_prefix='inference')
+
+        self.latest_gesture = None
+        self.pending_tier = None
+        self.counters = {'ticks': 0, 'frames': 0, 'inferences': 0, 'renders': 0}
+        self.telemetry = deque(maxlen=300)
+
+        if game.quality_governor is not None:
+            game.quality_governor.on_change = self.queue_tier
+
+    def queue_tier(self, tier):
+        """Governor callback: apply preview now, camera/model from their threads"""
+        self.game.apply_preview_tier(tier)
+        self.pending_tier = tier
+
+    def run(self):
+        """Run until the player quits (or max_ticks), then clean up"""
+        try:
+            asyncio.run(self.main())
+        finally:
+            self.capture_pool.shutdown(wait=True)
+            self.inference_pool.shutdown(wait=True)
+            self.game.cleanup()
+
+    async def main(self):
+        """Start all stages and stop them when the tick task finishes"""
+        self.running = True
+        tasks = [
+            asyncio.create_task(self.capture_loop()),
+            asyncio.create_task(self.inference_loop()),
+            asyncio.create_task(self.render_loop()),
+            asyncio.create_task(self.telemetry_loop()),
+        ]
+        try:
+            await self.tick_loop()
+        finally:
+            self.running = False
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def capture_loop(self):
+        """Read camera frames on the capture thread into the frame queue"""
+        loop = asyncio.get_running_loop()
+        game = self.game
+        needs_flush = False
+        applied_tier = None
+        frame_counter = 0
+
+        while self.running:
+            if not game.camera_available or game.game_state not in (
+                    GameState.PLAYING, GameState.MENU):
+                needs_flush = True
+                await asyncio.sleep(IDLE_WAKE_INTERVAL / 1000)
+                continue
+
+            if self.pending_tier is not applied_tier:
+                applied_tier = self.pending_tier
+                await loop.run_in_executor(
+                    self.capture_pool, game.set_camera_size, applied_tier['camera_size']
+                )
+
+            if needs_flush:
+                needs_flush = False
+                await loop.run_in_executor(self.capture_pool, game.flush_camera_buffer)
+
+            # Reduced detection rate: grab without decoding on skipped frames
+            frame_counter += 1
+            if frame_counter % game.detect_every:
+                await loop.run_in_executor(self.capture_pool, game.cap.grab)
+                continue
+
+            frame = await loop.run_in_executor(self.capture_pool, game.read_camera_frame)
+            if frame is None:
+                game.telemetry.emit('dropped_frame', reason='read_failed')
+                await asyncio.sleep(0.01)
+                continue
+
+            self.counters['frames'] += 1
+            self.frames.put(frame)
+
+            # The menu only needs a low-rate wake gesture check
+            if game.game_state == GameState.MENU:
+                await asyncio.sleep(1.0 / MENU_CAMERA_POLL_FPS)
+
+    async def inference_loop(self):
+        """Run hand detection on the inference thread for each fresh frame"""
+        loop = asyncio.get_running_loop()
+        game = self.game
+        applied_tier = None
+
+        while self.running:
+            frame = await self.frames.get()
+
+            if self.pending_tier is not applied_tier and game.hand_detector:
+                applied_tier = self.pending_tier
+                await loop.run_in_executor(
+                    self.inference_pool,
+                    game.hand_detector.set_model_complexity,
+                    applied_tier['model_complexity']
+                )
+
+            with frame:
+                gesture_data = await loop.run_in_executor(
+                    self.inference_pool, game.detect_gestures, frame.array
+                )
+                if game.spectator:
+                    game.spectator.offer_hand(gesture_data['frame'])
+            self.counters['inferences'] += 1
+            self.gestures.put(gesture_data)
+
+    async def tick_loop(self):
+        """Fixed-rate simulation: events, gestures, game update"""
+        game = self.game
+        next_tick = time.perf_counter()
+
+        while self.running:
+            tick_start = time.perf_counter()
+            profiler = game.profiler
+            if profiler:
+                profiler.begin_frame()
+
+            if not game.handle_events():
+                return
+            game.poll_camera_setup()
+            game.scheduler.begin_frame(game.game_state)
+            if profiler:
+                profiler.mark('events')
+
+            # Ask the replacement input source (autopilot, script), as the
+            # serial loop does, then apply every detection result that
+            # arrived since the last tick
+            should_flap_gesture = False
+            if (game.input_source is not None
+                    and game.game_state in (GameState.PLAYING, GameState.MENU)):
+                should_flap_gesture = game.poll_input_source()
+            elif game.game_state == GameState.GAME_OVER:
+                game.poll_attract_restart()
+            for gesture_data in self.gestures.drain():
+                self.latest_gesture = gesture_data
+                game.scheduler.frame_processed()
+                game.track_hand_altitude(gesture_data)
+                if game.apply_flap_cooldown(gesture_data):
+                    should_flap_gesture = True
+
+            if should_flap_gesture and game.game_state == GameState.MENU:
+                game.start_game()
+            if profiler:
+                profiler.mark('camera')
+
+            if game.game_state == GameState.PLAYING:
+                game.update_game_playing(should_flap_gesture)
+            if profiler:
+                profiler.mark('update')
+
+            # Static screens are only redrawn when something on them changed
+            if game.scheduler.should_redraw((game.game_state, game.camera_status())):
+                self.renders.put(game.game_state)
+            else:
+                self.poll_preview_keys()
+            self.counters['ticks'] += 1
+
+            if game.game_state == GameState.PLAYING:
+                tick_time = time.perf_counter() - tick_start
+                if game.quality_governor and game.camera_available:
+                    game.quality_governor.record(tick_time, game.last_inference_time)
+                game.telemetry.emit(
+                    'frame',
+                    frame_ms=round(tick_time * 1000, 3),
+                    inference_ms=round(game.last_inference_time * 1000, 3)
+                )
+            game.emit_snapshots()
+            if profiler:
+                profiler.mark('bookkeeping')
+                game.end_profiled_frame()
+
+            if self.max_ticks is not None and self.counters['ticks'] >= self.max_ticks:
+                return
+
+            # Sleep until the next tick (idle screens tick at ASYNC_IDLE_FPS);
+            # if we fell far behind, don't try to catch up with a burst of ticks
+            interval = 1.0 / (self.fps if game.scheduler.active
+                              else min(self.fps, ASYNC_IDLE_FPS))
+            next_tick += interval
+            delay = next_tick - time.perf_counter()
+            if delay < -interval:
+                next_tick = time.perf_counter()
+                delay = 0
+            await asyncio.sleep(max(0.0, delay))
+
+    async def render_loop(self):
+        """
+        Draw the latest game state and camera preview
+
+        The profiler times each render as a frame of its own (stages draw
+        and preview), separate from the tick frames.
+        """
+        game = self.game
+
+        while self.running:
+            await self.renders.get()
+            profiler = game.profiler
+            if profiler:
+                profiler.begin_frame()
+            game.draw()
+            self.counters['renders'] += 1
+            if profiler:
+                profiler.mark('draw')
+
+            if game.camera_available:
+                if game.show_preview and self.latest_gesture is not None:
+                    game.show_camera_preview(self.latest_gesture)
+                    self.latest_gesture = None
+                self.poll_preview_keys()
+            if profiler:
+                profiler.mark('preview')
+                game.end_profiled_frame()
+
+    def poll_preview_keys(self):
+        """Pump the camera window and turn its Q key into a quit event"""
+        if not self.game.camera_available:
+            return
+        import cv2
+        if cv2.waitKey(1) & 0xFF == ord('q'):
+            # Stop through the normal event path in the tick task
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+    async def telemetry_loop(self):
+        """Sample stage rates and queue drops at a fixed interval"""
+        last = dict(self.counters)
+        last_time = time.perf_counter()
+
+        while self.running:
+            await asyncio.sleep(ASYNC_TELEMETRY_INTERVAL)
+            now = time.perf_counter()
+            elapsed = now - last_time
+            sample = {
+                f'{name}_per_s': (count - last[name]) / elapsed
+                for name, count in self.counters.items()
+            }
+            sample['frames_dropped'] = self.frames.dropped
+            sample['gestures_dropped'] = self.gestures.dropped
+            sample['inference_ms'] = self.game.last_inference_time * 1000
+            self.telemetry.append(sample)
+            self.game.telemetry.emit('runtime', **{
+                key: round(value, 3) for key, value in sample.items()
+            })
+            last, last_time = dict(self.counters), now
@@ -0,0 +1,293 @@
+"""
+Autopilot Module
+A small NumPy policy network that plays the real game rules (Bird.update,
+PipeManager, collisions), trained by neuroevolution across a process pool
+"""
+
+import json
+import multiprocessing
+import os
+import random
+import time
+
+import numpy as np
+from config import *
+from game_objects import Bird, PipeManager
+
+FEATURES = 4
+
+def observe(bird, pipes):
+    """
+    Policy inputs: bird height and velocity, and where the next pipe's gap
+    is relative to the bird
+
+    Returns: np.ndarray of FEATURES values, each roughly in [-1, 1]
+    """
+    next_pipe = None
+    for pipe in pipes:
+        if pipe.x + pipe.width >= bird.x - bird.radius:
+            next_pipe = pipe
+            break
+
+    if next_pipe is None:
+        gap_offset, distance = 0.0, 1.0
+    else:
+        gap_center = (next_pipe.gap_start + next_pipe.gap_end) / 2
+        gap_offset = (gap_center - bird.y) / SCREEN_HEIGHT
+        distance = (next_pipe.x + next_pipe.width - bird.x) / SCREEN_WIDTH
+
+    return np.array([
+        bird.y / SCREEN_HEIGHT * 2 - 1,
+        bird.velocity / abs(JUMP_STRENGTH),
+        gap_offset * 2,
+        distance,
+    ])
+
+class PolicyNetwork:
+    def __init__(self, hidden=AUTOPILOT_HIDDEN, vector=None):
+        """
+        One hidden tanh layer; flap when the output is positive
+
+        Args:
+            hidden: hidden units
+            vector: flat parameter vector (size() values); random if None
+        """
+        self.hidden = hidden
+        if vector is None:
+            vector = np.random.default_rng().normal(0, 0.5, self.size(hidden))
+        self.set_vector(vector)
+
+    @staticmethod
+    def size(hidden=AUTOPILOT_HIDDEN):
+        """Number of parameters for a network with `hidden` units"""
+        return FEATURES * hidden + hidden + hidden + 1
+
+    def set_vector(self, vector):
+        vector = np.asarray(vector, dtype=np.float64)
+        h = self.hidden
+        self.w1 = vector[:FEATURES * h].reshape(FEATURES, h)
+        self.b1 = vector[FEATURES * h:FEATURES * h + h]
+        self.w2 = vector[FEATURES * h + h:FEATURES * h + 2 * h]
+        self.b2 = vector[-1]
+        self.vector = vector
+
+    def act(self, features):
+        """Returns: bool - True to flap"""
+        return float(np.tanh(features @ self.w1 + self.b1) @ self.w2 + self.b2) > 0
+
+    def save(self, path):
+        np.savez(path, vector=self.vector, hidden=self.hidden)
+
+    @classmethod
+    def load(cls, path):
+        data = np.load(path)
+        return cls(int(data['hidden']), data['vector'])
+
+class HeadlessGame:
+    """
+    The game rules without a window: the same Bird, PipeManager and
+    collision checks the live game uses, in the same order per tick
+
+    Seeds the global random module (which places the pipes) the way
+    TurboRunner does, so a seed gives the same course in both.
+    """
+
+    def __init__(self, seed=0):
+        random.seed(seed)
+        self.bird = Bird()
+        self.pipes = PipeManager()
+
+    def play(self, policy, max_ticks=AUTOPILOT_MAX_TICKS):
+        """
+        Play one game from the start (which, like the live game, begins
+        with a flap)
+
+        Returns: (score, ticks survived)
+        """
+        bird, pipes = self.bird, self.pipes
+        bird.reset()
+        pipes.reset()
+        pipes.spawn(SCREEN_WIDTH + 200)
+
+        score = 0
+        flap = True
+        for tick in range(1, max_ticks + 1):
+            bird.update(flap)
+            score += pipes.update(bird.x)
+            if pipes.collision(bird):
+                return score, tick
+            flap = policy.act(observe(bird, pipes))
+        return score, max_ticks
+
+def fitness(score, ticks):
+    """Pipes passed dominate; survival time breaks ties"""
+    return score * PIPE_SPAWN_DELAY * 2 + ticks
+
+def evaluate_policy(task):
+    """
+    Process-pool worker: average fitness of one policy over several courses
+
+    Args:
+        task: (parameter vector, hidden units, course seeds, max ticks)
+    """
+    vector, hidden, seeds, max_ticks = task
+    policy = PolicyNetwork(hidden, vector)
+    total = 0.0
+    for seed in seeds:
+        total += fitness(*HeadlessGame(seed).play(policy, max_ticks))
+    return total / len(seeds)
+
+class Trainer:
+    def __init__(self, population=64, hidden=AUTOPILOT_HIDDEN, elite=8, sigma=0.2,
+                 games=AUTOPILOT_GAMES, max_ticks=AUTOPILOT_MAX_TICKS, seed=0):
+        """
+        Evolve policy networks: keep the elite, refill the population with
+        mutated copies of it; every generation plays fresh courses
+
+        Args:
+            population: policies per generation
+            elite: best policies kept unchanged
+            sigma: std of the Gaussian mutation
+            games: courses each policy plays per generation
+        """
+        self.hidden = hidden
+        self.elite = elite
+        self.sigma = sigma
+        self.games = games
+        self.max_ticks = max_ticks
+        self.rng = np.random.default_rng(seed)
+        self.population = self.rng.normal(0, 0.5, (population, PolicyNetwork.size(hidden)))
+        self.generation = 0
+        self.best = self.population[0].copy()
+        self.best_fitness = -np.inf
+        self.history = []
+
+    def course_seeds(self):
+        return [self.generation * self.games + i for i in range(self.games)]
+
+    def evaluate(self, pool):
+        """Returns: np.ndarray - fitness of every policy in the population"""
+        seeds = self.course_seeds()
+        tasks = [(vector, self.hidden, seeds, self.max_ticks) for vector in self.population]
+        return np.array(pool.map(evaluate_policy, tasks, chunksize=4))
+
+    def step(self, pool, workers):
+        """
+        Evaluate and breed one generation
+
+        Returns: dict of generation stats, including games evaluated per
+            second per core
+        """
+        start = time.perf_counter()
+        scores = self.evaluate(pool)
+        elapsed = time.perf_counter() - start
+
+        order = np.argsort(scores)[::-1]
+        elite = self.population[order[:self.elite]]
+        if scores[order[0]] >= self.best_fitness:
+            self.best_fitness = float(scores[order[0]])
+            self.best = elite[0].copy()
+
+        parents = elite[self.rng.integers(0, self.elite, len(self.population) - self.elite)]
+        children = parents + self.rng.normal(0, self.sigma, parents.shape)
+        self.population = np.concatenate([elite, children])
+        self.generation += 1
+
+        games = len(scores) * self.games
+        stats = {
+            'generation': self.generation,
+            'best': float(scores[order[0]]),
+            'mean': float(scores.mean()),
+            'seconds': elapsed,
+            'games_per_second_per_core': games / elapsed / workers,
+        }
+        self.history.append(stats)
+        return stats
+
+    def run(self, generations, workers=None, checkpoint=None, checkpoint_every=5,
+            report=print):
+        """Train for a number of generations, checkpointing as it goes"""
+        workers = workers or os.cpu_count() or 1
+        with multiprocessing.Pool(workers) as pool:
+            for _ in range(generations):
+                stats = self.step(pool, workers)
+                if report:
+                    report(f"gen {stats['generation']:4d}  best {stats['best']:8.1f}  "
+                           f"mean {stats['mean']:8.1f}  "
+                           f"{stats['games_per_second_per_core']:.1f} games/s/core")
+                if checkpoint and self.generation % checkpoint_every == 0:
+                    self.save_checkpoint(checkpoint)
+        if checkpoint:
+            self.save_checkpoint(checkpoint)
+        return self.best_policy()
+
+    def best_policy(self):
+        return PolicyNetwork(self.hidden, self.best)
+
+    def save_checkpoint(self, path):
+        """Save everything needed to resume training"""
+        tmp = path + '.tmp.npz'
+        np.savez(
+            tmp,
+            population=self.population,
+            best=self.best,
+            best_fitness=self.best_fitness,
+            generation=self.generation,
+            settings=json.dumps({
+                'hidden': self.hidden, 'elite': self.elite, 'sigma': self.sigma,
+                'games': self.games, 'max_ticks': self.max_ticks,
+            }),
+            rng=json.dumps(self.rng.bit_generator.state),
+            history=json.dumps(self.history),
+        )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load_checkpoint(cls, path):
+        data = np.load(path)
+        trainer = cls(population=len(data['population']), **json.loads(str(data['settings'])))
+        trainer.population = data['population']
+        trainer.best = data['best']
+        trainer.best_fitness = float(data['best_fitness'])
+        trainer.generation = int(data['generation'])
+        trainer.rng.bit_generator.state = json.loads(str(data['rng']))
+        trainer.history = json.loads(str(data['history']))
+        return trainer
+
+class AutopilotInput:
+    """Input source that lets a trained policy play the live game"""
+    name = 'autopilot'
+
+    def __init__(self, policy, restart_delay=None):
+        """
+        Args:
+            policy: PolicyNetwork deciding each flap
+            restart_delay: seconds on the game over screen before starting
+                the next game by itself (attract mode); None waits for R
+        """
+        self.policy = policy
+        self.restart_delay = restart_delay
+        self.game_over_at = None
+
+    @classmethod
+    def load(cls, path, restart_delay=None):
+        return cls(PolicyNetwork.load(path), restart_delay)
+
+    def begin_tick(self, tick):
+        pass
+
+    def poll(self, game):
+        """
+        Returns: bool - True to flap (in the menu, to start a game; on the
+        game over screen, to restart once restart_delay has passed)
+        """
+        state = game.game_state.name
+        if state == 'GAME_OVER':
+            now = time.perf_counter()
+            if self.game_over_at is None:
+                self.game_over_at = now
+            return now - self.game_over_at >= self.restart_delay
+        self.game_over_at = None
+        if state != 'PLAYING':
+            return True
+        return self.policy.act(observe(game.bird, game.pipes))
@@ -0,0 +1,60 @@
+"""
+Camera Capture Module
+Low-latency camera reads: small driver buffers, fast formats, and draining
+of queued frames so only the freshest one is decoded
+"""
+
+import time
+from config import *
+
+def configure_capture(cap):
+    """
+    Request a fast format and frame rate and a one-frame driver buffer
+
+    Returns: bool - True if the driver honoured CAP_PROP_BUFFERSIZE
+    """
+    import cv2
+
+    if CAMERA_FOURCC:
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*CAMERA_FOURCC))
+    if CAMERA_FPS:
+        cap.set(cv2.CAP_PROP_FPS, CAMERA_FPS)
+    return (bool(cap.set(cv2.CAP_PROP_BUFFERSIZE, CAMERA_BUFFER_SIZE)) and
+            cap.get(cv2.CAP_PROP_BUFFERSIZE) == CAMERA_BUFFER_SIZE)
+
+class LowLatencyCapture:
+    """
+    Wraps a cv2.VideoCapture so read() returns the freshest frame
+
+    Drivers that ignore CAP_PROP_BUFFERSIZE keep several frames queued, so
+    a plain read() can return a frame 100+ ms old. In drain mode read()
+    grabs (without decoding) until a grab has to wait for the camera,
+    which means the queue is empty, and decodes only that last frame.
+    Anything not defined here is passed through to the wrapped capture.
+    """
+
+    def __init__(self, cap, drain=True):
+        self.cap = cap
+        self.drain = drain
+        self.capture_time = None
+        self.drained = 0
+
+    def read(self, image=None):
+        """Returns: (ok, frame) like VideoCapture.read, sets capture_time"""
+        if not self.drain:
+            ret, image = self.cap.read(image)
+            self.capture_time = time.perf_counter()
+            return ret, image
+
+        for grabs in range(1, CAMERA_DRAIN_MAX_GRABS + 1):
+            grab_start = time.perf_counter()
+            if not self.cap.grab():
+                return False, None
+            self.capture_time = time.perf_counter()
+            if (self.capture_time - grab_start) * 1000 >= CAMERA_DRAIN_WAIT_MS:
+                break  # waited for a new frame, so nothing older is queued
+        self.drained += grabs - 1
+        return self.cap.retrieve(image)
+
+    def __getattr__(self, name):
+        return getattr(self.cap, name)
@@ -0,0 +1,200 @@
+"""
+Camera Discovery Module
+Probes camera devices concurrently, measures what each actually delivers
+and picks (and remembers) the fastest working one
+"""
+
+import json
+import os
+import threading
+import time
+from config import *
+from camera_capture import configure_capture, LowLatencyCapture
+
+def open_capture(index, size):
+    """Open a camera device in low-latency mode at a capture resolution"""
+    import cv2
+
+    cap = cv2.VideoCapture(index)
+    buffer_honoured = configure_capture(cap) if CAMERA_LOW_LATENCY else True
+    width, height = size
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    if CAMERA_LOW_LATENCY:
+        # Drain queued frames ourselves where the driver keeps a buffer
+        return LowLatencyCapture(cap, drain=not buffer_honoured)
+    return cap
+
+class CameraProbe:
+    """Measurements for one camera device; keeps the capture open if it works"""
+
+    def __init__(self, index, size=(CAMERA_WIDTH, CAMERA_HEIGHT)):
+        self.index = index
+        self.size = size
+        self.cap = None
+        self.ok = False
+        self.error = None
+        self.first_frame_ms = None
+        self.fps = 0.0
+        self.frame_size = None
+        self.finished = threading.Event()
+        self._abandoned = False
+        self._lock = threading.Lock()
+
+    def run(self, opener=open_capture, duration=CAMERA_PROBE_DURATION):
+        """
+        Open the device, time the first frame, then count frames for
+        `duration` seconds to measure the real delivered fps
+        """
+        cap = None
+        started = time.perf_counter()
+        try:
+            cap = opener(self.index, self.size)
+            ret, frame = cap.read()
+            if not ret:
+                raise Exception("No frames from camera")
+            first_frame = time.perf_counter()
+            self.first_frame_ms = (first_frame - started) * 1000
+            self.frame_size = (frame.shape[1], frame.shape[0])
+
+            if duration > 0:
+                frames = 0
+                while time.perf_counter() - first_frame < duration:
+                    ret, _ = cap.read()
+                    if not ret:
+                        raise Exception("Camera stopped delivering frames")
+                    frames += 1
+                self.fps = frames / (time.perf_counter() - first_frame)
+            self.ok = True
+        except Exception as e:
+            self.error = e
+            if cap is not None:
+                cap.release()
+                cap = None
+
+        with self._lock:
+            if self._abandoned and cap is not None:
+                cap.release()
+                cap = None
+            self.cap = cap
+            self.finished.set()
+        return self
+
+    def abandon(self, reason=None):
+        """Give up on this device; a late-opening capture gets released"""
+        with self._lock:
+            self._abandoned = True
+            if self.cap is not None:
+                self.cap.release()
+                self.cap = None
+            if not self.finished.is_set():
+                self.ok = False
+                self.error = reason or TimeoutError("Camera probe timed out")
+
+    def describe(self):
+        """One-line summary for the console"""
+        if not self.ok:
+            return f"camera {self.index}: unavailable ({self.error})"
+        width, height = self.frame_size
+        return (f"camera {self.index}: {width}x{height}, {self.fps:.0f} fps, "
+                f"first frame {self.first_frame_ms:.0f} ms")
+
+def discover_cameras(indices=CAMERA_PROBE_INDICES, timeout=CAMERA_PROBE_TIMEOUT,
+                     duration=CAMERA_PROBE_DURATION, opener=open_capture,
+                     size=(CAMERA_WIDTH, CAMERA_HEIGHT)):
+    """
+    Probe several devices at once
+
+    Each device gets its own daemon thread, so a dead device that blocks
+    in the driver costs at most `timeout` seconds and never delays the
+    others.
+
+    Returns: list of CameraProbe (working ones still hold their capture)
+    """
+    probes = [CameraProbe(index, size) for index in indices]
+    for probe in probes:
+        threading.Thread(
+            target=probe.run, args=(opener, duration),
+            name=f"camera-probe-{probe.index}", daemon=True
+        ).start()
+
+    deadline = time.perf_counter() + timeout
+    for probe in probes:
+        if not probe.finished.wait(max(0.0, deadline - time.perf_counter())):
+            probe.abandon()
+    return probes
+
+def select_camera(probes):
+    """The fastest working camera (highest fps, then lowest latency), or None"""
+    working = [p for p in probes if p.ok and p.cap is not None]
+    if not working:
+        return None
+    return min(working, key=lambda p: (-round(p.fps), p.first_frame_ms))
+
+def load_camera_cache(path=CAMERA_CACHE_PATH):
+    """Returns: dict saved by save_camera_cache, or None"""
+    try:
+        with open(path) as f:
+            cached = json.load(f)
+        return cached if 'index' in cached else None
+    except (OSError, ValueError, TypeError):
+        return None
+
+def save_camera_cache(probe, path=CAMERA_CACHE_PATH):
+    """Remember the chosen device and mode for the next run"""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({
+                'index': probe.index,
+                'size': list(probe.frame_size or probe.size),
+                'fps': round(probe.fps, 1),
+                'first_frame_ms': round(probe.first_frame_ms, 1),
+                'probed_at': time.time(),
+            }, f)
+    except OSError as e:
+        print(f"Warning: Could not save camera choice - {e}")
+
+def open_camera(index=CAMERA_INDEX, cache_path=CAMERA_CACHE_PATH,
+                timeout=CAMERA_PROBE_TIMEOUT, opener=open_capture,
+                indices=CAMERA_PROBE_INDICES):
+    """
+    Open the camera to play with
+
+    With an explicit index only that device is tried. Otherwise the device
+    cached by a previous run is tried first (first frame only, no fps
+    measurement); if it fails every candidate is probed and the winner
+    cached.
+
+    Returns: CameraProbe whose .cap is open
+    Raises: Exception if no camera works
+    """
+    if index is not None:
+        probes = discover_cameras([index], timeout, duration=0, opener=opener)
+    else:
+        cached = load_camera_cache(cache_path) if cache_path else None
+        if cached:
+            probe = discover_cameras(
+                [cached['index']], timeout, duration=0, opener=opener,
+                size=tuple(cached.get('size', (CAMERA_WIDTH, CAMERA_HEIGHT)))
+            )[0]
+            if probe.ok:
+                probe.fps = cached.get('fps', 0.0)
+                return probe
+            print(f"Cached {probe.describe()}; searching for cameras...")
+
+        probes = discover_cameras(indices, timeout, opener=opener)
+
+    best = select_camera(probes)
+    for probe in probes:
+        if probe is not best:
+            probe.abandon()
+    if best is None:
+        raise Exception("Camera not accessible")
+
+    if index is None:
+        for probe in probes:
+            print(f"  {'*' if probe is best else ' '} {probe.describe()}")
+        if cache_path:
+            save_camera_cache(best, cache_path)
+    return best
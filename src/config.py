@@ -3,6 +3,8 @@ Configuration file for Hand Gesture Flappy Bird
 Contains all game settings and constants
 """
 
+import os
+
 # Screen Settings
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
@@ -36,20 +38,77 @@ PIPE_WIDTH = 50
 PIPE_SPAWN_DELAY = 120  # frames between pipe spawns
 PIPE_MIN_HEIGHT = 100
 PIPE_MAX_HEIGHT = SCREEN_HEIGHT - PIPE_GAP - 100
+PIPE_POOL_SIZE = 6  # pre-allocated pipes, enough for a full screen of pipes
 
 # Camera Settings
+CAMERA_INDEX = None  # None = discover the best camera (see camera_discovery)
 CAMERA_WIDTH = 640
 CAMERA_HEIGHT = 480
 
+# Low-latency capture: keep the driver from queueing stale frames
+CAMERA_LOW_LATENCY = True
+CAMERA_BUFFER_SIZE = 1  # driver-side frame queue, where CAP_PROP_BUFFERSIZE works
+CAMERA_FOURCC = 'MJPG'  # compressed mode for higher fps over USB; None = default
+CAMERA_FPS = 60  # requested rate; the driver picks the nearest it supports
+CAMERA_DRAIN_MAX_GRABS = 5  # most queued frames skipped per read
+CAMERA_DRAIN_WAIT_MS = 4.0  # a grab faster than this came from the queue
+
+# Camera discovery
+CAMERA_PROBE_INDICES = range(4)  # device indices tried when discovering
+CAMERA_PROBE_TIMEOUT = 3.0  # seconds before a probed device is given up on
+CAMERA_PROBE_DURATION = 0.5  # seconds of frames used to measure fps
+CAMERA_CACHE_PATH = os.path.join(
+    os.path.expanduser('~'), '.hand_gesture_flappy_bird', 'camera.json'
+)
+
+FRAME_BUS_POOL_SIZE = 4  # camera frame buffers kept for reuse
+
 # Hand Gesture Settings
 MIN_DETECTION_CONFIDENCE = 0.7
 MIN_TRACKING_CONFIDENCE = 0.5
 FLAP_COOLDOWN = 300  # milliseconds between flaps
 MIN_FINGERS_FOR_FLAP = 2
+MODEL_COMPLEXITY = 1  # MediaPipe hands model: 0 = lite, 1 = full
+GESTURE_MODEL_PATH = None  # trained classifier (.npz); None = rule heuristics
+FLAP_GESTURES = ['open', 'peace', 'thumbs_up']
+
+# Analog Altitude Control (hand height steers the bird instead of flapping)
+CONTROL_MODE = 'flap'  # 'flap' or 'altitude'
+ALTITUDE_HAND_RANGE = (0.2, 0.8)  # hand y (fraction of frame) mapped to top..bottom
+ALTITUDE_MIN_CUTOFF = 1.0  # One-Euro filter: Hz; lower = smoother when still
+ALTITUDE_BETA = 8.0  # One-Euro filter: higher = less lag when moving fast
+ALTITUDE_DEAD_ZONE = 4  # pixels of target change ignored (hand tremor)
+ALTITUDE_MAX_SPEED = 14  # pixels per frame the bird may climb or dive
+ALTITUDE_GAIN = 0.5  # fraction of the distance to the target closed per frame
+ALTITUDE_HOLD_TIME = 0.5  # seconds the target is held after the hand is lost
+
+# Adaptive Quality Settings
+QUALITY_GOVERNOR_ENABLED = True
+QUALITY_WINDOW = 60  # frames averaged before each decision
+QUALITY_DOWNGRADE_RATIO = 1.0  # step down when frame work > budget * ratio
+QUALITY_UPGRADE_RATIO = 0.6  # step up when frame work < budget * ratio...
+QUALITY_UPGRADE_HOLD = 3  # ...for this many consecutive windows
+QUALITY_INFERENCE_SHARE = 0.5  # max share of the frame budget for inference
+
+# Quality tiers, best first; the governor steps through them one at a time
+QUALITY_TIERS = [
+    {'name': 'high', 'camera_size': (CAMERA_WIDTH, CAMERA_HEIGHT),
+     'model_complexity': MODEL_COMPLEXITY,
+     'show_preview': True, 'detect_every': 1},
+    {'name': 'medium', 'camera_size': (320, 240), 'model_complexity': 1,
+     'show_preview': True, 'detect_every': 1},
+    {'name': 'low', 'camera_size': (320, 240), 'model_complexity': 0,
+     'show_preview': True, 'detect_every': 1},
+    {'name': 'lower', 'camera_size': (320, 240), 'model_complexity': 0,
+     'show_preview': False, 'detect_every': 1},
+    {'name': 'lowest', 'camera_size': (320, 240), 'model_complexity': 0,
+     'show_preview': False, 'detect_every': 2},
+]
 
 # Hand landmarks indices (MediaPipe)
 HAND_LANDMARKS = {
     'WRIST': 0,
+    'MIDDLE_MCP': 9,
     'THUMB_TIP': 4,
     'INDEX_TIP': 8,
     'MIDDLE_TIP': 12,
@@ -65,6 +124,101 @@ HAND_LANDMARKS = {
 FINGER_TIPS = [4, 8, 12, 16, 20]
 FINGER_PIPS = [3, 6, 10, 14, 18]
 
+# Idle Scheduling (menu, paused and game over)
+IDLE_SCHEDULING_ENABLED = True
+IDLE_WAKE_INTERVAL = 250  # ms, longest sleep while waiting for events
+MENU_CAMERA_POLL_FPS = 5  # wake-gesture checks per second in the menu
+CAMERA_FLUSH_FRAMES = 4  # most stale frames dropped from the camera on resume
+
+# Game Loop Runtime
+RUNTIME = 'loop'  # 'loop' (serial game loop) or 'async' (asyncio tasks)
+ASYNC_FRAME_QUEUE_SIZE = 1  # camera frames waiting for inference
+ASYNC_GESTURE_QUEUE_SIZE = 4  # detection results waiting for the game tick
+ASYNC_TELEMETRY_INTERVAL = 1.0  # seconds between runtime stats samples
+ASYNC_IDLE_FPS = 20  # async tick rate in the menu, paused and game over
+
+# Versus Netplay (two cabinets, rollback over UDP)
+NET_PORT = 7777  # relay server port
+NET_INPUT_DELAY = 2  # ticks local flaps are delayed, hiding some network latency
+NET_MAX_ROLLBACK = 8  # most ticks re-simulated; a peer further behind stalls
+NET_COURSE_SEED = 1  # both cabinets race the same pipe course
+NET_PHYSICS = 'fixed'  # 'fixed' (integer, identical on every machine) or 'float'
+FIXED_POINT_SCALE = 1000  # fixed-point units per pixel; keeps GRAVITY = 0.9 exact
+
+# Autopilot (neuroevolved policy network playing the real game rules)
+AUTOPILOT_HIDDEN = 8  # hidden units in the policy network
+AUTOPILOT_MAX_TICKS = 3600  # longest training game (one minute at 60 FPS)
+AUTOPILOT_GAMES = 3  # courses each policy plays per generation
+AUTOPILOT_RESTART_DELAY = 3.0  # seconds on the game over screen before attract mode replays
+
+# Gesture parameter sweep (tools/sweep_gesture_params.py)
+SWEEP_CACHE_DIR = os.path.join(
+    os.path.expanduser('~'), '.hand_gesture_flappy_bird', 'sweep'
+)
+SWEEP_MATCH_GRACE = 0.5  # seconds after a gesture ends that its flap still counts
+
+# Gameplay recording (--record / --highlights)
+RECORDING_DIR = os.path.join(
+    os.path.expanduser('~'), '.hand_gesture_flappy_bird', 'recordings'
+)
+RECORDING_EVERY = 2  # record every k-th displayed frame
+RECORDING_SCALE = 2  # integer downscale factor for recorded frames
+RECORDING_PREROLL = 10.0  # seconds kept in memory for high-score highlight clips
+RECORDING_QUEUE_SIZE = 8  # frames waiting for the encoder before new ones drop
+RECORDING_FOURCC = 'MJPG'
+RECORDING_JPEG_QUALITY = 85  # pre-roll frames are held as JPEG
+
+# Spectator stream (--spectate): MJPEG over local HTTP
+SPECTATOR_HOST = '127.0.0.1'  # '0.0.0.0' serves other machines on the network
+SPECTATOR_PORT = 8080
+SPECTATOR_MAX_FPS = 30  # most frames per second taken from the game per stream
+SPECTATOR_JPEG_QUALITY = 80
+SPECTATOR_SCALE = 1  # integer downscale factor
+
+# Score Storage
+SCORE_DB_PATH = os.path.join(
+    os.path.expanduser('~'), '.hand_gesture_flappy_bird', 'scores.db'
+)
+# high_score.txt from before the score store, imported once into an empty
+# store; the game used to read it from the working directory
+LEGACY_HIGH_SCORE_PATHS = (
+    'high_score.txt',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'high_score.txt'),
+)
+SCORE_WRITE_BATCH_SIZE = 64
+SCORE_FLUSH_INTERVAL = 0.5  # seconds the writer waits to fill a batch
+
+# Telemetry
+TELEMETRY_ENABLED = True
+TELEMETRY_DIR = os.path.join(
+    os.path.expanduser('~'), '.hand_gesture_flappy_bird', 'telemetry'
+)
+TELEMETRY_RING_SIZE = 8192  # events held in memory while the disk catches up
+TELEMETRY_FLUSH_INTERVAL = 2.0  # seconds between background writes
+TELEMETRY_MAX_FILE_BYTES = 5 * 1024 * 1024  # uncompressed, per file
+TELEMETRY_MAX_FILES = 20
+TELEMETRY_SNAPSHOT_INTERVAL = 60.0  # seconds between camera snapshots (0 = off)
+TELEMETRY_SNAPSHOT_WIDTH = 160  # pixels; snapshots are small JPEGs
+TELEMETRY_MAX_SNAPSHOTS = 20
+
+# Profiling (--profile)
+PROFILE_DIR = os.path.join(
+    os.path.expanduser('~'), '.hand_gesture_flappy_bird', 'profiles'
+)
+PROFILE_SAMPLE_INTERVAL = 0.005  # seconds between stack samples
+PROFILE_STACK_HISTORY = 400  # recent stack samples kept for slow-frame dumps
+PROFILE_SLOW_FRAME_MS = 1000 / FPS * 1.5  # frame work that counts as slow
+PROFILE_MAX_DUMPS = 50  # slow-frame dumps per run
+PROFILE_DUMP_COOLDOWN = 1.0  # seconds between slow-frame dumps
+
+# Soak testing (tools/soak_test.py); durations are simulated play time
+SOAK_SAMPLE_MINUTES = 5.0  # between samples of memory, GC and frame times
+SOAK_WARMUP_MINUTES = 10.0  # caches and pools fill up; drift is measured after
+SOAK_RESTART_DELAY = 60  # ticks on the game over screen before restarting
+SOAK_MAX_RSS_GROWTH_MB = 50.0  # resident memory growth after warm-up that fails
+SOAK_MAX_TRACED_GROWTH_MB = 20.0  # Python heap growth (tracemalloc) that fails
+SOAK_MAX_P99_GROWTH = 1.5  # p99 frame time, late vs early windows, that fails
+
 # Font Settings
 FONT_SIZE = 36
 TITLE_FONT_SIZE = 48
\ No newline at end of file
@@ -0,0 +1,167 @@
+"""
+Fixed-Point Physics Module
+Integer versions of the game's physics for simulations that must agree
+bit for bit across machines (versus netplay, replays, score checks)
+
+Positions and velocities are integers in 1/FIXED_POINT_SCALE pixels, so
+every step is exact: no float rounding that could differ with the
+platform or the order of operations. The whole game state is one flat
+array of int32, which makes snapshots a single copy, checksums a single
+CRC over its bytes and desync diffs a field-by-field compare.
+"""
+
+import sys
+import zlib
+from array import array
+
+import numpy as np
+from config import *
+from game_objects import Bird
+from netplay import VersusSim
+
+def to_fixed(value):
+    """Pixels (or pixels per tick) to fixed-point units"""
+    return int(round(value * FIXED_POINT_SCALE))
+
+GRAVITY_FX = to_fixed(GRAVITY)
+JUMP_STRENGTH_FX = to_fixed(JUMP_STRENGTH)
+RADIUS_FX = to_fixed(BIRD_RADIUS)
+START_Y_FX = to_fixed(BIRD_START_Y)
+FLOOR_FX = to_fixed(SCREEN_HEIGHT - BIRD_RADIUS)
+
+def bird_step(y, velocity, flap):
+    """
+    One tick of Bird.update (flap control) in fixed point
+
+    Returns: (y, velocity)
+    """
+    if flap:
+        velocity = JUMP_STRENGTH_FX
+    velocity += GRAVITY_FX
+    y += velocity
+    if y < RADIUS_FX:
+        return RADIUS_FX, 0
+    if y > FLOOR_FX:
+        return FLOOR_FX, 0
+    return y, velocity
+
+def hits_pipe(y, x, gap_start):
+    """
+    The bird's collision rect against a pipe pair at x, with the same
+    integer rects (and truncation) PipeManager.collision uses
+
+    Args:
+        y: bird centre in fixed point
+    """
+    left = BIRD_START_X - BIRD_RADIUS
+    if not (left < x + PIPE_WIDTH and left + 2 * BIRD_RADIUS > x):
+        return False
+    top = (y - RADIUS_FX) // FIXED_POINT_SCALE
+    return top < gap_start or top + 2 * BIRD_RADIUS > gap_start + PIPE_GAP
+
+class FixedVersusSim(VersusSim):
+    """
+    VersusSim with fixed-point birds; a drop-in for RollbackSession and
+    run_versus
+
+    State layout (int32): tick, then y, velocity, alive, score per player.
+    """
+    FIELDS = ('tick',) + tuple(f"{name}{player}" for player in (0, 1)
+                               for name in ('y', 'velocity', 'alive', 'score'))
+
+    def __init__(self, seed=NET_COURSE_SEED):
+        self.seed = seed
+        self._gaps = []
+        self.state = array('i', [0, START_Y_FX, 0, 1, 0, START_Y_FX, 0, 1, 0])
+        self._views = [Bird(), Bird()]
+
+    @property
+    def tick(self):
+        return self.state[0]
+
+    @property
+    def alive(self):
+        return [bool(self.state[3]), bool(self.state[7])]
+
+    @property
+    def scores(self):
+        return [self.state[4], self.state[8]]
+
+    @property
+    def birds(self):
+        """Bird objects positioned from the state, for drawing"""
+        for i, bird in enumerate(self._views):
+            bird.y = self.state[1 + 4 * i] / FIXED_POINT_SCALE
+            bird.velocity = self.state[2 + 4 * i] / FIXED_POINT_SCALE
+        return self._views
+
+    def step(self, flaps):
+        """Advance one tick; flaps is (player 0 flapped, player 1 flapped)"""
+        state = self.state
+        tick = state[0] + 1
+        state[0] = tick
+        pipes = None
+        for base in (1, 5):
+            if not state[base + 2]:
+                continue
+            y, velocity = bird_step(state[base], state[base + 1], flaps[base // 4])
+            state[base], state[base + 1] = y, velocity
+
+            if y == FLOOR_FX:
+                state[base + 2] = 0
+                continue
+            if pipes is None:
+                pipes = self.pipes(tick)
+            for n, x, gap_start in pipes:
+                if hits_pipe(y, x, gap_start):
+                    state[base + 2] = 0
+                    break
+                if x + PIPE_WIDTH < BIRD_START_X <= x + PIPE_WIDTH + PIPE_SPEED:
+                    state[base + 3] += 1
+
+    def save(self):
+        """Snapshot: the state's bytes"""
+        return self.state.tobytes()
+
+    def load(self, snapshot):
+        """Restore a snapshot taken by save() (copied in place)"""
+        memoryview(self.state).cast('B')[:] = snapshot
+
+    def checksum(self):
+        """CRC32 of the state as little-endian int32, the same on every machine"""
+        if sys.byteorder == 'little':
+            return zlib.crc32(self.state)
+        swapped = array('i', self.state)
+        swapped.byteswap()
+        return zlib.crc32(swapped)
+
+    def diff(self, snapshot):
+        """
+        Compare the current state with a snapshot (e.g. the peer's, after a
+        checksum mismatch)
+
+        Returns: dict {field: (ours, theirs)} of the fields that differ
+        """
+        theirs = array('i')
+        theirs.frombytes(snapshot)
+        return {name: (a, b) for name, a, b in zip(self.FIELDS, self.state, theirs)
+                if a != b}
+
+def snapshot_table(snapshots):
+    """
+    View many FixedVersusSim snapshots as one (count, fields) int32 array,
+    e.g. to hash or compare a whole replay at once
+
+    Returns: np.ndarray
+    """
+    return np.frombuffer(b''.join(snapshots), dtype=np.int32).reshape(
+        len(snapshots), len(FixedVersusSim.FIELDS)
+    )
+
+def make_versus_sim(physics=NET_PHYSICS, seed=NET_COURSE_SEED):
+    """Returns: FixedVersusSim ('fixed') or VersusSim ('float')"""
+    if physics == 'fixed':
+        return FixedVersusSim(seed)
+    if physics == 'float':
+        return VersusSim(seed)
+    raise ValueError(f"Unknown physics mode: {physics}")
@@ -0,0 +1,268 @@
+"""
+Flap Latency Module
+Measures glass-to-flap latency: the delay from the moment a gesture is in
+front of the camera to the moment Bird.update applies the flap
+
+A recorded video with known event times is replayed through a simulated
+camera that paces frames in real time and queues them like a V4L2 driver,
+while the real game loop reads, detects and flaps.
+"""
+
+import os
+import tempfile
+import time
+from collections import deque
+
+import numpy as np
+from config import *
+from game_objects import Bird
+
+class SimulatedCamera:
+    """
+    Replays frames as a live camera would deliver them
+
+    Frame i is exposed at start + i / fps. Exposed frames wait in a driver
+    queue of buffer_frames; when it is full new frames are dropped, which
+    is what makes a slow reader see old frames.
+    """
+
+    def __init__(self, frames, fps, buffer_frames=4, honour_buffer_size=False):
+        """
+        Args:
+            frames: list of BGR frames
+            fps: replay rate
+            buffer_frames: driver queue length
+            honour_buffer_size: whether set(CAP_PROP_BUFFERSIZE) works
+        """
+        self.frames = frames
+        self.fps = fps
+        self.buffer_frames = buffer_frames
+        self.honour_buffer_size = honour_buffer_size
+        self.start_time = None
+        self.next_index = 0
+        self.queue = deque()
+        self.grabbed = None
+        self.dropped = 0
+
+    @classmethod
+    def from_video(cls, path, **kwargs):
+        """Load every frame of a video file (at its recorded fps)"""
+        import cv2
+
+        cap = cv2.VideoCapture(path)
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+        frames = []
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frames.append(frame)
+        cap.release()
+        if not frames:
+            raise Exception(f"No frames in {path}")
+        return cls(frames, fps, **kwargs)
+
+    def start(self):
+        """Start the exposure clock"""
+        self.start_time = time.perf_counter()
+        self.next_index = 0
+        self.queue.clear()
+
+    def exposure_time(self, seconds):
+        """perf_counter() time at which the video reached `seconds`"""
+        return self.start_time + seconds
+
+    @property
+    def finished(self):
+        return self.next_index >= len(self.frames) and not self.queue
+
+    def _expose(self):
+        """Queue (or drop) every frame whose exposure time has passed"""
+        due = min(len(self.frames),
+                  int((time.perf_counter() - self.start_time) * self.fps) + 1)
+        while self.next_index < due:
+            if len(self.queue) < self.buffer_frames:
+                self.queue.append(self.next_index)
+            else:
+                self.dropped += 1
+            self.next_index += 1
+
+    def grab(self):
+        """Take the oldest queued frame, waiting for one if none is queued"""
+        if self.start_time is None:
+            self.start()
+        self._expose()
+        while not self.queue:
+            if self.next_index >= len(self.frames):
+                return False
+            wait = self.exposure_time(self.next_index / self.fps) - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
+            self._expose()
+        self.grabbed = self.queue.popleft()
+        return True
+
+    def retrieve(self, image=None):
+        frame = self.frames[self.grabbed]
+        if image is not None and image.shape == frame.shape:
+            np.copyto(image, frame)
+            return True, image
+        return True, frame.copy()
+
+    def read(self, image=None):
+        if not self.grab():
+            return False, None
+        return self.retrieve(image)
+
+    def set(self, prop, value):
+        import cv2
+
+        if prop == cv2.CAP_PROP_BUFFERSIZE and self.honour_buffer_size:
+            self.buffer_frames = int(value)
+            return True
+        return False
+
+    def get(self, prop):
+        import cv2
+
+        if prop == cv2.CAP_PROP_BUFFERSIZE:
+            return self.buffer_frames
+        if prop == cv2.CAP_PROP_FPS:
+            return self.fps
+        return 0.0
+
+    def release(self):
+        pass
+
+class MarkerDetector:
+    """
+    Stand-in for the hand detector: a bright frame means "flap"
+
+    cost_ms emulates the hand model's inference time, which is what lets
+    the driver queue fill up behind a slow reader.
+    """
+
+    def __init__(self, cost_ms=40.0, threshold=128):
+        self.cost_ms = cost_ms
+        self.threshold = threshold
+
+    def process_frame(self, frame, annotate=False):
+        time.sleep(self.cost_ms / 1000)
+        bright = frame.mean() > self.threshold
+        return {
+            'should_flap': bool(bright),
+            'hand_position': None,
+            'fingers_count': 0,
+            'gesture': 'marker' if bright else 'none',
+            'landmarks': None,
+            'confidence': 1.0 if bright else 0.0,
+            'frame': frame
+        }
+
+    def set_model_complexity(self, model_complexity):
+        pass
+
+class TimedBird(Bird):
+    """Bird that records when update() applies a flap"""
+    __slots__ = ('flap_times',)
+
+    def __init__(self):
+        super().__init__()
+        self.flap_times = []
+
+    def update(self, should_flap=False, target_y=None):
+        if should_flap:
+            self.flap_times.append(time.perf_counter())
+        super().update(should_flap, target_y)
+
+def flash_video_frames(event_times, seconds, fps=30, size=(320, 240), flash_frames=3):
+    """
+    Synthetic marker video: black, with a white flash at each event time
+
+    Returns: list of BGR frames
+    """
+    width, height = size
+    dark = np.zeros((height, width, 3), dtype=np.uint8)
+    bright = np.full((height, width, 3), 255, dtype=np.uint8)
+    flashes = set()
+    for t in event_times:
+        first = int(round(t * fps))
+        flashes.update(range(first, first + flash_frames))
+    return [bright if i in flashes else dark for i in range(int(seconds * fps))]
+
+def measure_flap_latency(camera, event_times, detector, low_latency=True,
+                         max_delay=1.0):
+    """
+    Replay camera through the real game loop and time each event's flap
+
+    Args:
+        camera: SimulatedCamera (not started)
+        event_times: seconds into the video at which a flap gesture starts
+        detector: object with process_frame(frame, annotate)
+        low_latency: read through LowLatencyCapture (drain / buffer size 1)
+        max_delay: flaps later than this after an event count as missed
+
+    Returns: dict {'delays_ms': list, 'missed': int, 'stale_frames_dropped'}
+    """
+    from turbo import configure_headless
+    configure_headless()
+    from camera_capture import configure_capture, LowLatencyCapture
+    from game_engine import HandGestureFlappyBird, GameState
+    from score_store import ScoreStore
+    from telemetry import Telemetry
+
+    temp_dir = tempfile.TemporaryDirectory(prefix='flappy-latency-')
+    game = HandGestureFlappyBird(
+        use_camera=False,
+        score_store=ScoreStore(os.path.join(temp_dir.name, 'scores.db')),
+        telemetry=Telemetry(enabled=False)
+    )
+    try:
+        if low_latency:
+            camera = LowLatencyCapture(camera, drain=not configure_capture(camera))
+        game.cap = camera
+        game.hand_detector = detector
+        game.camera_available = True
+        game.quality_governor = None
+        game.render_enabled = False
+        game.apply_preview_tier({'show_preview': False, 'detect_every': 1})
+        game.bird = bird = TimedBird()
+
+        source = getattr(camera, 'cap', camera)
+        source.start()
+        while not source.finished:
+            if game.game_state != GameState.PLAYING:
+                game.start_game()
+            if not game.step():
+                break
+    finally:
+        game.cleanup()
+        temp_dir.cleanup()
+
+    delays, missed = [], 0
+    for t in event_times:
+        exposed = source.exposure_time(t)
+        later = [f for f in bird.flap_times if exposed <= f <= exposed + max_delay]
+        if later:
+            delays.append((later[0] - exposed) * 1000)
+        else:
+            missed += 1
+    return {
+        'delays_ms': delays,
+        'missed': missed,
+        'stale_frames_dropped': getattr(camera, 'drained', 0),
+    }
+
+def summarize(delays_ms):
+    """Returns: dict of count, mean, p50, p90, p99 and max in ms"""
+    if not delays_ms:
+        return {'count': 0}
+    values = np.array(delays_ms)
+    return {
+        'count': len(values),
+        'mean': float(values.mean()),
+        'p50': float(np.percentile(values, 50)),
+        'p90': float(np.percentile(values, 90)),
+        'p99': float(np.percentile(values, 99)),
+        'max': float(values.max()),
+    }
@@ -0,0 +1,147 @@
+"""
+Frame Bus Module
+Publishes each camera frame once as a read-only, reference-counted buffer
+that any number of consumers can read at their own pace
+"""
+
+import threading
+import time
+import numpy as np
+from config import *
+
+class SharedFrame:
+    """A published frame; hold a reference while using it, then release()"""
+    __slots__ = ('bus', 'array', 'seq', 'timestamp', 'refs')
+
+    def __init__(self, bus, array, seq, timestamp):
+        self.bus = bus
+        self.array = array
+        self.seq = seq
+        self.timestamp = timestamp
+        self.refs = 0
+
+    def acquire(self):
+        """Take a reference (the buffer is not reused while referenced)"""
+        with self.bus.lock:
+            self.refs += 1
+        return self
+
+    def release(self):
+        """Drop a reference; the buffer returns to the pool at zero"""
+        with self.bus.lock:
+            self.refs -= 1
+            if self.refs == 0:
+                self.bus._recycle(self.array)
+
+    def copy(self):
+        """Writable copy for consumers that need to draw on the frame"""
+        return self.array.copy()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+class Subscription:
+    def __init__(self, bus, name):
+        """A consumer's view of the bus; see FrameBus.subscribe"""
+        self.bus = bus
+        self.name = name
+        self.last_seq = bus.published
+        self.received = 0
+        self.skipped = 0
+
+    def poll(self):
+        """
+        Newest frame this consumer has not seen yet, or None
+
+        Frames published since the previous poll are skipped, never queued,
+        so a slow consumer can not hold up the producer or fall behind.
+        The returned frame is acquired: release() it (or use `with`).
+        """
+        with self.bus.lock:
+            frame = self.bus._latest
+            if frame is None or frame.seq == self.last_seq:
+                return None
+            self.skipped += frame.seq - self.last_seq - 1
+            self.last_seq = frame.seq
+            self.received += 1
+            frame.refs += 1
+        return frame
+
+class FrameBus:
+    def __init__(self, pool_size=FRAME_BUS_POOL_SIZE):
+        """
+        Args:
+            pool_size: released buffers kept for reuse, so steady-state
+                publishing does not allocate
+        """
+        self.lock = threading.Lock()
+        self.pool_size = pool_size
+        self._free = []
+        self._latest = None
+        self.published = 0
+        self.allocated = 0
+        self.subscriptions = []
+
+    def acquire_buffer(self, shape, dtype=np.uint8):
+        """A writable buffer for the producer to fill before publish()"""
+        with self.lock:
+            for i, buffer in enumerate(self._free):
+                if buffer.shape == shape and buffer.dtype == dtype:
+                    del self._free[i]
+                    buffer.flags.writeable = True
+                    return buffer
+            self.allocated += 1
+        return np.empty(shape, dtype=dtype)
+
+    def _recycle(self, array):
+        """Return a no-longer-referenced buffer to the pool (lock held)"""
+        if len(self._free) < self.pool_size:
+            self._free.append(array)
+
+    def publish(self, array, timestamp=None):
+        """
+        Publish a filled buffer; it becomes read-only from here on
+
+        Returns: SharedFrame (not acquired for the caller)
+        """
+        array.flags.writeable = False
+        with self.lock:
+            self.published += 1
+            frame = SharedFrame(
+                self, array, self.published,
+                time.perf_counter() if timestamp is None else timestamp
+            )
+            frame.refs = 1  # the bus's own reference as "latest"
+            previous, self._latest = self._latest, frame
+
+        if previous is not None:
+            previous.release()
+        return frame
+
+    def subscribe(self, name):
+        """Register a consumer; returns a Subscription to poll()"""
+        subscription = Subscription(self, name)
+        self.subscriptions.append(subscription)
+        return subscription
+
+    def latest(self):
+        """Newest frame, acquired for the caller (release it), or None"""
+        with self.lock:
+            frame = self._latest
+            if frame is not None:
+                frame.refs += 1
+        return frame
+
+    def stats(self):
+        """Returns: dict of publish/allocation counts and per-consumer skips"""
+        return {
+            'published': self.published,
+            'allocated': self.allocated,
+            'consumers': {
+                s.name: {'received': s.received, 'skipped': s.skipped}
+                for s in self.subscriptions
+            },
+        }
@@ -4,13 +4,20 @@ Handles game loop, states, and coordination between components
 """
 
 import pygame
-import cv2
 import sys
+import time
 from enum import Enum
 
 from config import *
-from hand_gesture_detector import HandGestureDetector
-from game_objects import Bird, Pipe, ScoreManager, Background
+from startup import CameraStartup
+from quality_governor import QualityGovernor
+from scheduler import IdleScheduler
+from telemetry import Telemetry, CameraSnapshotter
+from frame_bus import FrameBus
+from altitude_control import AltitudeControl
+from game_objects import Bird, PipeManager, ScoreManager, Background
+
+PREVIEW_WINDOW = "Hand Tracking - Flappy Bird Control"
 
 class GameState(Enum):
     MENU = 1
@@ -19,8 +26,18 @@ class GameState(Enum):
     GAME_OVER = 4
 
 class HandGestureFlappyBird:
-    def __init__(self):
-        """Initialize the game"""
+    def __init__(self, use_camera=True, score_store=None, telemetry=None,
+                 control_mode=CONTROL_MODE):
+        """
+        Initialize the game
+
+        Args:
+            use_camera: False skips camera and hand detection setup entirely
+            score_store: ScoreStore to use instead of the default database
+            telemetry: Telemetry to use instead of the default event writer
+            control_mode: 'flap' (gestures flap) or 'altitude' (hand height
+                steers the bird)
+        """
         # Initialize Pygame
         pygame.init()
 
@@ -30,50 +47,137 @@ class HandGestureFlappyBird:
 
         # Game timing
         self.clock = pygame.time.Clock()
+        self.scheduler = IdleScheduler(
+            self.clock,
+            active_states=[GameState.PLAYING],
+            wake_states=[GameState.MENU]
+        )
 
         # Game state
         self.game_state = GameState.MENU
         self.last_flap_time = 0
 
+        # Event telemetry (flaps, frame times, deaths, scores)
+        self.telemetry = telemetry if telemetry is not None else Telemetry()
+
         # Game objects
         self.bird = Bird()
-        self.pipes = []
-        self.score_manager = ScoreManager()
+        self.pipes = PipeManager()
+        self.score_manager = ScoreManager(score_store)
         self.background = Background()
 
-        # Pipe spawning
-        self.pipe_spawn_timer = 0
+        # Initialize camera and hand detection (in the background)
+        self.camera_available = False
+        self.cap = None
+        self.frame_bus = FrameBus()
+        self.raw_frame = None
+        self.snapshotter = None
+        self.hand_detector = None
+        self.camera_startup = None
+        if use_camera:
+            self.setup_camera_and_detection()
+
+        # Adaptive quality (camera resolution, model, preview, detection rate)
+        self.show_preview = True
+        self.detect_every = 1
+        self.frame_counter = 0
+        self.last_inference_time = 0.0
+        self.quality_governor = None
+        if QUALITY_GOVERNOR_ENABLED:
+            self.quality_governor = QualityGovernor(
+                on_change=self.apply_quality_tier
+            )
+
+        # Alternative input (scripted, replayed or autopilot) replacing the
+        # camera: an object with poll(game) -> bool, True to flap this tick
+        self.input_source = None
+        self.render_enabled = True
+
+        # Analog control: hand height -> target altitude (None in flap mode)
+        self.altitude_control = None
+        if control_mode == 'altitude':
+            self.altitude_control = AltitudeControl()
+
+        # Optional profiler.Profiler timing each frame's stages (--profile)
+        self.profiler = None
+
+        # Optional video_recorder.VideoRecorder fed every drawn frame
+        # (--record / --highlights); saves a clip after a new high score
+        self.recorder = None
+        self.high_score_at_start = 0
 
-        # Initialize camera and hand detection
-        self.setup_camera_and_detection()
+        # Optional spectator_stream.SpectatorServer offered the game view
+        # and the hand-tracking frame (--spectate)
+        self.spectator = None
 
         # Fonts
         self.font = pygame.font.Font(None, FONT_SIZE)
         self.title_font = pygame.font.Font(None, TITLE_FONT_SIZE)
 
     def setup_camera_and_detection(self):
-        """Setup camera and hand gesture detection"""
-        try:
-            self.cap = cv2.VideoCapture(0)
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, CAMERA_WIDTH)
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, CAMERA_HEIGHT)
-
-            # Test camera
-            ret, frame = self.cap.read()
-            if not ret:
-                raise Exception("Camera not accessible")
-
-            self.hand_detector = HandGestureDetector()
+        """
+        Start camera and hand gesture detection setup in the background
+
+        OpenCV and MediaPipe are imported on the startup thread, so the menu
+        can be shown right away; poll_camera_setup adopts the result.
+        """
+        self.camera_startup = CameraStartup().start()
+
+    def poll_camera_setup(self):
+        """Adopt the camera and detector once background setup has finished"""
+        startup = self.camera_startup
+        if startup is None or not startup.done.is_set():
+            return
+
+        self.camera_startup = None
+        if startup.error is None:
+            self.cap = startup.cap
+            self.hand_detector = startup.hand_detector
             self.camera_available = True
+            self.start_snapshotter()
             print("Camera and hand detection initialized successfully!")
-
-        except Exception as e:
-            print(f"Warning: Camera setup failed - {e}")
+        else:
+            print(f"Warning: Camera setup failed - {startup.error}")
             print("Game will run without hand gesture control.")
             print("Use SPACE key to play instead.")
-            self.camera_available = False
-            self.cap = None
-            self.hand_detector = None
+
+    def start_snapshotter(self):
+        """Save occasional camera snapshots with the telemetry, if enabled"""
+        if self.telemetry.enabled and TELEMETRY_SNAPSHOT_INTERVAL > 0:
+            self.snapshotter = CameraSnapshotter(self.telemetry, self.frame_bus).start()
+
+    def emit_snapshots(self):
+        """Record camera snapshots taken since the last frame in telemetry"""
+        if self.snapshotter:
+            for snapshot in self.snapshotter.take_results():
+                self.telemetry.emit('camera_snapshot', **snapshot)
+
+    def apply_quality_tier(self, tier):
+        """Apply a quality tier chosen by the governor"""
+        self.apply_preview_tier(tier)
+        self.set_camera_size(tier['camera_size'])
+        if self.hand_detector:
+            self.hand_detector.set_model_complexity(tier['model_complexity'])
+
+    def apply_preview_tier(self, tier):
+        """Apply the preview window and detection rate parts of a tier"""
+        self.show_preview = tier['show_preview']
+        self.detect_every = tier['detect_every']
+
+        if not self.show_preview and 'cv2' in sys.modules:
+            cv2 = sys.modules['cv2']
+            try:
+                cv2.destroyWindow(PREVIEW_WINDOW)
+            except cv2.error:
+                pass  # window was never opened
+
+    def set_camera_size(self, size):
+        """Request a capture resolution from the camera"""
+        if self.cap:
+            import cv2
+            width, height = size
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
 
     def handle_events(self):
         """Handle pygame events"""
@@ -81,12 +185,17 @@ class HandGestureFlappyBird:
             if event.type == pygame.QUIT:
                 return False
 
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.scheduler.mark_dirty()
+
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
                     if self.game_state == GameState.MENU:
                         self.start_game()
                     elif self.game_state == GameState.PLAYING:
                         self.bird.update(should_flap=True)
+                        self.score_manager.record_flap('keyboard')
+                        self.telemetry.emit('flap', source='keyboard')
 
                 elif event.key == pygame.K_r and self.game_state == GameState.GAME_OVER:
                     self.restart_game()
@@ -113,18 +222,68 @@ class HandGestureFlappyBird:
         if not self.camera_available or not self.cap:
             return False
 
-        ret, frame = self.cap.read()
-        if not ret:
+        # At reduced detection rates only grab (no decode) on skipped frames,
+        # which keeps the camera buffer from going stale
+        self.frame_counter += 1
+        if self.frame_counter % self.detect_every:
+            self.cap.grab()
             return False
 
-        # Mirror the frame for natural interaction
-        frame = cv2.flip(frame, 1)
+        frame = self.read_camera_frame()
+        if frame is None:
+            self.telemetry.emit('dropped_frame', reason='read_failed')
+            return False
 
         # Detect hand gestures
-        gesture_data = self.hand_detector.process_frame(frame)
+        with frame:
+            gesture_data = self.detect_gestures(frame.array)
+            if self.spectator:
+                self.spectator.offer_hand(gesture_data['frame'])
+        self.scheduler.frame_processed()
+        self.track_hand_altitude(gesture_data)
 
         # Display camera feed with hand tracking
-        cv2.imshow("Hand Tracking - Flappy Bird Control", gesture_data['frame'])
+        if self.show_preview:
+            self.show_camera_preview(gesture_data)
+
+        return self.apply_flap_cooldown(gesture_data)
+
+    def read_camera_frame(self):
+        """
+        Read one mirrored camera frame and publish it on the frame bus
+
+        Returns: frame_bus.SharedFrame acquired for the caller (release it
+            when done), or None if the read failed
+        """
+        import cv2
+
+        ret, raw = self.cap.read(self.raw_frame)
+        if not ret:
+            return None
+        self.raw_frame = raw
+
+        # Mirror the frame for natural interaction, into a pooled buffer
+        buffer = self.frame_bus.acquire_buffer(raw.shape, raw.dtype)
+        cv2.flip(raw, 1, dst=buffer)
+        return self.frame_bus.publish(
+            buffer, getattr(self.cap, 'capture_time', None)
+        ).acquire()
+
+    def detect_gestures(self, frame):
+        """Run hand detection on a frame, timing the inference"""
+        inference_start = time.perf_counter()
+        # Annotate for the preview window, or for anyone watching /hand.mjpg
+        annotate = self.show_preview or bool(
+            self.spectator and self.spectator.watching('hand')
+        )
+        gesture_data = self.hand_detector.process_frame(frame, annotate=annotate)
+        self.last_inference_time = time.perf_counter() - inference_start
+        gesture_data['timestamp'] = inference_start
+        return gesture_data
+
+    def show_camera_preview(self, gesture_data):
+        """Show the annotated camera frame with control instructions"""
+        import cv2
 
         # Add instructions to camera window
         instructions = [
@@ -135,37 +294,102 @@ class HandGestureFlappyBird:
             "Press Q = Quit"
         ]
 
+        # The detector annotated its own copy, so drawing here is safe
+        frame = gesture_data['frame']
         for i, instruction in enumerate(instructions):
             cv2.putText(
-                gesture_data['frame'],
+                frame,
                 instruction,
-                (10, CAMERA_HEIGHT - 120 + i * 20),
+                (10, frame.shape[0] - 120 + i * 20),
                 cv2.FONT_HERSHEY_SIMPLEX,
                 0.5,
                 (255, 255, 255),
                 1
             )
 
-        # Handle flap with cooldown
+        cv2.imshow(PREVIEW_WINDOW, frame)
+
+    def poll_input_source(self):
+        """Returns: bool - True if the replacement input source flaps this tick"""
+        should_flap = self.input_source.poll(self)
+        if should_flap:
+            self.telemetry.emit('flap', source=self.input_source.name)
+        return should_flap
+
+    def poll_attract_restart(self):
+        """
+        On the game over screen, let an input source that restarts by
+        itself (AutopilotInput with a restart_delay) start the next game
+        """
+        if getattr(self.input_source, 'restart_delay', None) is None:
+            return
+        if self.input_source.poll(self):
+            self.restart_game()
+
+    def apply_flap_cooldown(self, gesture_data):
+        """Returns: bool - True if the gesture should flap (cooldown applied)"""
         should_flap = False
-        if gesture_data['should_flap']:
+        # While the hand steers the bird a flap gesture has no effect, so it
+        # is neither counted nor logged (it still starts a game from the menu)
+        if gesture_data['should_flap'] and not self.steering_by_altitude():
             current_time = pygame.time.get_ticks()
             if current_time - self.last_flap_time > FLAP_COOLDOWN:
                 should_flap = True
                 self.last_flap_time = current_time
+                self.telemetry.emit(
+                    'flap',
+                    source='gesture',
+                    gesture=gesture_data['gesture'],
+                    confidence=round(gesture_data.get('confidence', 0.0), 3)
+                )
 
         return should_flap
 
+    def steering_by_altitude(self):
+        """True while altitude control, not flapping, moves the bird"""
+        return (self.game_state == GameState.PLAYING
+                and self.altitude_control is not None
+                and self.altitude_control.target is not None)
+
+    def track_hand_altitude(self, gesture_data):
+        """Feed the hand's height to altitude control (when enabled)"""
+        if self.altitude_control is None:
+            return
+        hand_y = None
+        if gesture_data['hand_position']:
+            hand_y = gesture_data['hand_position'][1] / gesture_data['frame'].shape[0]
+        self.altitude_control.update(hand_y, gesture_data['timestamp'])
+
+    def flush_camera_buffer(self):
+        """
+        Drop frames that queued up in the camera while we were idle
+
+        Grabs until one has to wait for the camera, as LowLatencyCapture
+        reads do, so a short queue costs at most one frame of waiting.
+        """
+        if not self.camera_available or not self.cap:
+            return
+        from camera_capture import LowLatencyCapture
+        if isinstance(self.cap, LowLatencyCapture) and not self.cap.drain:
+            return  # the driver keeps a single frame, so nothing is stale
+        for _ in range(CAMERA_FLUSH_FRAMES):
+            grab_start = time.perf_counter()
+            if not self.cap.grab():
+                return
+            if (time.perf_counter() - grab_start) * 1000 >= CAMERA_DRAIN_WAIT_MS:
+                return  # waited for a new frame, so the queue is empty
+
     def start_game(self):
         """Start a new game"""
         self.game_state = GameState.PLAYING
         self.bird.reset()
-        self.pipes = []
-        self.pipe_spawn_timer = 0
+        self.pipes.reset()
         self.score_manager.reset_score()
+        self.high_score_at_start = self.score_manager.high_score
+        self.telemetry.emit('session_start', camera=self.camera_available)
 
         # Spawn first pipe
-        self.pipes.append(Pipe(SCREEN_WIDTH + 200))
+        self.pipes.spawn(SCREEN_WIDTH + 200)
 
     def restart_game(self):
         """Restart the game"""
@@ -173,49 +397,44 @@ class HandGestureFlappyBird:
 
     def update_game_playing(self, should_flap_gesture):
         """Update game when in playing state"""
-        # Update bird
-        self.bird.update(should_flap_gesture)
+        # Update bird (steered to the hand's altitude in altitude mode)
+        target_y = self.altitude_control.target if self.altitude_control else None
+        self.bird.update(should_flap_gesture, target_y)
+        if should_flap_gesture and target_y is None:
+            source = self.input_source.name if self.input_source else 'gesture'
+            self.score_manager.record_flap(source)
 
         # Update background
         self.background.update()
 
-        # Update pipes
-        for pipe in self.pipes[:]:  # Create copy to avoid modification during iteration
-            pipe.update()
-
-            # Check if bird passed pipe (for scoring)
-            if pipe.is_bird_passed(self.bird.x):
-                pipe.passed = True
-                self.score_manager.update_score()
-
-            # Remove off-screen pipes
-            if pipe.is_off_screen():
-                self.pipes.remove(pipe)
-
-        # Spawn new pipes
-        self.pipe_spawn_timer += 1
-        if self.pipe_spawn_timer >= PIPE_SPAWN_DELAY:
-            self.pipes.append(Pipe(SCREEN_WIDTH))
-            self.pipe_spawn_timer = 0
+        # Update pipes (scores once per pipe passed)
+        for _ in range(self.pipes.update(self.bird.x)):
+            self.score_manager.update_score()
 
         # Check collisions
         self.check_collisions()
 
     def check_collisions(self):
         """Check for collisions between bird and pipes/ground"""
-        bird_rect = self.bird.get_rect()
-
-        # Check ground collision
-        if self.bird.y + self.bird.radius >= SCREEN_HEIGHT:
-            self.game_state = GameState.GAME_OVER
-            return
-
-        # Check pipe collisions
-        for pipe in self.pipes:
-            top_rect, bottom_rect = pipe.get_collision_rects()
-            if bird_rect.colliderect(top_rect) or bird_rect.colliderect(bottom_rect):
-                self.game_state = GameState.GAME_OVER
-                return
+        cause = self.pipes.collision(self.bird)
+        if cause:
+            self.game_over(cause)
+
+    def game_over(self, cause='unknown'):
+        """End the current run and queue its session record for saving"""
+        self.game_state = GameState.GAME_OVER
+        manager = self.score_manager
+        self.telemetry.emit(
+            'death',
+            cause=cause,
+            score=manager.score,
+            flaps=manager.gesture_flaps + manager.keyboard_flaps + manager.input_flaps,
+            gesture_flaps=manager.gesture_flaps
+        )
+        if self.recorder and manager.score > self.high_score_at_start:
+            self.recorder.save_highlight(f"highlight-{time.strftime('%Y%m%d-%H%M%S')}"
+                                         f"-score{manager.score}.avi")
+        manager.end_session()
 
     def draw_menu(self):
         """Draw menu screen"""
@@ -257,11 +476,18 @@ class HandGestureFlappyBird:
             self.screen.blit(instruction_text, instruction_rect)
 
         # Camera status
-        camera_status = "📷 Camera: Ready" if self.camera_available else "📷 Camera: Not Available"
-        camera_color = COLORS['GREEN'] if self.camera_available else COLORS['RED']
+        camera_status, camera_color = self.camera_status()
         camera_text = self.font.render(camera_status, True, camera_color)
         self.screen.blit(camera_text, (10, SCREEN_HEIGHT - 30))
 
+    def camera_status(self):
+        """Returns: tuple (text, color) describing the camera for the menu"""
+        if self.camera_startup is not None:
+            return f"📷 Camera: {self.camera_startup.status}...", COLORS['YELLOW']
+        if self.camera_available:
+            return "📷 Camera: Ready", COLORS['GREEN']
+        return "📷 Camera: Not Available", COLORS['RED']
+
     def draw_playing(self):
         """Draw game during play"""
         # Draw background
@@ -318,47 +544,126 @@ class HandGestureFlappyBird:
             self.draw_game_over()
 
         pygame.display.flip()
+        if self.recorder:
+            self.recorder.capture(self.screen)
+        if self.spectator:
+            self.spectator.offer_game(self.screen)
+
+    def step(self):
+        """
+        Run one iteration of the game loop
+
+        Returns: bool - False when the game should quit
+        """
+        frame_start = time.perf_counter()
+        self.last_inference_time = 0.0
+        profiler = self.profiler
+        if profiler:
+            profiler.begin_frame()
+
+        # Handle events
+        if not self.handle_events():
+            return False
 
-    def run(self):
-        """Main game loop"""
-        running = True
-
-        while running:
-            # Handle events
-            running = self.handle_events()
-            if not running:
-                break
-
-            # Process hand gestures
-            should_flap_gesture = False
-            if self.game_state in [GameState.PLAYING, GameState.MENU]:
+        # Pick up the camera once background setup is done
+        self.poll_camera_setup()
+
+        # Coming back from an idle state: skip stale camera frames
+        if self.scheduler.begin_frame(self.game_state):
+            self.flush_camera_buffer()
+        if profiler:
+            profiler.mark('events')
+
+        # Process hand gestures (throttled to wake checks in the menu), or
+        # ask the replacement input source if one is attached
+        should_flap_gesture = False
+        if self.game_state in [GameState.PLAYING, GameState.MENU]:
+            if self.input_source is not None:
+                should_flap_gesture = self.poll_input_source()
+            elif self.scheduler.should_poll_camera():
                 should_flap_gesture = self.process_hand_gestures()
 
-                # Start game with gesture if in menu
-                if should_flap_gesture and self.game_state == GameState.MENU:
-                    self.start_game()
-
-            # Update game state
-            if self.game_state == GameState.PLAYING:
-                self.update_game_playing(should_flap_gesture)
-
-            # Draw everything
+            # Start game with gesture if in menu
+            if should_flap_gesture and self.game_state == GameState.MENU:
+                self.start_game()
+        elif self.game_state == GameState.GAME_OVER:
+            self.poll_attract_restart()
+        if profiler:
+            profiler.mark('camera')
+
+        # Update game state
+        if self.game_state == GameState.PLAYING:
+            self.update_game_playing(should_flap_gesture)
+        if profiler:
+            profiler.mark('update')
+
+        # Draw everything (static screens only when something changed)
+        if (self.render_enabled and
+                self.scheduler.should_redraw((self.game_state, self.camera_status()))):
             self.draw()
+        if profiler:
+            profiler.mark('draw')
+
+        # Let the governor and telemetry see how long this frame's work took
+        if self.game_state == GameState.PLAYING:
+            frame_time = time.perf_counter() - frame_start
+            if self.quality_governor and self.camera_available:
+                self.quality_governor.record(frame_time, self.last_inference_time)
+            self.telemetry.emit(
+                'frame',
+                frame_ms=round(frame_time * 1000, 3),
+                inference_ms=round(self.last_inference_time * 1000, 3)
+            )
+        self.emit_snapshots()
+        if profiler:
+            profiler.mark('bookkeeping')
+            self.end_profiled_frame()
 
-            # Control frame rate
-            self.clock.tick(FPS)
+        # Control frame rate (or sleep until the next event when idle)
+        self.scheduler.wait()
 
-            # Check for camera window close
+        # Check for camera window close
+        if self.camera_available:
+            import cv2
             if cv2.waitKey(1) & 0xFF == ord('q'):
-                break
+                return False
+
+        return True
+
+    def end_profiled_frame(self):
+        """End the profiler's frame, holding the newest camera frame for a dump"""
+        frame = self.frame_bus.latest()
+        if frame is None:
+            self.profiler.end_frame()
+            return
+        with frame:
+            self.profiler.end_frame(frame.array)
+
+    def run(self):
+        """Main game loop"""
+        while self.step():
+            pass
 
         # Cleanup
         self.cleanup()
 
     def cleanup(self):
         """Clean up resources"""
+        if self.camera_startup is not None:
+            # Let an in-flight setup finish so its capture can be released
+            self.camera_startup.wait(timeout=2.0)
+            self.poll_camera_setup()
+        self.score_manager.close()
+        if self.snapshotter:
+            self.snapshotter.close()
+        self.telemetry.close()
+        if self.recorder:
+            self.recorder.close()
+        if self.spectator:
+            self.spectator.close()
         if self.cap:
             self.cap.release()
-        cv2.destroyAllWindows()
+        if 'cv2' in sys.modules:
+            sys.modules['cv2'].destroyAllWindows()
         pygame.quit()
         print("Game closed. Thanks for playing!")
\ No newline at end of file
@@ -5,9 +5,15 @@ Contains Bird and Pipe classes for the Flappy Bird game
 
 import pygame
 import random
+import sqlite3
+import time
+from collections import deque
 from config import *
+from score_store import ScoreStore
 
 class Bird:
+    __slots__ = ('x', 'y', 'velocity', 'radius')
+
     def __init__(self):
         """Initialize the bird object"""
         self.x = BIRD_START_X
@@ -15,14 +21,25 @@ class Bird:
         self.velocity = 0
         self.radius = BIRD_RADIUS
 
-    def update(self, should_flap=False):
-        """Update bird physics"""
-        if should_flap:
-            self.velocity = JUMP_STRENGTH
-
-        # Apply gravity
-        self.velocity += GRAVITY
-        self.y += self.velocity
+    def update(self, should_flap=False, target_y=None):
+        """
+        Update bird physics
+
+        With a target_y (altitude control) the bird steers toward it at no
+        more than ALTITUDE_MAX_SPEED instead of flapping against gravity.
+        """
+        if target_y is not None:
+            self.velocity = max(-ALTITUDE_MAX_SPEED, min(
+                ALTITUDE_MAX_SPEED, (target_y - self.y) * ALTITUDE_GAIN
+            ))
+            self.y += self.velocity
+        else:
+            if should_flap:
+                self.velocity = JUMP_STRENGTH
+
+            # Apply gravity
+            self.velocity += GRAVITY
+            self.y += self.velocity
 
         # Keep bird within screen bounds
         if self.y < self.radius:
@@ -80,10 +97,16 @@ class Bird:
         self.velocity = 0
 
 class Pipe:
+    __slots__ = ('x', 'width', 'gap_start', 'gap_end', 'passed')
+
     def __init__(self, x):
         """Initialize a pipe pair"""
-        self.x = x
         self.width = PIPE_WIDTH
+        self.reset(x)
+
+    def reset(self, x):
+        """Place the pipe at x with a fresh random gap (used when recycling)"""
+        self.x = x
         self.gap_start = random.randint(PIPE_MIN_HEIGHT, PIPE_MAX_HEIGHT)
         self.gap_end = self.gap_start + PIPE_GAP
         self.passed = False
@@ -155,29 +178,120 @@ class Pipe:
         """Check if bird has passed this pipe"""
         return not self.passed and self.x + self.width < bird_x
 
+class PipeManager:
+    __slots__ = ('pipes', 'pool', 'spawn_timer')
+
+    def __init__(self, pool_size=PIPE_POOL_SIZE):
+        """
+        Manage active pipes and recycle them from a pre-allocated pool
+
+        Active pipes are kept in spawn order, so the leftmost pipe is always
+        pipes[0] and off-screen pipes are retired from the left only.
+        """
+        self.pipes = deque()
+        self.pool = [Pipe(SCREEN_WIDTH) for _ in range(pool_size)]
+        self.spawn_timer = 0
+
+    def __iter__(self):
+        return iter(self.pipes)
+
+    def __len__(self):
+        return len(self.pipes)
+
+    def spawn(self, x):
+        """Take a pipe from the pool (or allocate if exhausted) and place it at x"""
+        pipe = self.pool.pop() if self.pool else Pipe(x)
+        pipe.reset(x)
+        self.pipes.append(pipe)
+        return pipe
+
+    def reset(self):
+        """Return every active pipe to the pool"""
+        while self.pipes:
+            self.pool.append(self.pipes.pop())
+        self.spawn_timer = 0
+
+    def update(self, bird_x):
+        """
+        Move pipes, retire off-screen ones and spawn new ones
+
+        Returns: int - number of pipes the bird passed this tick
+        """
+        passed = 0
+        for pipe in self.pipes:
+            pipe.update()
+
+            # Check if bird passed pipe (for scoring)
+            if pipe.is_bird_passed(bird_x):
+                pipe.passed = True
+                passed += 1
+
+        # Retire off-screen pipes back to the pool
+        while self.pipes and self.pipes[0].is_off_screen():
+            self.pool.append(self.pipes.popleft())
+
+        # Spawn new pipes
+        self.spawn_timer += 1
+        if self.spawn_timer >= PIPE_SPAWN_DELAY:
+            self.spawn(SCREEN_WIDTH)
+            self.spawn_timer = 0
+
+        return passed
+
+    def collision(self, bird):
+        """
+        Check the bird against the ground and every pipe
+
+        Returns: str - 'ground', 'pipe_top' or 'pipe_bottom', or None
+        """
+        # Check ground collision
+        if bird.y + bird.radius >= SCREEN_HEIGHT:
+            return 'ground'
+
+        # Check pipe collisions
+        bird_rect = bird.get_rect()
+        for pipe in self.pipes:
+            top_rect, bottom_rect = pipe.get_collision_rects()
+            if bird_rect.colliderect(top_rect):
+                return 'pipe_top'
+            if bird_rect.colliderect(bottom_rect):
+                return 'pipe_bottom'
+        return None
+
 class ScoreManager:
-    def __init__(self):
+    def __init__(self, store=None):
         """Initialize score management"""
+        self.store = store if store is not None else self.open_store()
         self.score = 0
         self.high_score = self.load_high_score()
         self.font = pygame.font.Font(None, FONT_SIZE)
         self.title_font = pygame.font.Font(None, TITLE_FONT_SIZE)
 
-    def load_high_score(self):
-        """Load high score from file"""
+        # Current session stats
+        self.session_start = None
+        self.gesture_flaps = 0
+        self.keyboard_flaps = 0
+        self.input_flaps = 0
+
+    def open_store(self):
+        """Open the default score store, or run without one if it fails"""
         try:
-            with open('high_score.txt', 'r') as f:
-                return int(f.read())
-        except:
-            return 0
+            store = ScoreStore()
+            store.import_legacy_high_score()
+            return store
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: scores will not be saved - {e}")
+            return None
 
-    def save_high_score(self):
-        """Save high score to file"""
+    def load_high_score(self):
+        """Load high score from the score store"""
+        if self.store is None:
+            return 0
         try:
-            with open('high_score.txt', 'w') as f:
-                f.write(str(self.high_score))
-        except:
-            pass
+            return self.store.high_score()
+        except sqlite3.Error as e:
+            print(f"Warning: could not load high score - {e}")
+            return 0
 
     def update_score(self):
         """Increment score by 1"""
@@ -186,9 +300,46 @@ class ScoreManager:
             self.high_score = self.score
 
     def reset_score(self):
-        """Reset current score"""
-        self.save_high_score()
+        """Reset current score and start a new session"""
+        self.end_session()
         self.score = 0
+        self.session_start = time.time()
+        self.gesture_flaps = 0
+        self.keyboard_flaps = 0
+        self.input_flaps = 0
+
+    def record_flap(self, source):
+        """
+        Count a flap for the current session: 'gesture', 'keyboard', or the
+        name of a replacement input source (script, autopilot), which is
+        kept out of the player's gesture and keyboard counts
+        """
+        if source == 'gesture':
+            self.gesture_flaps += 1
+        elif source == 'keyboard':
+            self.keyboard_flaps += 1
+        else:
+            self.input_flaps += 1
+
+    def end_session(self):
+        """Queue the current session for saving (no-op if none is running)"""
+        if self.session_start is None:
+            return
+        if self.store is not None:
+            self.store.record(
+                self.score,
+                time.time() - self.session_start,
+                gesture_flaps=self.gesture_flaps,
+                keyboard_flaps=self.keyboard_flaps,
+                started_at=self.session_start
+            )
+        self.session_start = None
+
+    def close(self):
+        """Save the running session and flush pending writes"""
+        self.end_session()
+        if self.store is not None:
+            self.store.close()
 
     def draw_score(self, screen):
         """Draw current score on screen"""
@@ -241,6 +392,8 @@ class ScoreManager:
         screen.blit(restart_text, restart_rect)
 
 class Background:
+    __slots__ = ('x1', 'x2', 'speed')
+
     def __init__(self):
         """Initialize scrolling background"""
         self.x1 = 0
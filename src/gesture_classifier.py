@@ -0,0 +1,178 @@
+"""
+Gesture Classifier Module
+Rule-based and learned (NumPy-only) classifiers over hand landmarks
+"""
+
+import numpy as np
+from config import *
+
+class GestureRules:
+    """Pixel-coordinate heuristics; assume a right hand with fingers up"""
+
+    def count_fingers(self, landmarks):
+        """
+        Count the number of raised fingers
+        Returns: int - number of fingers up (0-5)
+        """
+        if len(landmarks) < 21:
+            return 0
+
+        fingers_up = 0
+
+        # Thumb (compare x coordinates for left/right)
+        if landmarks[FINGER_TIPS[0]][0] > landmarks[FINGER_PIPS[0]][0]:
+            fingers_up += 1
+
+        # Other fingers (compare y coordinates)
+        for i in range(1, 5):
+            if landmarks[FINGER_TIPS[i]][1] < landmarks[FINGER_PIPS[i]][1]:
+                fingers_up += 1
+
+        return fingers_up
+
+    def detect_peace_sign(self, landmarks):
+        """
+        Detect peace sign (index and middle finger up, others down)
+        Returns: bool - True if peace sign detected
+        """
+        if len(landmarks) < 21:
+            return False
+
+        # Check if index and middle fingers are up
+        index_up = landmarks[FINGER_TIPS[1]][1] < landmarks[FINGER_PIPS[1]][1]
+        middle_up = landmarks[FINGER_TIPS[2]][1] < landmarks[FINGER_PIPS[2]][1]
+
+        # Check if ring and pinky are down
+        ring_down = landmarks[FINGER_TIPS[3]][1] > landmarks[FINGER_PIPS[3]][1]
+        pinky_down = landmarks[FINGER_TIPS[4]][1] > landmarks[FINGER_PIPS[4]][1]
+
+        return index_up and middle_up and ring_down and pinky_down
+
+    def detect_thumbs_up(self, landmarks):
+        """
+        Detect thumbs up gesture
+        Returns: bool - True if thumbs up detected
+        """
+        if len(landmarks) < 21:
+            return False
+
+        # Thumb should be up (x coordinate comparison)
+        thumb_up = landmarks[FINGER_TIPS[0]][0] > landmarks[FINGER_PIPS[0]][0]
+
+        # Other fingers should be down
+        fingers_down = all(
+            landmarks[FINGER_TIPS[i]][1] > landmarks[FINGER_PIPS[i]][1]
+            for i in range(1, 5)
+        )
+
+        return thumb_up and fingers_down
+
+    def detect_fist(self, landmarks):
+        """
+        Detect closed fist
+        Returns: bool - True if fist detected
+        """
+        if len(landmarks) < 21:
+            return False
+
+        # All fingers should be down
+        fingers_down = all(
+            landmarks[FINGER_TIPS[i]][1] > landmarks[FINGER_PIPS[i]][1]
+            for i in range(1, 5)
+        )
+
+        # Thumb should be down too
+        thumb_down = landmarks[FINGER_TIPS[0]][0] < landmarks[FINGER_PIPS[0]][0]
+
+        return fingers_down and thumb_down
+
+class HeuristicClassifier(GestureRules):
+    def __init__(self, min_fingers=MIN_FINGERS_FOR_FLAP):
+        """
+        Args:
+            min_fingers: raised fingers needed for an 'open' hand
+        """
+        self.min_fingers = min_fingers
+
+    def classify(self, landmarks):
+        """
+        Classify landmarks with the rule heuristics
+        Returns: str - one of 'peace', 'thumbs_up', 'fist', 'open', 'none'
+        """
+        if self.detect_peace_sign(landmarks):
+            return 'peace'
+        if self.detect_thumbs_up(landmarks):
+            return 'thumbs_up'
+        if self.detect_fist(landmarks):
+            return 'fist'
+        if self.count_fingers(landmarks) >= self.min_fingers:
+            return 'open'
+        return 'none'
+
+def landmark_features(landmarks):
+    """
+    Normalized, rotation- and handedness-invariant landmark features
+
+    The hand is translated to the wrist, scaled by the wrist to middle
+    knuckle distance, rotated so that vector points up and mirrored so the
+    thumb is always on the same side.
+
+    Returns: float array of length 40 (landmarks 1-20, x and y)
+    """
+    points = np.asarray(landmarks, dtype=np.float64)[:21, :2]
+    points = points[1:] - points[0]
+    axis = points[HAND_LANDMARKS['MIDDLE_MCP'] - 1]
+    length = np.hypot(axis[0], axis[1]) or 1.0
+    # Rotate the (wrist -> middle knuckle) axis onto (0, -1) and scale to 1
+    ax, ay = axis / (length * length)
+    points = points @ np.array([[-ay, -ax], [ax, -ay]])
+    if points[0, 0] < 0:  # thumb base on the left: left hand, mirror it
+        points[:, 0] = -points[:, 0]
+    return points.ravel()
+
+class CentroidClassifier:
+    def __init__(self, labels=(), centroids=None, mean=None, scale=None):
+        """Nearest-centroid classifier over standardized landmark features"""
+        self.labels = list(labels)
+        self.centroids = centroids
+        self.mean = mean
+        self.scale = scale
+
+    def fit(self, landmarks, labels):
+        """Learn one centroid per label from (N, 21, 2) landmarks"""
+        features = np.array([landmark_features(lm) for lm in landmarks])
+        labels = np.asarray(labels)
+        self.mean = features.mean(axis=0)
+        self.scale = features.std(axis=0) + 1e-6
+        standardized = (features - self.mean) / self.scale
+        self.labels = sorted(set(labels.tolist()))
+        self.centroids = np.array([
+            standardized[labels == label].mean(axis=0) for label in self.labels
+        ])
+        return self
+
+    def classify(self, landmarks):
+        """
+        Classify one hand
+        Returns: str - the label of the nearest centroid
+        """
+        features = (landmark_features(landmarks) - self.mean) / self.scale
+        diff = self.centroids - features
+        return self.labels[int(np.argmin(np.einsum('ij,ij->i', diff, diff)))]
+
+    def save(self, path):
+        """Save the model as .npz"""
+        np.savez(path, labels=np.array(self.labels), centroids=self.centroids,
+                 mean=self.mean, scale=self.scale)
+
+    @classmethod
+    def load(cls, path):
+        """Load a model saved with save()"""
+        with np.load(path) as f:
+            return cls(f['labels'].tolist(), f['centroids'], f['mean'], f['scale'])
+
+def load_classifier(model_path=GESTURE_MODEL_PATH):
+    """Classifier configured in config.py (heuristics if no model is set)"""
+    if model_path:
+        return CentroidClassifier.load(model_path)
+    return HeuristicClassifier()
@@ -7,39 +7,51 @@ import cv2
 import mediapipe as mp
 import numpy as np
 from config import *
+from gesture_classifier import GestureRules, load_classifier
 
-class HandGestureDetector:
-    def __init__(self):
-        """Initialize MediaPipe hand detection"""
+class HandGestureDetector(GestureRules):
+    def __init__(self, model_complexity=MODEL_COMPLEXITY, classifier=None,
+                 min_detection_confidence=MIN_DETECTION_CONFIDENCE,
+                 min_tracking_confidence=MIN_TRACKING_CONFIDENCE):
+        """
+        Initialize MediaPipe hand detection
+
+        Args:
+            model_complexity: MediaPipe hands model (0 = lite, 1 = full)
+            classifier: object with classify(landmarks) -> gesture label;
+                defaults to load_classifier() (see GESTURE_MODEL_PATH)
+            min_detection_confidence, min_tracking_confidence: MediaPipe
+                thresholds (varied by the parameter sweep)
+        """
+        self.classifier = classifier if classifier is not None else load_classifier()
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
+        self.model_complexity = model_complexity
+        self.min_detection_confidence = min_detection_confidence
+        self.min_tracking_confidence = min_tracking_confidence
+        self.hands = self.create_hands()
+        self.mp_draw = mp.solutions.drawing_utils
+
+    def create_hands(self):
+        """Create the MediaPipe Hands solution for the current settings"""
+        return self.mp_hands.Hands(
             static_image_mode=False,
             max_num_hands=1,
-            min_detection_confidence=MIN_DETECTION_CONFIDENCE,
-            min_tracking_confidence=MIN_TRACKING_CONFIDENCE
+            model_complexity=self.model_complexity,
+            min_detection_confidence=self.min_detection_confidence,
+            min_tracking_confidence=self.min_tracking_confidence
         )
-        self.mp_draw = mp.solutions.drawing_utils
 
-    def count_fingers(self, landmarks):
-        """
-        Count the number of raised fingers
-        Returns: int - number of fingers up (0-5)
-        """
-        if len(landmarks) < 21:
-            return 0
+    def set_model_complexity(self, model_complexity):
+        """Switch MediaPipe model (0 = lite, 1 = full); rebuilds the graph"""
+        if model_complexity == self.model_complexity:
+            return
+        self.model_complexity = model_complexity
+        self.hands.close()
+        self.hands = self.create_hands()
 
-        fingers_up = 0
-
-        # Thumb (compare x coordinates for left/right)
-        if landmarks[FINGER_TIPS[0]][0] > landmarks[FINGER_PIPS[0]][0]:
-            fingers_up += 1
-
-        # Other fingers (compare y coordinates)
-        for i in range(1, 5):
-            if landmarks[FINGER_TIPS[i]][1] < landmarks[FINGER_PIPS[i]][1]:
-                fingers_up += 1
-
-        return fingers_up
+    def close(self):
+        """Release the MediaPipe graph"""
+        self.hands.close()
 
     def get_hand_center(self, landmarks):
         """
@@ -58,68 +70,14 @@ class HandGestureDetector:
 
         return (center_x, center_y)
 
-    def detect_peace_sign(self, landmarks):
-        """
-        Detect peace sign (index and middle finger up, others down)
-        Returns: bool - True if peace sign detected
-        """
-        if len(landmarks) < 21:
-            return False
-
-        # Check if index and middle fingers are up
-        index_up = landmarks[FINGER_TIPS[1]][1] < landmarks[FINGER_PIPS[1]][1]
-        middle_up = landmarks[FINGER_TIPS[2]][1] < landmarks[FINGER_PIPS[2]][1]
-
-        # Check if ring and pinky are down
-        ring_down = landmarks[FINGER_TIPS[3]][1] > landmarks[FINGER_PIPS[3]][1]
-        pinky_down = landmarks[FINGER_TIPS[4]][1] > landmarks[FINGER_PIPS[4]][1]
-
-        return index_up and middle_up and ring_down and pinky_down
-
-    def detect_thumbs_up(self, landmarks):
-        """
-        Detect thumbs up gesture
-        Returns: bool - True if thumbs up detected
-        """
-        if len(landmarks) < 21:
-            return False
-
-        # Thumb should be up (x coordinate comparison)
-        thumb_up = landmarks[FINGER_TIPS[0]][0] > landmarks[FINGER_PIPS[0]][0]
-
-        # Other fingers should be down
-        fingers_down = all(
-            landmarks[FINGER_TIPS[i]][1] > landmarks[FINGER_PIPS[i]][1]
-            for i in range(1, 5)
-        )
-
-        return thumb_up and fingers_down
-
-    def detect_fist(self, landmarks):
-        """
-        Detect closed fist
-        Returns: bool - True if fist detected
-        """
-        if len(landmarks) < 21:
-            return False
-
-        # All fingers should be down
-        fingers_down = all(
-            landmarks[FINGER_TIPS[i]][1] > landmarks[FINGER_PIPS[i]][1]
-            for i in range(1, 5)
-        )
-
-        # Thumb should be down too
-        thumb_down = landmarks[FINGER_TIPS[0]][0] < landmarks[FINGER_PIPS[0]][0]
-
-        return fingers_down and thumb_down
-
-    def process_frame(self, frame):
+    def process_frame(self, frame, annotate=True):
         """
         Process camera frame and detect hand gestures
 
         Args:
-            frame: OpenCV frame from camera
+            frame: OpenCV frame from camera; never modified, so it may be a
+                read-only frame shared with other consumers
+            annotate: draw landmarks and gesture info on a copy of the frame
 
         Returns:
             dict: {
@@ -127,24 +85,33 @@ class HandGestureDetector:
                 'hand_position': tuple or None,
                 'fingers_count': int,
                 'gesture': str,
-                'frame': processed frame with landmarks
+                'landmarks': list of [x, y] pixel coordinates or None,
+                'confidence': float - MediaPipe hand detection score,
+                'frame': annotated copy, or the input frame if not annotating
             }
         """
+        output = frame.copy() if annotate else frame
         frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         results = self.hands.process(frame_rgb)
 
         # Default return values
         should_flap = False
         hand_position = None
+        confidence = 0.0
         fingers_count = 0
         gesture = "none"
+        landmarks = None
 
         if results.multi_hand_landmarks:
+            if results.multi_handedness:
+                confidence = results.multi_handedness[0].classification[0].score
+
             for hand_landmarks in results.multi_hand_landmarks:
                 # Draw landmarks on frame
-                self.mp_draw.draw_landmarks(
-                    frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS
-                )
+                if annotate:
+                    self.mp_draw.draw_landmarks(
+                        output, hand_landmarks, self.mp_hands.HAND_CONNECTIONS
+                    )
 
                 # Extract landmark coordinates
                 landmarks = []
@@ -160,23 +127,16 @@ class HandGestureDetector:
                     # Get hand position
                     hand_position = self.get_hand_center(landmarks)
 
-                    # Detect specific gestures
-                    if self.detect_peace_sign(landmarks):
-                        gesture = "peace"
-                        should_flap = True
-                    elif self.detect_thumbs_up(landmarks):
-                        gesture = "thumbs_up"
-                        should_flap = True
-                    elif self.detect_fist(landmarks):
-                        gesture = "fist"
-                    elif fingers_count >= MIN_FINGERS_FOR_FLAP:
+                    # Classify the gesture
+                    gesture = self.classifier.classify(landmarks)
+                    should_flap = gesture in FLAP_GESTURES
+                    if gesture == 'open':
                         gesture = f"{fingers_count}_fingers"
-                        should_flap = True
 
                     # Draw gesture info on frame
-                    if hand_position:
+                    if annotate and hand_position:
                         cv2.putText(
-                            frame, 
+                            output, 
                             f"Fingers: {fingers_count}", 
                             (10, 30), 
                             cv2.FONT_HERSHEY_SIMPLEX, 
@@ -185,7 +145,7 @@ class HandGestureDetector:
                             2
                         )
                         cv2.putText(
-                            frame, 
+                            output, 
                             f"Gesture: {gesture}", 
                             (10, 70), 
                             cv2.FONT_HERSHEY_SIMPLEX, 
@@ -195,12 +155,14 @@ class HandGestureDetector:
                         )
 
                         # Draw hand center
-                        cv2.circle(frame, hand_position, 10, (255, 255, 0), -1)
+                        cv2.circle(output, hand_position, 10, (255, 255, 0), -1)
 
         return {
             'should_flap': should_flap,
             'hand_position': hand_position,
             'fingers_count': fingers_count,
             'gesture': gesture,
-            'frame': frame
+            'landmarks': landmarks,
+            'confidence': confidence,
+            'frame': output
         }
\ No newline at end of file
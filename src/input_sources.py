@@ -0,0 +1,86 @@
+"""
+Input Sources Module
+Inputs that can drive the game instead of the camera, e.g. for headless
+turbo runs and tests
+"""
+
+import json
+import random
+
+import pygame
+
+KEYS = {
+    'space': pygame.K_SPACE,
+    'r': pygame.K_r,
+    'p': pygame.K_p,
+    'q': pygame.K_q,
+    'escape': pygame.K_ESCAPE,
+}
+
+class ScriptedInput:
+    name = 'script'
+
+    def __init__(self, script=()):
+        """
+        Replay a fixed input script
+
+        Args:
+            script: iterable of (tick, action) pairs; action is 'flap' (a
+                gesture flap) or a key name from KEYS, pressed on that tick
+        """
+        self.actions = {}
+        for tick, action in script:
+            if action != 'flap' and action not in KEYS:
+                raise ValueError(f"Unknown scripted action: {action}")
+            self.actions.setdefault(int(tick), []).append(action)
+        self.flap = False
+
+    @classmethod
+    def load(cls, path):
+        """Load a script saved as a JSON list of [tick, action] pairs"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def save(self, path):
+        """Save the script as a JSON list of [tick, action] pairs"""
+        script = [
+            [tick, action]
+            for tick in sorted(self.actions)
+            for action in self.actions[tick]
+        ]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(script, f)
+
+    def begin_tick(self, tick):
+        """Post this tick's key presses and arm its gesture flap"""
+        actions = self.actions.get(tick, ())
+        for action in actions:
+            if action != 'flap':
+                pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=KEYS[action]))
+        self.flap = 'flap' in actions
+
+    def poll(self, game):
+        """Returns: bool - True if the script flaps on the current tick"""
+        flap, self.flap = self.flap, False
+        return flap
+
+class RandomInput:
+    name = 'random'
+
+    def __init__(self, seed=0, flap_chance=1 / 20):
+        """
+        Synthetic input: flap on a random tick with the given chance
+
+        Args:
+            seed: seed for the input sequence, so runs are reproducible
+            flap_chance: probability of a gesture flap on each tick
+        """
+        self.rng = random.Random(seed)
+        self.flap_chance = flap_chance
+
+    def begin_tick(self, tick):
+        pass
+
+    def poll(self, game):
+        """Returns: bool - True to flap this tick"""
+        return self.rng.random() < self.flap_chance
@@ -0,0 +1,194 @@
+"""
+Landmark Data Module
+Load/save recorded hand landmark datasets and generate synthetic hands
+"""
+
+import os
+
+import numpy as np
+
+GESTURE_LABELS = ['open', 'peace', 'thumbs_up', 'fist', 'none']
+
+def save_landmarks(path, landmarks, labels=None, timestamps=None):
+    """
+    Save a landmark recording as .npz
+
+    Args:
+        landmarks: array-like (N, 21, 2) of pixel coordinates
+        labels: optional sequence of N gesture labels
+        timestamps: optional sequence of N capture times in seconds
+    """
+    data = {'landmarks': np.asarray(landmarks, dtype=np.float32)}
+    if labels is not None:
+        data['labels'] = np.asarray(labels, dtype=str)
+    if timestamps is not None:
+        data['timestamps'] = np.asarray(timestamps, dtype=np.float64)
+    np.savez_compressed(path, **data)
+
+def load_landmarks(*paths):
+    """
+    Load and concatenate one or more landmark recordings
+
+    Returns: dict with 'landmarks' (N, 21, 2) and, when every file has
+    them, 'labels' (N,) and 'timestamps' (N,)
+    """
+    parts = []
+    for path in paths:
+        with np.load(path) as f:
+            parts.append({key: f[key] for key in f.files})
+
+    data = {'landmarks': np.concatenate([p['landmarks'][:, :, :2] for p in parts])}
+    for key in ('labels', 'timestamps'):
+        if all(key in p for p in parts):
+            data[key] = np.concatenate([p[key] for p in parts])
+    return data
+
+def save_session(path, landmarks, labels, timestamps, video=None, confidence=None):
+    """
+    Save a continuous play session (every frame, hand or not) as .npz
+
+    Args:
+        landmarks: (N, 21, 2) pixel coordinates, NaN where no hand was found
+        labels: N intended gestures ('none' when not gesturing)
+        timestamps: N capture times in seconds
+        video: optional file name (next to path) of the raw frames, which
+            allows re-running hand detection with other settings
+        confidence: (min_detection, min_tracking) confidence the landmarks
+            were detected with
+    """
+    data = {
+        'landmarks': np.asarray(landmarks, dtype=np.float32),
+        'labels': np.asarray(labels, dtype=str),
+        'timestamps': np.asarray(timestamps, dtype=np.float64),
+    }
+    if video is not None:
+        data['video'] = np.asarray(video)
+    if confidence is not None:
+        data['confidence'] = np.asarray(confidence, dtype=np.float64)
+    np.savez_compressed(path, **data)
+
+def load_session(path):
+    """
+    Load a session saved by save_session
+
+    Returns: dict with 'landmarks', 'labels', 'timestamps', and 'video' (an
+    absolute path, or None) and 'confidence' (tuple, or None)
+    """
+    with np.load(path) as f:
+        session = {key: f[key] for key in ('landmarks', 'labels', 'timestamps')}
+        video = str(f['video']) if 'video' in f.files else None
+        session['video'] = (os.path.join(os.path.dirname(os.path.abspath(path)), video)
+                            if video else None)
+        session['confidence'] = tuple(f['confidence']) if 'confidence' in f.files else None
+    return session
+
+# Canonical right hand, fingers pointing up (image y grows downwards),
+# wrist at the origin and wrist-to-middle-knuckle length of 1
+_FINGER_MCPS = {
+    'index': (0.30, -0.95),
+    'middle': (0.05, -1.00),
+    'ring': (-0.20, -0.95),
+    'pinky': (-0.42, -0.85),
+}
+_FINGER_SEGMENTS = {
+    'index': (0.42, 0.26, 0.22),
+    'middle': (0.46, 0.30, 0.24),
+    'ring': (0.42, 0.28, 0.22),
+    'pinky': (0.32, 0.22, 0.18),
+}
+_FINGER_SPLAY = {'index': 0.12, 'middle': 0.0, 'ring': -0.1, 'pinky': -0.22}
+
+# Which fingers (thumb, index, middle, ring, pinky) are extended per gesture
+_GESTURE_FINGERS = {
+    'open': (True, True, True, True, True),
+    'peace': (False, True, True, False, False),
+    'thumbs_up': (True, False, False, False, False),
+    'fist': (False, False, False, False, False),
+    'none': (False, True, False, False, False),
+}
+
+def _finger_points(name, extended):
+    """PIP, DIP and tip for one finger in the canonical hand"""
+    mx, my = _FINGER_MCPS[name]
+    a, b, c = _FINGER_SEGMENTS[name]
+    if extended:
+        dx, dy = np.sin(_FINGER_SPLAY[name]), -np.cos(_FINGER_SPLAY[name])
+        return [(mx + dx * a, my + dy * a),
+                (mx + dx * (a + b), my + dy * (a + b)),
+                (mx + dx * (a + b + c), my + dy * (a + b + c))]
+    # Curled: the tip folds back below the PIP joint, towards the palm
+    return [(mx, my - a * 0.8), (mx, my - a * 0.8 + b * 0.7), (mx, my - a * 0.2)]
+
+def canonical_hand(gesture):
+    """Returns: (21, 2) array for a gesture in the canonical pose"""
+    thumb, *fingers = _GESTURE_FINGERS[gesture]
+    points = [(0.0, 0.0), (0.25, -0.25), (0.45, -0.45)]
+    if thumb:
+        points += [(0.65, -0.60), (0.85, -0.72)]
+    else:
+        points += [(0.50, -0.70), (0.20, -0.80)]
+    for name, extended in zip(('index', 'middle', 'ring', 'pinky'), fingers):
+        points.append(_FINGER_MCPS[name])
+        points += _finger_points(name, extended)
+    return np.array(points)
+
+def synthetic_hand(gesture, rng, max_rotation=np.pi / 3, mirror_chance=0.5,
+                   noise=0.03):
+    """
+    One synthetic hand in pixel coordinates: the canonical pose with
+    random rotation, mirroring (left hand), scale, position and jitter
+    """
+    points = canonical_hand(gesture)
+    points = points + rng.normal(0.0, noise, points.shape)
+    if rng.random() < mirror_chance:
+        points[:, 0] = -points[:, 0]
+    angle = rng.uniform(-max_rotation, max_rotation)
+    cos, sin = np.cos(angle), np.sin(angle)
+    points = points @ np.array([[cos, sin], [-sin, cos]])
+    scale = rng.uniform(60, 160)
+    offset = rng.uniform((160, 240), (480, 360))
+    return points * scale + offset
+
+def synthetic_dataset(count, seed=0, **kwargs):
+    """
+    Returns: dict with 'landmarks' (count, 21, 2) and 'labels' (count,)
+    drawn evenly from GESTURE_LABELS
+    """
+    rng = np.random.default_rng(seed)
+    labels = [GESTURE_LABELS[i % len(GESTURE_LABELS)] for i in range(count)]
+    landmarks = np.array([synthetic_hand(label, rng, **kwargs) for label in labels])
+    return {'landmarks': landmarks, 'labels': np.array(labels)}
+
+def synthetic_session(seconds=60.0, fps=30.0, seed=0, miss_chance=0.05):
+    """
+    A synthetic play session: upright hands switching between flap
+    gestures and non-flap poses, with short gaps where no hand is found
+
+    Returns: dict like load_session (no video)
+    """
+    rng = np.random.default_rng(seed)
+    count = int(seconds * fps)
+    timestamps = np.arange(count) / fps + rng.normal(0, 0.002, count)
+    landmarks = np.full((count, 21, 2), np.nan, dtype=np.float32)
+    labels = []
+
+    i = 0
+    while i < count:
+        gesture = rng.choice(['open', 'peace', 'thumbs_up', 'fist', 'none', 'hidden'],
+                             p=[0.2, 0.15, 0.1, 0.2, 0.25, 0.1])
+        length = int(rng.uniform(0.3, 1.5) * fps)
+        for j in range(i, min(count, i + length)):
+            labels.append('none' if gesture in ('hidden', 'fist') else gesture)
+            if gesture != 'hidden' and rng.random() > miss_chance:
+                landmarks[j] = synthetic_hand(
+                    gesture, rng, max_rotation=0.3, mirror_chance=0.0, noise=0.06
+                )
+        i += length
+
+    return {
+        'landmarks': landmarks,
+        'labels': np.array(labels[:count]),
+        'timestamps': timestamps,
+        'video': None,
+        'confidence': None,
+    }
@@ -0,0 +1,436 @@
+"""
+Netplay Module
+Two-player head-to-head on the same seeded pipe course, with rollback
+netcode: only per-tick flap inputs cross the network (UDP), remote inputs
+are predicted, and a late input that contradicts the prediction rolls the
+game back to a snapshot and re-simulates up to the present tick.
+"""
+
+import heapq
+import random
+import select
+import socket
+import struct
+import threading
+import time
+import zlib
+
+import pygame
+from config import *
+from game_objects import Bird, Pipe
+
+class VersusSim:
+    """
+    Deterministic two-bird simulation
+
+    The pipe course is a pure function of the seed and the tick, so a
+    snapshot only needs the tick and each bird's state.
+    """
+    STATE = struct.Struct('<I' + 'ddBH' * 2)
+
+    def __init__(self, seed=NET_COURSE_SEED):
+        self.seed = seed
+        self.birds = [Bird(), Bird()]
+        self.alive = [True, True]
+        self.scores = [0, 0]
+        self.tick = 0
+        self._gaps = []
+
+    def gap_start(self, n):
+        """Top of pipe n's gap; identical on every machine for a seed"""
+        while len(self._gaps) <= n:
+            rng = random.Random(f"{self.seed}:{len(self._gaps)}")
+            self._gaps.append(rng.randint(PIPE_MIN_HEIGHT, PIPE_MAX_HEIGHT))
+        return self._gaps[n]
+
+    def pipe_x(self, n, tick):
+        """x of pipe n at a tick, matching PipeManager's spawn schedule"""
+        if n == 0:
+            return SCREEN_WIDTH + 200 - PIPE_SPEED * tick
+        return SCREEN_WIDTH - PIPE_SPEED * (tick - n * PIPE_SPAWN_DELAY)
+
+    def pipes(self, tick=None):
+        """Returns: list of (pipe number, x, gap_start) on screen at a tick"""
+        tick = self.tick if tick is None else tick
+        horizon = (SCREEN_WIDTH + 200 + PIPE_WIDTH) // PIPE_SPEED
+        first = max(0, (tick - horizon) // PIPE_SPAWN_DELAY)
+        pipes = []
+        for n in range(first, tick // PIPE_SPAWN_DELAY + 1):
+            x = self.pipe_x(n, tick)
+            if x + PIPE_WIDTH >= 0:
+                pipes.append((n, x, self.gap_start(n)))
+        return pipes
+
+    def step(self, flaps):
+        """Advance one tick; flaps is (player 0 flapped, player 1 flapped)"""
+        for i, bird in enumerate(self.birds):
+            if self.alive[i]:
+                bird.update(flaps[i])
+        self.tick += 1
+
+        pipes = self.pipes()
+        for i, bird in enumerate(self.birds):
+            if not self.alive[i]:
+                continue
+            bird_rect = bird.get_rect()
+            if bird.y + bird.radius >= SCREEN_HEIGHT:
+                self.alive[i] = False
+                continue
+            for n, x, gap_start in pipes:
+                top = pygame.Rect(x, 0, PIPE_WIDTH, gap_start)
+                bottom = pygame.Rect(x, gap_start + PIPE_GAP, PIPE_WIDTH,
+                                     SCREEN_HEIGHT - gap_start - PIPE_GAP)
+                if bird_rect.colliderect(top) or bird_rect.colliderect(bottom):
+                    self.alive[i] = False
+                    break
+                if x + PIPE_WIDTH < bird.x <= x + PIPE_WIDTH + PIPE_SPEED:
+                    self.scores[i] += 1
+
+    @property
+    def over(self):
+        return not any(self.alive)
+
+    def save(self):
+        """Compact snapshot (bytes)"""
+        (a, b) = self.birds
+        return self.STATE.pack(
+            self.tick,
+            a.y, a.velocity, self.alive[0], self.scores[0],
+            b.y, b.velocity, self.alive[1], self.scores[1]
+        )
+
+    def load(self, snapshot):
+        """Restore a snapshot taken by save()"""
+        (self.tick,
+         y0, v0, alive0, self.scores[0],
+         y1, v1, alive1, self.scores[1]) = self.STATE.unpack(snapshot)
+        self.birds[0].y, self.birds[0].velocity = y0, v0
+        self.birds[1].y, self.birds[1].velocity = y1, v1
+        self.alive = [bool(alive0), bool(alive1)]
+
+    def checksum(self):
+        return zlib.crc32(self.save())
+
+class UdpTransport:
+    """Non-blocking UDP socket talking to one address (the relay or the peer)"""
+
+    def __init__(self, remote_address, bind_address=('127.0.0.1', 0)):
+        self.remote_address = remote_address
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(bind_address)
+        self.sock.setblocking(False)
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def send(self, data):
+        try:
+            self.sock.sendto(data, self.remote_address)
+            self.bytes_sent += len(data)
+        except OSError:
+            pass  # the network is allowed to drop packets
+
+    def receive(self):
+        """Returns: list of every datagram waiting on the socket"""
+        packets = []
+        while True:
+            try:
+                data, _ = self.sock.recvfrom(2048)
+            except (BlockingIOError, ConnectionResetError):
+                return packets
+            self.bytes_received += len(data)
+            packets.append(data)
+
+    def close(self):
+        self.sock.close()
+
+class RelayServer:
+    """
+    UDP relay joining two cabinets (players 0 and 1)
+
+    Each datagram's second byte names the sending player; it is forwarded to
+    the other player's last known address. For tests it can add latency,
+    jitter and packet loss.
+    """
+
+    def __init__(self, port=0, host='127.0.0.1', delay=0.0, jitter=0.0, loss=0.0,
+                 seed=0):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind((host, port))
+        self.address = self.sock.getsockname()
+        self.delay = delay
+        self.jitter = jitter
+        self.loss = loss
+        self.rng = random.Random(seed)
+        self.peers = {}
+        self.forwarded = 0
+        self.dropped = 0
+        self.running = False
+        self._thread = None
+
+    def start(self):
+        self.running = True
+        self._thread = threading.Thread(target=self._run, name="netplay-relay", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        pending = []  # heap of (due time, sequence, data, player)
+        sequence = 0
+        while self.running:
+            timeout = 0.05
+            if pending:
+                timeout = max(0.0, min(timeout, pending[0][0] - time.perf_counter()))
+            readable, _, _ = select.select([self.sock], [], [], timeout)
+            if readable:
+                try:
+                    data, address = self.sock.recvfrom(2048)
+                except OSError:
+                    continue
+                if len(data) < 2:
+                    continue
+                player = data[1]
+                self.peers[player] = address
+                if self.rng.random() < self.loss:
+                    self.dropped += 1
+                    continue
+                due = time.perf_counter() + self.delay + self.rng.uniform(0, self.jitter)
+                heapq.heappush(pending, (due, sequence, data, 1 - player))
+                sequence += 1
+
+            now = time.perf_counter()
+            while pending and pending[0][0] <= now:
+                _, _, data, target = heapq.heappop(pending)
+                if target in self.peers:
+                    self.sock.sendto(data, self.peers[target])
+                    self.forwarded += 1
+
+    def stop(self):
+        self.running = False
+        if self._thread:
+            self._thread.join(timeout=1.0)
+        self.sock.close()
+
+class RollbackSession:
+    """
+    One player's side of a versus match
+
+    Every tick: read the peer's inputs, roll back if one of them contradicts
+    what we predicted, simulate the tick with our input and a prediction
+    for the peer's, and send our recent unacknowledged inputs.
+
+    Packet: kind, player, ack (last of the peer's ticks we have), first
+    tick, count, then one bit per tick. Inputs are resent until the peer
+    acknowledges them, so lost packets need no retransmission timer.
+    """
+    HEADER = struct.Struct('<BBiiB')
+    INPUTS = 1
+
+    def __init__(self, sim, player, transport, input_delay=NET_INPUT_DELAY,
+                 max_rollback=NET_MAX_ROLLBACK):
+        self.sim = sim
+        self.player = player
+        self.transport = transport
+        self.input_delay = input_delay
+        self.max_rollback = max_rollback
+
+        self.local = {t: False for t in range(input_delay)}
+        self.remote = {}
+        self.predicted = {}
+        self.snapshots = {}
+        self.remote_confirmed = -1  # peer inputs known for every tick up to here
+        self.remote_acked = -1  # our inputs the peer has for every tick up to here
+        self.rollback_to = None
+
+        self.started = time.perf_counter()
+        self.ticks = 0
+        self.stalls = 0
+        self.rollbacks = 0
+        self.rollback_depths = []
+        self.resim_ticks = 0
+        self.resim_seconds = 0.0
+
+    def predict(self, tick):
+        """
+        Guess the peer's input for a tick we have not heard about yet
+
+        Flaps are one-tick impulses spaced by FLAP_COOLDOWN, so "no flap"
+        is right almost every tick and only actual flaps cause rollbacks.
+        """
+        return False
+
+    def inputs(self, tick):
+        """Both players' inputs for a tick (peer's confirmed or predicted)"""
+        local = self.local.get(tick, False)
+        if tick in self.remote:
+            remote = self.remote[tick]
+        else:
+            remote = self.predicted[tick] = self.predict(tick)
+        return (local, remote) if self.player == 0 else (remote, local)
+
+    def simulate_tick(self):
+        tick = self.sim.tick
+        self.snapshots[tick] = self.sim.save()
+        self.snapshots.pop(tick - self.max_rollback - 2, None)
+        self.sim.step(self.inputs(tick))
+
+    def advance(self, flap):
+        """
+        Run one tick with the local player's flap
+
+        Returns: bool - False if we stalled waiting for the peer (the peer
+            is more than max_rollback ticks behind)
+        """
+        self.sync()
+        tick = self.sim.tick
+        if tick - self.remote_confirmed > self.max_rollback:
+            self.stalls += 1
+            return False
+
+        self.local[tick + self.input_delay] = bool(flap)
+        self.simulate_tick()
+        self.ticks += 1
+        self.send()
+        return True
+
+    def sync(self):
+        """Read the peer's packets and roll back if we mispredicted"""
+        for packet in self.transport.receive():
+            self.handle_packet(packet)
+        if self.rollback_to is not None:
+            self.rollback(self.rollback_to)
+            self.rollback_to = None
+
+    def rollback(self, to_tick):
+        """Restore the snapshot at to_tick and re-simulate to the present"""
+        start = time.perf_counter()
+        current = self.sim.tick
+        self.sim.load(self.snapshots[to_tick])
+        while self.sim.tick < current:
+            self.simulate_tick()
+        self.resim_seconds += time.perf_counter() - start
+        self.resim_ticks += current - to_tick
+        self.rollbacks += 1
+        self.rollback_depths.append(current - to_tick)
+
+    def handle_packet(self, packet):
+        if len(packet) < self.HEADER.size:
+            return
+        kind, player, ack, first, count = self.HEADER.unpack_from(packet)
+        if kind != self.INPUTS or player == self.player:
+            return
+        self.remote_acked = max(self.remote_acked, ack)
+
+        bits = int.from_bytes(packet[self.HEADER.size:], 'little')
+        for i in range(count):
+            tick = first + i
+            if tick <= self.remote_confirmed or tick in self.remote:
+                continue
+            flap = bool(bits >> i & 1)
+            self.remote[tick] = flap
+            if tick < self.sim.tick and self.predicted.get(tick, False) != flap:
+                if self.rollback_to is None or tick < self.rollback_to:
+                    self.rollback_to = tick
+
+        while self.remote_confirmed + 1 in self.remote:
+            self.remote_confirmed += 1
+        self._forget(min(self.remote_confirmed, self.sim.tick) - self.max_rollback - 2)
+
+    def _forget(self, before):
+        """Drop inputs no rollback can reach any more"""
+        for table in (self.remote, self.predicted):
+            for tick in [t for t in table if t < before]:
+                del table[tick]
+        for tick in [t for t in self.local if t < min(before, self.remote_acked)]:
+            del self.local[tick]
+
+    def send(self):
+        """Send every local input the peer has not acknowledged yet"""
+        first = self.remote_acked + 1
+        last = max(self.local, default=-1)
+        count = min(255, last - first + 1)
+        if count <= 0:
+            return
+        bits = 0
+        for i in range(count):
+            if self.local.get(first + i, False):
+                bits |= 1 << i
+        self.transport.send(
+            self.HEADER.pack(self.INPUTS, self.player, self.remote_confirmed, first, count) +
+            bits.to_bytes((count + 7) // 8, 'little')
+        )
+
+    @property
+    def confirmed(self):
+        """True when every simulated tick used the peer's real input"""
+        return self.remote_confirmed >= self.sim.tick - 1
+
+    def metrics(self):
+        """Returns: dict of rollback depth, re-simulation cost and bandwidth"""
+        elapsed = time.perf_counter() - self.started
+        depths = self.rollback_depths
+        return {
+            'ticks': self.ticks,
+            'stalls': self.stalls,
+            'rollbacks': self.rollbacks,
+            'mean_rollback_depth': sum(depths) / len(depths) if depths else 0.0,
+            'max_rollback_depth': max(depths, default=0),
+            'resim_us_per_tick': (self.resim_seconds / self.resim_ticks * 1e6
+                                  if self.resim_ticks else 0.0),
+            'bytes_sent_per_second': self.transport.bytes_sent / elapsed,
+            'bytes_received_per_second': self.transport.bytes_received / elapsed,
+        }
+
+def run_versus(game, session):
+    """
+    Play a versus match in the game's window
+
+    Flap with SPACE or a gesture; ESC quits. The peer's bird is drawn
+    faded. Returns the session's metrics.
+    """
+    sim = session.sim
+    pipe = Pipe(0)
+    ghost = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+    over_ticks = 0
+
+    while over_ticks < FPS * 3:
+        flap = False
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return session.metrics()
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    return session.metrics()
+                if event.key == pygame.K_SPACE:
+                    flap = True
+        game.poll_camera_setup()
+        if game.camera_available and game.process_hand_gestures():
+            flap = True
+
+        waiting = not session.advance(flap)
+        if sim.over and session.confirmed:
+            over_ticks += 1
+
+        game.background.update()
+        game.background.draw(game.screen)
+        for n, x, gap_start in sim.pipes():
+            pipe.x, pipe.gap_start, pipe.gap_end = x, gap_start, gap_start + PIPE_GAP
+            pipe.draw(game.screen)
+
+        ghost.fill((0, 0, 0, 0))
+        for i, bird in enumerate(sim.birds):
+            bird.draw(game.screen if i == session.player else ghost)
+        ghost.set_alpha(110)
+        game.screen.blit(ghost, (0, 0))
+
+        you, them = sim.scores[session.player], sim.scores[1 - session.player]
+        text = f"You {you}  -  {them} Opponent"
+        if sim.over:
+            text += "   " + ("You win!" if you > them else "Draw" if you == them else "You lose")
+        game.screen.blit(game.font.render(text, True, COLORS['WHITE']), (10, 10))
+        if waiting:
+            notice = game.font.render("Waiting for opponent...", True, COLORS['WHITE'])
+            game.screen.blit(notice, (10, 50))
+        pygame.display.flip()
+        game.clock.tick(FPS)
+
+    return session.metrics()
@@ -0,0 +1,377 @@
+"""
+Parameter Sweep Module
+Replays recorded play sessions offline to tune the gesture settings
+(MIN_DETECTION_CONFIDENCE, MIN_TRACKING_CONFIDENCE, FLAP_COOLDOWN,
+MIN_FINGERS_FOR_FLAP) across a process pool, caching every result on disk
+
+Sessions are replayed from their recorded landmarks; only configurations
+with different MediaPipe confidences need the raw video re-run through
+the hand model, and those landmarks are cached as well.
+"""
+
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+
+import numpy as np
+from config import *
+from gesture_classifier import HeuristicClassifier
+
+PARAMETERS = (
+    'MIN_DETECTION_CONFIDENCE', 'MIN_TRACKING_CONFIDENCE',
+    'FLAP_COOLDOWN', 'MIN_FINGERS_FOR_FLAP',
+)
+
+# Bump when evaluate_session changes, so old cached results are not reused
+SWEEP_VERSION = 1
+
+def default_grid():
+    """Returns: dict with every parameter at its current config value"""
+    return {name: [globals()[name]] for name in PARAMETERS}
+
+def configurations(grid):
+    """Returns: list of dicts, one per point in the grid"""
+    grid = {**default_grid(), **grid}
+    return [dict(zip(PARAMETERS, values))
+            for values in itertools.product(*(grid[name] for name in PARAMETERS))]
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def session_hash(session):
+    """Content hash of a session: landmarks, labels, timing and video"""
+    digest = hashlib.sha256()
+    digest.update(np.ascontiguousarray(session['landmarks'], dtype=np.float32).tobytes())
+    digest.update('\0'.join(map(str, session['labels'])).encode())
+    digest.update(np.ascontiguousarray(session['timestamps'], dtype=np.float64).tobytes())
+    if session.get('video'):
+        digest.update(file_hash(session['video']).encode())
+    return digest.hexdigest()
+
+def flap_frames(landmarks, min_fingers):
+    """
+    Args:
+        landmarks: (N, 21, 2), NaN where no hand was found
+
+    Returns: bool array - frames whose gesture is a flap gesture
+    """
+    classifier = HeuristicClassifier(min_fingers)
+    return np.array([
+        not np.isnan(points[0, 0]) and classifier.classify(points) in FLAP_GESTURES
+        for points in landmarks
+    ], dtype=bool)
+
+def apply_cooldown(times, cooldown_ms):
+    """
+    Flap times left after the cooldown, applied the way
+    apply_flap_cooldown does
+
+    Args:
+        times: times (seconds) of the frames showing a flap gesture
+    """
+    flaps = []
+    last_flap = -np.inf
+    for t in times:
+        if (t - last_flap) * 1000 > cooldown_ms:
+            flaps.append(t)
+            last_flap = t
+    return np.array(flaps)
+
+def intended_flaps(labels, timestamps):
+    """
+    Returns: list of (start, end) times of each run of frames labelled
+    with a flap gesture
+    """
+    wanted = np.isin(labels, FLAP_GESTURES)
+    segments = []
+    start = None
+    for i, flap in enumerate(wanted):
+        if flap and start is None:
+            start = i
+        elif not flap and start is not None:
+            segments.append((timestamps[start], timestamps[i - 1]))
+            start = None
+    if start is not None:
+        segments.append((timestamps[start], timestamps[-1]))
+    return segments
+
+def score_flaps(flaps, segments, grace=SWEEP_MATCH_GRACE):
+    """
+    Match flaps against intended gestures
+
+    A gesture's first flap (from its start until grace seconds after it
+    ends) gives its latency; later flaps in the same window are repeats
+    (a held gesture flaps again after every cooldown). A gesture without a
+    flap is missed; a flap outside every window is false.
+
+    Returns: dict of counts and latencies (ms)
+    """
+    matched = np.zeros(len(flaps), dtype=bool)
+    latencies, missed, repeats = [], 0, 0
+    for start, end in segments:
+        inside = (flaps >= start) & (flaps <= end + grace) & ~matched
+        hits = np.flatnonzero(inside)
+        if len(hits):
+            latencies.append(float((flaps[hits[0]] - start) * 1000))
+            repeats += len(hits) - 1
+            matched[hits] = True
+        else:
+            missed += 1
+    return {
+        'intended': len(segments),
+        'flaps': len(flaps),
+        'false_flaps': int((~matched).sum()),
+        'missed_flaps': missed,
+        'repeat_flaps': repeats,
+        'latencies_ms': latencies,
+    }
+
+def evaluate_session(landmarks, labels, timestamps, min_fingers, cooldown_ms,
+                     grace=SWEEP_MATCH_GRACE):
+    """Score one session at one configuration"""
+    flaps = apply_cooldown(timestamps[flap_frames(landmarks, min_fingers)], cooldown_ms)
+    result = score_flaps(flaps, intended_flaps(labels, timestamps), grace)
+    result['seconds'] = float(timestamps[-1] - timestamps[0]) if len(timestamps) else 0.0
+    return result
+
+def _evaluate_task(task):
+    """
+    Process-pool worker: one session at one finger threshold, for several
+    cooldowns (the classification is shared, the cooldown is cheap)
+
+    Args:
+        task: (keys, landmarks, labels, timestamps, min_fingers, cooldowns, grace)
+
+    Returns: list of (cache key, result)
+    """
+    keys, landmarks, labels, timestamps, min_fingers, cooldowns, grace = task
+    # A re-read video can come up a frame or two short of the recording
+    count = min(len(landmarks), len(timestamps))
+    landmarks, labels, timestamps = landmarks[:count], labels[:count], timestamps[:count]
+    times = timestamps[flap_frames(landmarks, min_fingers)]
+    segments = intended_flaps(labels, timestamps)
+    seconds = float(timestamps[-1] - timestamps[0]) if len(timestamps) else 0.0
+
+    results = []
+    for key, cooldown in zip(keys, cooldowns):
+        result = score_flaps(apply_cooldown(times, cooldown), segments, grace)
+        result['seconds'] = seconds
+        results.append((key, result))
+    return results
+
+def extract_landmarks(video, min_detection_confidence, min_tracking_confidence,
+                      model_complexity=MODEL_COMPLEXITY):
+    """
+    Re-run the hand model over a session video at other confidences
+
+    Returns: (N, 21, 2) landmarks, NaN where no hand was found
+    """
+    import cv2
+    from hand_gesture_detector import HandGestureDetector
+
+    detector = HandGestureDetector(
+        model_complexity, classifier=HeuristicClassifier(),
+        min_detection_confidence=min_detection_confidence,
+        min_tracking_confidence=min_tracking_confidence
+    )
+    cap = cv2.VideoCapture(video)
+    landmarks = []
+    try:
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            points = detector.process_frame(frame, annotate=False)['landmarks']
+            landmarks.append(points if points else np.full((21, 2), np.nan))
+    finally:
+        cap.release()
+        detector.hands.close()
+    return np.array(landmarks, dtype=np.float32).reshape(-1, 21, 2)
+
+def _extract_task(task):
+    """Process-pool worker: (cache path, video, detection, tracking, complexity)"""
+    path, video, detection, tracking, complexity = task
+    landmarks = extract_landmarks(video, detection, tracking, complexity)
+    tmp = path + '.tmp.npy'
+    np.save(tmp, landmarks)
+    os.replace(tmp, path)
+    return path
+
+class ParameterSweep:
+    def __init__(self, sessions, grid=None, cache_dir=SWEEP_CACHE_DIR, workers=None,
+                 grace=SWEEP_MATCH_GRACE, model_complexity=MODEL_COMPLEXITY):
+        """
+        Evaluate every configuration in a grid on every session
+
+        Args:
+            sessions: dicts from load_session (or synthetic_session)
+            grid: {parameter name: list of values}; parameters left out stay
+                at their config value
+            cache_dir: where results and re-inferred landmarks are kept
+            workers: pool size (default: all cores)
+            grace: seconds after a gesture ends that its flap still counts
+        """
+        self.sessions = sessions
+        self.grid = grid or {}
+        self.cache_dir = cache_dir
+        self.workers = workers or os.cpu_count() or 1
+        self.grace = grace
+        self.model_complexity = model_complexity
+        self.hashes = [session_hash(session) for session in sessions]
+        self.computed = 0
+        self.cached = 0
+        self.skipped = 0
+        self.reinferred = 0
+
+    def result_key(self, session_index, config):
+        params = {'session': self.hashes[session_index], 'grace': self.grace,
+                  'version': SWEEP_VERSION, **config}
+        if self.sessions[session_index].get('video'):
+            params['model_complexity'] = self.model_complexity
+        return hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+    def _cache_path(self, kind, key, ext):
+        directory = os.path.join(self.cache_dir, kind)
+        os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, key + ext)
+
+    def _load_result(self, key):
+        try:
+            with open(self._cache_path('results', key, '.json')) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_result(self, key, result):
+        path = self._cache_path('results', key, '.json')
+        with open(path + '.tmp', 'w') as f:
+            json.dump(result, f)
+        os.replace(path + '.tmp', path)
+
+    def landmark_source(self, session_index, confidence):
+        """
+        Where a session's landmarks at these confidences come from
+
+        Returns: ('recorded', None), ('video', cache path) or (None, None)
+            when the session has no video and was recorded at other settings
+        """
+        session = self.sessions[session_index]
+        recorded = session.get('confidence') or (MIN_DETECTION_CONFIDENCE,
+                                                 MIN_TRACKING_CONFIDENCE)
+        if np.allclose(recorded, confidence):
+            return 'recorded', None
+        if not session.get('video'):
+            return None, None
+        key = hashlib.sha256(json.dumps(
+            [self.hashes[session_index], *confidence, self.model_complexity]
+        ).encode()).hexdigest()
+        return 'video', self._cache_path('landmarks', key, '.npy')
+
+    def run(self, report=None):
+        """
+        Returns: list of per-configuration summaries (see summarize), best
+            first
+        """
+        configs = configurations(self.grid)
+        results = {}
+        pending = {}  # (session, detection, tracking, fingers) -> [(key, cooldown)]
+        for config in configs:
+            confidence = (config['MIN_DETECTION_CONFIDENCE'], config['MIN_TRACKING_CONFIDENCE'])
+            for i in range(len(self.sessions)):
+                if self.landmark_source(i, confidence)[0] is None:
+                    self.skipped += 1
+                    continue
+                key = self.result_key(i, config)
+                result = self._load_result(key)
+                if result is not None:
+                    results[key] = result
+                    self.cached += 1
+                else:
+                    group = (i, *confidence, config['MIN_FINGERS_FOR_FLAP'])
+                    pending.setdefault(group, []).append((key, config['FLAP_COOLDOWN']))
+
+        if pending:
+            total = sum(len(points) for points in pending.values())
+            with multiprocessing.Pool(self.workers) as pool:
+                landmarks = self._reinfer(pool, pending, report)
+                tasks = []
+                for (i, detection, tracking, fingers), points in pending.items():
+                    session = self.sessions[i]
+                    keys, cooldowns = zip(*points)
+                    tasks.append((
+                        keys, landmarks.get((i, detection, tracking), session['landmarks']),
+                        session['labels'], session['timestamps'], fingers, cooldowns,
+                        self.grace
+                    ))
+                for batch in pool.imap_unordered(_evaluate_task, tasks):
+                    for key, result in batch:
+                        self._save_result(key, result)
+                        results[key] = result
+                        self.computed += 1
+                    if report:
+                        report(f"evaluated {self.computed} of {total} new points")
+
+        summaries = []
+        for config in configs:
+            keys = [self.result_key(i, config) for i in range(len(self.sessions))]
+            found = [results[key] for key in keys if key in results]
+            if found:
+                summaries.append(summarize(config, found))
+        summaries.sort(key=rank)
+        return summaries
+
+    def _reinfer(self, pool, pending, report):
+        """
+        Re-run the hand model where a configuration's confidences differ
+        from the recording (cached per video and settings)
+
+        Returns: {(session, detection, tracking): landmarks}
+        """
+        needed = {}
+        for i, detection, tracking, _ in pending:
+            source, path = self.landmark_source(i, (detection, tracking))
+            if source == 'video':
+                needed[(i, detection, tracking)] = path
+
+        tasks = [(path, self.sessions[i]['video'], detection, tracking, self.model_complexity)
+                 for (i, detection, tracking), path in needed.items()
+                 if not os.path.exists(path)]
+        for done, _ in enumerate(pool.imap_unordered(_extract_task, tasks), 1):
+            self.reinferred += 1
+            if report:
+                report(f"re-ran hand detection on {done} of {len(tasks)} videos")
+        return {group: np.load(path) for group, path in needed.items()}
+
+def summarize(config, results):
+    """
+    Combine one configuration's per-session results
+
+    Returns: dict of the configuration plus totals, false flaps per
+        minute, miss rate and latency mean / p90 (ms)
+    """
+    total = {name: sum(r[name] for r in results)
+             for name in ('intended', 'flaps', 'false_flaps', 'missed_flaps',
+                          'repeat_flaps', 'seconds')}
+    latencies = [ms for r in results for ms in r['latencies_ms']]
+    minutes = total['seconds'] / 60
+    return {
+        **config,
+        'sessions': len(results),
+        **total,
+        'false_per_minute': total['false_flaps'] / minutes if minutes else 0.0,
+        'miss_rate': total['missed_flaps'] / total['intended'] if total['intended'] else 0.0,
+        'latency_mean_ms': float(np.mean(latencies)) if latencies else None,
+        'latency_p90_ms': float(np.percentile(latencies, 90)) if latencies else None,
+    }
+
+def rank(summary):
+    """Sort key: fewest wrong flaps (false plus missed), then lowest latency"""
+    errors = summary['false_flaps'] + summary['missed_flaps']
+    latency = summary['latency_mean_ms']
+    return errors, latency if latency is not None else float('inf')
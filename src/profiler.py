@@ -0,0 +1,200 @@
+"""
+Profiler Module
+Sampling profiler for the game thread plus per-frame stage timings that
+dump a snapshot to disk whenever a frame runs slow
+
+Overhead: the sampler wakes every PROFILE_SAMPLE_INTERVAL seconds and walks
+one thread's stack (typically 10-50 us), i.e. well under 1% of a core at
+the default 5 ms; stage marks cost well under a microsecond each; slow-frame
+dumps are capped at PROFILE_MAX_DUMPS per run and one per
+PROFILE_DUMP_COOLDOWN seconds. The report includes the measured sampling cost.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from config import *
+
+class Profiler:
+    def __init__(self, thread_id=None, interval=PROFILE_SAMPLE_INTERVAL,
+                 slow_frame_ms=PROFILE_SLOW_FRAME_MS, directory=PROFILE_DIR,
+                 max_dumps=PROFILE_MAX_DUMPS):
+        """
+        Args:
+            thread_id: thread to sample (default: the calling thread)
+            interval: seconds between stack samples
+            slow_frame_ms: frames with more work than this are dumped
+            directory: where slow-frame dumps and the report are written
+            max_dumps: most slow-frame dumps written per run
+        """
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.interval = interval
+        self.slow_frame_ms = slow_frame_ms
+        self.directory = directory
+        self.max_dumps = max_dumps
+
+        # Sampling state (written by the sampler thread only)
+        self.samples = 0
+        self.self_counts = Counter()
+        self.inclusive_counts = Counter()
+        self.recent_stacks = deque(maxlen=PROFILE_STACK_HISTORY)
+        self.sampling_time = 0.0
+        self._started = None
+        self._stop = threading.Event()
+        self._thread = None
+
+        # Frame state (game thread only)
+        self.frames = 0
+        self.stage_totals = Counter()
+        self.frame_stages = {}
+        self.frame_start = 0.0
+        self._last_mark = 0.0
+        self.dumps = []
+        self._last_dump = 0.0
+
+    def start(self):
+        """Start sampling in the background"""
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._sample_loop, name="profiler", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop sampling"""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def _sample_loop(self):
+        """Take one stack sample of the target thread per interval"""
+        while not self._stop.wait(self.interval):
+            start = time.perf_counter()
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+
+            stack = []
+            while frame is not None:
+                stack.append((frame.f_code, frame.f_lineno))
+                frame = frame.f_back
+
+            self.samples += 1
+            self.self_counts[stack[0][0]] += 1
+            for code in {code for code, _ in stack}:
+                self.inclusive_counts[code] += 1
+            self.recent_stacks.append((start, stack))
+            self.sampling_time += time.perf_counter() - start
+
+    def begin_frame(self):
+        """Start timing a frame's stages"""
+        self.frame_start = self._last_mark = time.perf_counter()
+        self.frame_stages = {}
+
+    def mark(self, stage):
+        """Close the current stage; time since the previous mark goes to it"""
+        now = time.perf_counter()
+        self.frame_stages[stage] = self.frame_stages.get(stage, 0.0) + now - self._last_mark
+        self._last_mark = now
+
+    def end_frame(self, camera_frame=None):
+        """
+        Finish the frame and dump it if it was slow
+
+        Returns: path of the dump written, or None
+        """
+        end = time.perf_counter()
+        self.frames += 1
+        self.stage_totals.update(self.frame_stages)
+
+        frame_ms = (end - self.frame_start) * 1000
+        if (frame_ms < self.slow_frame_ms or len(self.dumps) >= self.max_dumps
+                or end - self._last_dump < PROFILE_DUMP_COOLDOWN):
+            return None
+
+        self._last_dump = end
+        return self.dump_slow_frame(frame_ms, self.frame_start, end, camera_frame)
+
+    def dump_slow_frame(self, frame_ms, start, end, camera_frame=None):
+        """Write stage timings, stack samples and the camera frame to disk"""
+        os.makedirs(self.directory, exist_ok=True)
+        name = f"slow-frame-{time.strftime('%Y%m%d-%H%M%S')}-{len(self.dumps) + 1:03d}"
+        base = os.path.join(self.directory, name)
+
+        stacks = [
+            format_stack(stack)
+            for sampled_at, stack in list(self.recent_stacks)
+            if start <= sampled_at <= end
+        ]
+        record = {
+            'frame_ms': round(frame_ms, 3),
+            'threshold_ms': self.slow_frame_ms,
+            'stages_ms': {k: round(v * 1000, 3) for k, v in self.frame_stages.items()},
+            'stack_samples': stacks,
+            'camera_frame': None,
+        }
+
+        if camera_frame is not None and 'cv2' in sys.modules:
+            image_path = base + '.jpg'
+            if sys.modules['cv2'].imwrite(image_path, camera_frame):
+                record['camera_frame'] = os.path.basename(image_path)
+
+        with open(base + '.json', 'w', encoding='utf-8') as f:
+            json.dump(record, f, indent=2)
+        self.dumps.append(base + '.json')
+        return base + '.json'
+
+    def report(self, limit=15):
+        """Returns: str - human readable summary of stages and hot functions"""
+        lines = []
+        if self.frames:
+            lines.append(f"Stage timings (mean over {self.frames} frames):")
+            for stage, total in self.stage_totals.most_common():
+                lines.append(f"  {stage:<14} {total / self.frames * 1000:8.3f} ms")
+
+        if self.samples:
+            wall = time.perf_counter() - self._started
+            lines.append(
+                f"Sampling: {self.samples} samples, profiler cost "
+                f"{self.sampling_time / wall * 100:.2f}% of wall time"
+            )
+            for title, counts in (("Inclusive", self.inclusive_counts),
+                                  ("Self", self.self_counts)):
+                lines.append(f"{title} time by function:")
+                for code, count in counts.most_common(limit):
+                    lines.append(
+                        f"  {count / self.samples * 100:5.1f}%  {describe(code)}"
+                    )
+
+        if self.dumps:
+            lines.append(f"Slow frames (> {self.slow_frame_ms} ms) dumped: {len(self.dumps)}")
+            lines.extend(f"  {path}" for path in self.dumps)
+        return '\n'.join(lines)
+
+    def save_report(self):
+        """Write report() next to the dumps; returns the path"""
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(
+            self.directory, f"profile-{time.strftime('%Y%m%d-%H%M%S')}.txt"
+        )
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.report() + '\n')
+        return path
+
+def describe(code):
+    """'qualname (file.py:line)' for a code object"""
+    name = getattr(code, 'co_qualname', code.co_name)
+    return f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+def format_stack(stack):
+    """Innermost-first list of 'qualname (file.py:line)' strings"""
+    return [
+        f"{getattr(code, 'co_qualname', code.co_name)} "
+        f"({os.path.basename(code.co_filename)}:{lineno})"
+        for code, lineno in stack
+    ]
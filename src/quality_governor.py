@@ -0,0 +1,90 @@
+"""
+Quality Governor Module
+Steps camera and hand tracking quality down when frames run over budget
+and back up when there is headroom
+"""
+
+from collections import deque
+from config import *
+
+class QualityGovernor:
+    def __init__(self, tiers=QUALITY_TIERS, frame_budget=1.0 / FPS,
+                 window=QUALITY_WINDOW, on_change=None):
+        """
+        Args:
+            tiers: list of tier dicts, best quality first
+            frame_budget: seconds of work allowed per frame
+            window: number of frames averaged before each decision
+            on_change: callback(tier) invoked after every tier change
+        """
+        self.tiers = tiers
+        self.level = 0
+        self.frame_budget = frame_budget
+        self.on_change = on_change
+        self.frame_times = deque(maxlen=window)
+        self.inference_times = deque(maxlen=window)
+        self.headroom_windows = 0
+
+    @property
+    def tier(self):
+        """Currently active tier dict"""
+        return self.tiers[self.level]
+
+    def record(self, frame_time, inference_time=0.0):
+        """
+        Add one frame's timings (seconds) and adjust the tier if needed
+
+        Returns: the new tier dict if the tier changed, otherwise None
+        """
+        self.frame_times.append(frame_time)
+        self.inference_times.append(inference_time)
+        if len(self.frame_times) < self.frame_times.maxlen:
+            return None
+
+        frame_avg = sum(self.frame_times) / len(self.frame_times)
+        inference_avg = sum(self.inference_times) / len(self.inference_times)
+        inference_budget = self.frame_budget * QUALITY_INFERENCE_SHARE
+
+        overloaded = (
+            frame_avg > self.frame_budget * QUALITY_DOWNGRADE_RATIO
+            or inference_avg > inference_budget
+        )
+        if overloaded:
+            self.headroom_windows = 0
+            if self.level < len(self.tiers) - 1:
+                return self._set_level(self.level + 1, frame_avg, inference_avg)
+            return None
+
+        has_headroom = (
+            frame_avg < self.frame_budget * QUALITY_UPGRADE_RATIO
+            and inference_avg < inference_budget * QUALITY_UPGRADE_RATIO
+        )
+        if not has_headroom or self.level == 0:
+            self.headroom_windows = 0
+            return None
+
+        # Require several full windows of headroom before stepping up
+        self.headroom_windows += 1
+        self.frame_times.clear()
+        self.inference_times.clear()
+        if self.headroom_windows >= QUALITY_UPGRADE_HOLD:
+            return self._set_level(self.level - 1, frame_avg, inference_avg)
+        return None
+
+    def _set_level(self, level, frame_avg, inference_avg):
+        """Switch tier, log it and start measuring the new tier from scratch"""
+        old = self.tier
+        self.level = level
+        self.headroom_windows = 0
+        self.frame_times.clear()
+        self.inference_times.clear()
+
+        print(
+            f"Quality: {old['name']} -> {self.tier['name']} "
+            f"(frame {frame_avg * 1000:.1f} ms, "
+            f"inference {inference_avg * 1000:.1f} ms, "
+            f"budget {self.frame_budget * 1000:.1f} ms)"
+        )
+        if self.on_change is not None:
+            self.on_change(self.tier)
+        return self.tier
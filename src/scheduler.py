@@ -0,0 +1,153 @@
+"""
+Scheduler Module
+Decides when to redraw, poll the camera and sleep, depending on game state,
+so static screens cost almost no CPU
+"""
+
+import time
+from collections import deque
+import pygame
+from config import *
+
+class IdleScheduler:
+    def __init__(self, clock, active_states, wake_states=(),
+                 enabled=IDLE_SCHEDULING_ENABLED):
+        """
+        Args:
+            clock: pygame Clock used for frame pacing in active states
+            active_states: states that run at full FPS (e.g. playing)
+            wake_states: idle states that still poll the camera at
+                MENU_CAMERA_POLL_FPS for a wake gesture (e.g. menu)
+            enabled: False keeps the classic every-frame behaviour
+        """
+        self.clock = clock
+        self.active_states = set(active_states)
+        self.wake_states = set(wake_states)
+        self.enabled = enabled
+        self.uncapped = False  # turbo mode: never sleep or cap the frame rate
+
+        self.state = None
+        self.dirty = True
+        self.drawn_scene = None
+        self.last_camera_poll = 0.0
+
+        # Resume measurement: time from resume to first fresh frame processed
+        self.resume_started = None
+        self.resume_latencies = deque(maxlen=100)
+
+        # Per-state wall and CPU time, for measuring idle cost
+        self.state_times = {}
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+
+    @property
+    def active(self):
+        """True when the current state runs at full frame rate"""
+        return not self.enabled or self.state in self.active_states
+
+    def begin_frame(self, state):
+        """
+        Start a loop iteration in the given state
+
+        Returns: bool - True if we just resumed from an idle state (the
+        camera buffer should be flushed before reading)
+        """
+        self._account()
+        previous, self.state = self.state, state
+        if state == previous:
+            return False
+
+        self.dirty = True
+        resumed = (
+            state in self.active_states
+            and previous is not None
+            and previous not in self.active_states
+        )
+        if resumed:
+            self.resume_started = time.perf_counter()
+        return resumed
+
+    def _account(self):
+        """Charge elapsed wall and CPU time to the current state"""
+        wall, cpu = time.perf_counter(), time.process_time()
+        if self.state is not None:
+            totals = self.state_times.setdefault(self.state, [0.0, 0.0])
+            totals[0] += wall - self._wall
+            totals[1] += cpu - self._cpu
+        self._wall, self._cpu = wall, cpu
+
+    def mark_dirty(self):
+        """Force a redraw on the next frame (window exposed, resized...)"""
+        self.dirty = True
+
+    def should_redraw(self, scene):
+        """
+        Active states always redraw; idle states only when marked dirty or
+        when the scene key (anything shown on screen) has changed
+        """
+        if self.active or self.dirty or scene != self.drawn_scene:
+            self.dirty = False
+            self.drawn_scene = scene
+            return True
+        return False
+
+    def should_poll_camera(self):
+        """Full rate when active, throttled wake checks in wake states"""
+        if self.active:
+            return True
+        if self.state not in self.wake_states:
+            return False
+        now = time.perf_counter()
+        if now - self.last_camera_poll >= 1.0 / MENU_CAMERA_POLL_FPS:
+            self.last_camera_poll = now
+            return True
+        return False
+
+    def frame_processed(self):
+        """Note that a fresh camera frame was processed (ends a resume)"""
+        if self.resume_started is not None:
+            self.resume_latencies.append(time.perf_counter() - self.resume_started)
+            self.resume_started = None
+
+    def wait(self):
+        """Pace active states with the clock; sleep on events otherwise"""
+        if self.uncapped:
+            return
+        if self.active:
+            self.clock.tick(FPS)
+            return
+
+        timeout = IDLE_WAKE_INTERVAL
+        if self.state in self.wake_states:
+            next_poll = self.last_camera_poll + 1.0 / MENU_CAMERA_POLL_FPS
+            timeout = min(timeout, (next_poll - time.perf_counter()) * 1000)
+        timeout = max(1, int(timeout))
+
+        # Block until an event arrives (put back for handle_events) or timeout
+        event = pygame.event.wait(timeout)
+        if event.type != pygame.NOEVENT:
+            pygame.event.post(event)
+
+        # Restart frame timing so the next active tick isn't skewed by the sleep
+        self.clock.tick()
+
+    def stats(self):
+        """
+        Returns: dict {
+            'states': {name: {'wall_s', 'cpu_s', 'cpu_percent'}},
+            'resume_latency_ms': list of recent resume latencies
+        }
+        """
+        self._account()
+        states = {}
+        for state, (wall, cpu) in self.state_times.items():
+            name = getattr(state, 'name', str(state))
+            states[name] = {
+                'wall_s': wall,
+                'cpu_s': cpu,
+                'cpu_percent': 100.0 * cpu / wall if wall > 0 else 0.0,
+            }
+        return {
+            'states': states,
+            'resume_latency_ms': [t * 1000 for t in self.resume_latencies],
+        }
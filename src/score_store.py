@@ -0,0 +1,204 @@
+"""
+Score Store Module
+Persists per-session records in SQLite from a background writer thread
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+from config import *
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    day TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    flaps INTEGER NOT NULL,
+    gesture_flaps INTEGER NOT NULL,
+    keyboard_flaps INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_score ON sessions (score DESC);
+CREATE INDEX IF NOT EXISTS idx_sessions_day_score ON sessions (day, score DESC);
+"""
+
+COLUMNS = (
+    'started_at', 'day', 'score', 'duration',
+    'flaps', 'gesture_flaps', 'keyboard_flaps'
+)
+
+class ScoreStore:
+    def __init__(self, path=SCORE_DB_PATH, batch_size=SCORE_WRITE_BATCH_SIZE,
+                 flush_interval=SCORE_FLUSH_INTERVAL):
+        """
+        Open (or create) the score database and start the writer thread
+
+        Writes never block the caller: record() only enqueues, and the
+        writer thread commits queued sessions in batched transactions.
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+        self._local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        # Create the schema up front so readers never see a missing table
+        conn = self._connect()
+        conn.executescript(SCHEMA)
+        conn.commit()
+        self._local.conn = conn
+
+        self._writer = threading.Thread(
+            target=self._write_loop, name="score-writer", daemon=True
+        )
+        self._writer.start()
+
+    def _connect(self):
+        """Open a connection configured for WAL (readers don't block the writer)"""
+        conn = sqlite3.connect(self.path, timeout=5.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _reader(self):
+        """Connection for the calling thread"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def record(self, score, duration, gesture_flaps=0, keyboard_flaps=0,
+               started_at=None):
+        """Queue one finished session for writing (non-blocking)"""
+        if started_at is None:
+            started_at = time.time() - duration
+        day = time.strftime('%Y-%m-%d', time.localtime(started_at))
+        self._queue.put((
+            started_at, day, int(score), float(duration),
+            gesture_flaps + keyboard_flaps, gesture_flaps, keyboard_flaps
+        ))
+
+    def _write_loop(self):
+        """Drain the queue in batches, one transaction per batch"""
+        conn = self._connect()
+        insert = (
+            f"INSERT INTO sessions ({', '.join(COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(COLUMNS))})"
+        )
+        running = True
+        while running:
+            item = self._queue.get()
+            batch = []
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is None:
+                    running = False
+                else:
+                    batch.append(item)
+                if not running or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get(
+                        timeout=max(0.0, deadline - time.monotonic())
+                    )
+                except queue.Empty:
+                    break
+
+            if batch:
+                try:
+                    with conn:
+                        conn.executemany(insert, batch)
+                except sqlite3.Error as e:
+                    print(f"Warning: could not save {len(batch)} session(s) - {e}")
+            for _ in range(len(batch) + (0 if running else 1)):
+                self._queue.task_done()
+        conn.close()
+
+    def flush(self):
+        """Block until every queued session has been committed"""
+        self._queue.join()
+
+    def close(self):
+        """Flush pending writes and stop the writer thread"""
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def import_legacy_high_score(self, paths=LEGACY_HIGH_SCORE_PATHS):
+        """
+        Carry a high_score.txt from before the store over, once: only while
+        the store has no sessions. The file is left in place.
+
+        Returns: int score imported, or 0
+        """
+        conn = self._reader()
+        if conn.execute("SELECT 1 FROM sessions LIMIT 1").fetchone():
+            return 0
+        for path in paths:
+            try:
+                with open(path) as f:
+                    score = int(f.read().strip())
+                started_at = os.path.getmtime(path)
+            except (OSError, ValueError):
+                continue
+            if score <= 0:
+                continue
+            day = time.strftime('%Y-%m-%d', time.localtime(started_at))
+            with conn:
+                conn.execute(
+                    f"INSERT INTO sessions ({', '.join(COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * len(COLUMNS))})",
+                    (started_at, day, score, 0.0, 0, 0, 0)
+                )
+            print(f"Imported high score {score} from {path}")
+            return score
+        return 0
+
+    def high_score(self):
+        """Best score ever recorded (0 if none)"""
+        row = self._reader().execute(
+            "SELECT score FROM sessions ORDER BY score DESC LIMIT 1"
+        ).fetchone()
+        return row[0] if row else 0
+
+    def top_scores(self, limit=10, day=None):
+        """
+        Leaderboard, best first, optionally for a single 'YYYY-MM-DD' day
+        Returns: list of dicts with the session columns
+        """
+        sql = f"SELECT {', '.join(COLUMNS)} FROM sessions"
+        params = []
+        if day is not None:
+            sql += " WHERE day = ?"
+            params.append(day)
+        sql += " ORDER BY score DESC LIMIT ?"
+        params.append(limit)
+        rows = self._reader().execute(sql, params).fetchall()
+        return [dict(zip(COLUMNS, row)) for row in rows]
+
+    def daily_summary(self, day):
+        """
+        Aggregate stats for one 'YYYY-MM-DD' day
+        Returns: dict {'sessions', 'best', 'average', 'total_duration'}
+        """
+        sessions, best, average, total = self._reader().execute(
+            "SELECT COUNT(*), MAX(score), AVG(score), SUM(duration) "
+            "FROM sessions WHERE day = ?",
+            (day,)
+        ).fetchone()
+        return {
+            'sessions': sessions,
+            'best': best or 0,
+            'average': average or 0.0,
+            'total_duration': total or 0.0,
+        }
@@ -0,0 +1,356 @@
+"""
+Soak Test Module
+Plays the real game loop headless for hours of simulated play, with
+automated restarts, and watches for slow leaks and frame-time drift
+
+Every SOAK_SAMPLE_MINUTES of play it records resident memory, the Python
+heap (tracemalloc, with the allocation sites that grew most), GC counters
+and the frame-time percentiles of that window. After a warm-up, growth
+beyond the configured bounds fails the run.
+"""
+
+import gc
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from array import array
+
+import numpy as np
+from config import *
+
+# Allocation sites that are the measurement itself, not the game
+IGNORED_TRACES = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+)
+
+def rss_bytes():
+    """
+    Resident set size of this process
+
+    Returns: int bytes, or None where it can't be read
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Peak rather than current, but it still shows sustained growth;
+    # kilobytes on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+class LoopingCapture:
+    def __init__(self, frames):
+        """
+        Stands in for cv2.VideoCapture, replaying recorded frames in a loop
+        so the real detection path runs for as long as the soak does
+
+        Args:
+            frames: list of BGR frames (e.g. read from a recorded session)
+        """
+        self.frames = frames
+        self.index = 0
+
+    @classmethod
+    def from_video(cls, path):
+        import cv2
+
+        cap = cv2.VideoCapture(path)
+        frames = []
+        while True:
+            ok, frame = cap.read()
+            if not ok:
+                break
+            frames.append(frame)
+        cap.release()
+        if not frames:
+            raise ValueError(f"No frames could be read from {path}")
+        return cls(frames)
+
+    def grab(self):
+        self.index = (self.index + 1) % len(self.frames)
+        return True
+
+    def read(self, image=None):
+        frame = self.frames[self.index]
+        self.index = (self.index + 1) % len(self.frames)
+        if image is not None and image.shape == frame.shape:
+            np.copyto(image, frame)
+            return True, image
+        return True, frame.copy()
+
+    def isOpened(self):
+        return True
+
+    def release(self):
+        pass
+
+class SoakTest:
+    def __init__(self, input_source=None, capture=None, detector=None,
+                 sample_minutes=SOAK_SAMPLE_MINUTES, warmup_minutes=SOAK_WARMUP_MINUTES,
+                 max_rss_growth_mb=SOAK_MAX_RSS_GROWTH_MB,
+                 max_traced_growth_mb=SOAK_MAX_TRACED_GROWTH_MB,
+                 max_p99_growth=SOAK_MAX_P99_GROWTH, restart_delay=SOAK_RESTART_DELAY,
+                 trace=True, top=5, seed=0, report=print):
+        """
+        Long-running, headless play of the real game loop
+
+        Args:
+            input_source: what plays (default: RandomInput); ignored when a
+                capture is given
+            capture: camera stand-in (e.g. LoopingCapture) to play through
+                the detection path instead
+            detector: hand detector for the capture (default:
+                HandGestureDetector)
+            sample_minutes: simulated minutes of play per sample
+            warmup_minutes: simulated minutes before the baseline sample
+            max_rss_growth_mb: resident memory growth that fails the run
+            max_traced_growth_mb: Python heap growth that fails the run
+            max_p99_growth: factor by which the late p99 frame time may
+                exceed the early one
+            restart_delay: ticks on the game over screen before restarting
+            trace: track allocations with tracemalloc (slows the game down)
+            top: allocation sites listed per sample
+            seed: seed for pipe placement and the default input
+            report: callable for progress lines (None for silence)
+        """
+        if input_source is None and capture is None:
+            from input_sources import RandomInput
+            input_source = RandomInput(seed)
+        self.input_source = None if capture is not None else input_source
+        self.capture = capture
+        self.detector = detector
+        self.sample_ticks = max(1, int(sample_minutes * 60 * FPS))
+        self.warmup_ticks = max(1, int(warmup_minutes * 60 * FPS))
+        self.max_rss_growth_mb = max_rss_growth_mb
+        self.max_traced_growth_mb = max_traced_growth_mb
+        self.max_p99_growth = max_p99_growth
+        self.restart_delay = restart_delay
+        self.trace = trace
+        self.top = top
+        self.seed = seed
+        self.report = report or (lambda message: None)
+
+        self.samples = []
+        self.restarts = 0
+        self._baseline_snapshot = None
+
+    def _attach_camera(self, game):
+        if self.detector is None:
+            from hand_gesture_detector import HandGestureDetector
+            self.detector = HandGestureDetector()
+        game.cap = self.capture
+        game.hand_detector = self.detector
+        game.camera_available = True
+        game.quality_governor = None
+        game.apply_preview_tier({'show_preview': False, 'detect_every': 1})
+
+    def _restart_key(self, game, idle_ticks):
+        """Key to press on the menu / game over screens, or None to wait"""
+        state = game.game_state.name
+        if state == 'PLAYING' or idle_ticks < self.restart_delay:
+            return None
+        if state == 'GAME_OVER':
+            # Every fifth restart goes back through the menu
+            return 'escape' if self.restarts % 5 == 4 else 'r'
+        if state == 'MENU':
+            return 'space'
+        return 'p' if state == 'PAUSED' else None
+
+    def run(self, hours=1.0):
+        """
+        Play for `hours` of simulated time (as fast as the machine allows)
+
+        Returns: dict {
+            'passed': bool,
+            'failures': list of str,
+            'samples': list of sample dicts (see sample()),
+        }
+        """
+        import pygame
+        from input_sources import KEYS
+        from telemetry import Telemetry
+        from turbo import TurboRunner
+
+        total_ticks = int(hours * 3600 * FPS)
+        telemetry_dir = tempfile.mkdtemp(prefix='flappy-soak-')
+        runner = None
+        self.samples = []
+        self.restarts = 0
+        self._baseline_snapshot = None
+        idle_ticks = 0
+        games = 0
+        failures = []
+        try:
+            runner = TurboRunner(
+                self.input_source, seed=self.seed,
+                telemetry=Telemetry(directory=telemetry_dir, enabled=True)
+            )
+            game = runner.game
+            if self.capture is not None:
+                self._attach_camera(game)
+
+            if self.trace:
+                tracemalloc.start()
+            window = array('d')
+            window_start = time.perf_counter()
+            run_start = window_start
+            for tick in range(1, total_ticks + 1):
+                if self.input_source is not None:
+                    self.input_source.begin_tick(tick)
+
+                state = game.game_state.name
+                key = self._restart_key(game, idle_ticks)
+                if key is not None:
+                    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=KEYS[key]))
+
+                start = time.perf_counter()
+                if not game.step():
+                    failures.append(f"game quit at tick {tick}")
+                    break
+                window.append(time.perf_counter() - start)
+
+                new_state = game.game_state.name
+                if new_state == state:
+                    idle_ticks += 1
+                else:
+                    idle_ticks = 0
+                    if new_state == 'PLAYING' and state != 'PAUSED':
+                        games += 1
+                        self.restarts = max(0, games - 1)
+
+                if tick == self.warmup_ticks or tick % self.sample_ticks == 0 or \
+                        tick == total_ticks:
+                    now = time.perf_counter()
+                    sample = self.sample(tick, window, now - window_start,
+                                         now - run_start, baseline=tick == self.warmup_ticks)
+                    self.report(self.describe(sample))
+                    window = array('d')
+                    window_start = time.perf_counter()
+        finally:
+            if runner is not None:
+                runner.close()
+            if self.trace:
+                tracemalloc.stop()
+            self._baseline_snapshot = None
+            shutil.rmtree(telemetry_dir, ignore_errors=True)
+
+        failures.extend(self.check_drift())
+        return {'passed': not failures, 'failures': failures, 'samples': self.samples}
+
+    def sample(self, tick, frame_times, window_seconds, wall_seconds, baseline=False):
+        """
+        Record memory, GC and frame-time measurements
+
+        Args:
+            frame_times: seconds per step() since the last sample
+            baseline: this sample ends the warm-up; later allocation growth
+                is reported relative to it
+
+        Returns: dict {
+            'tick', 'minutes' (simulated), 'wall_seconds', 'ticks_per_second',
+            'baseline', 'restarts', 'rss_mb', 'traced_mb', 'top_allocators',
+            'gc_collections', 'gc_counts', 'gc_objects',
+            'frame_ms_p50', 'frame_ms_p99', 'frame_ms_max'
+        }
+        """
+        times = np.frombuffer(frame_times, dtype=np.float64) * 1000 if len(frame_times) \
+            else np.zeros(1)
+        rss = rss_bytes()
+        sample = {
+            'tick': tick,
+            'minutes': round(tick / FPS / 60, 2),
+            'wall_seconds': round(wall_seconds, 2),
+            'ticks_per_second': round(len(frame_times) / window_seconds, 1)
+                                if window_seconds > 0 else 0.0,
+            'baseline': baseline,
+            'restarts': self.restarts,
+            'rss_mb': round(rss / 2**20, 2) if rss is not None else None,
+            'traced_mb': None,
+            'top_allocators': [],
+            'gc_collections': [stats['collections'] for stats in gc.get_stats()],
+            'gc_counts': list(gc.get_count()),
+            'gc_objects': len(gc.get_objects()),
+            'frame_ms_p50': round(float(np.percentile(times, 50)), 3),
+            'frame_ms_p99': round(float(np.percentile(times, 99)), 3),
+            'frame_ms_max': round(float(times.max()), 3),
+        }
+
+        if self.trace and tracemalloc.is_tracing():
+            sample['traced_mb'] = round(tracemalloc.get_traced_memory()[0] / 2**20, 3)
+            snapshot = tracemalloc.take_snapshot().filter_traces(IGNORED_TRACES)
+            if baseline:
+                self._baseline_snapshot = snapshot
+            elif self._baseline_snapshot is not None:
+                stats = snapshot.compare_to(self._baseline_snapshot, 'lineno')
+                sample['top_allocators'] = [
+                    {
+                        'where': f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                        'size_diff_kb': round(stat.size_diff / 1024, 1),
+                        'count_diff': stat.count_diff,
+                    }
+                    for stat in stats[:self.top] if stat.size_diff > 0
+                ]
+
+        self.samples.append(sample)
+        return sample
+
+    def describe(self, sample):
+        """One progress line for a sample"""
+        line = (f"{sample['minutes']:8.1f} min  {sample['ticks_per_second']:7.0f} ticks/s  "
+                f"frame p50 {sample['frame_ms_p50']:.2f} p99 {sample['frame_ms_p99']:.2f} ms  "
+                f"rss {sample['rss_mb']} MB")
+        if sample['traced_mb'] is not None:
+            line += f"  heap {sample['traced_mb']:.2f} MB"
+        line += f"  gc objects {sample['gc_objects']}  restarts {sample['restarts']}"
+        if sample['baseline']:
+            line += "  (baseline)"
+        for site in sample['top_allocators'][:3]:
+            line += f"\n    +{site['size_diff_kb']} KB  {site['where']}"
+        return line
+
+    def check_drift(self):
+        """
+        Compare samples after the warm-up with the baseline
+
+        Returns: list of str failure descriptions (empty if within bounds)
+        """
+        measured = [s for s in self.samples if s['tick'] >= self.warmup_ticks]
+        if len(measured) < 2:
+            return []
+        baseline, last = measured[0], measured[-1]
+        failures = []
+
+        if baseline['rss_mb'] is not None and last['rss_mb'] is not None:
+            growth = last['rss_mb'] - baseline['rss_mb']
+            if growth > self.max_rss_growth_mb:
+                failures.append(f"resident memory grew {growth:.1f} MB after warm-up "
+                                f"(limit {self.max_rss_growth_mb} MB)")
+
+        if baseline['traced_mb'] is not None and last['traced_mb'] is not None:
+            growth = last['traced_mb'] - baseline['traced_mb']
+            if growth > self.max_traced_growth_mb:
+                sites = ', '.join(site['where'] for site in last['top_allocators'][:3])
+                failures.append(f"Python heap grew {growth:.1f} MB after warm-up "
+                                f"(limit {self.max_traced_growth_mb} MB; top sites: {sites})")
+
+        # The baseline sample's window is the warm-up, so compare windows after it
+        windows = [s['frame_ms_p99'] for s in measured[1:]]
+        if len(windows) >= 2:
+            span = max(1, min(3, len(windows) // 2))
+            early = float(np.median(windows[:span]))
+            late = float(np.median(windows[-span:]))
+            if early > 0 and late > early * self.max_p99_growth:
+                failures.append(f"p99 frame time rose from {early:.2f} to {late:.2f} ms "
+                                f"(limit x{self.max_p99_growth})")
+        return failures
@@ -0,0 +1,293 @@
+"""
+Spectator Stream Module
+Serves the game view (and the hand-tracking frame) as MJPEG over local
+HTTP, for a second screen or a browser
+
+The game thread only copies its latest frame into a shared buffer, at most
+SPECTATOR_MAX_FPS times a second and only while someone is watching. One
+encoder thread turns each new frame into a JPEG once; every client thread
+sends those same bytes, so more viewers add no encoding work.
+"""
+
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pygame
+from config import *
+
+BOUNDARY = 'frame'
+
+INDEX_PAGE = """<!doctype html>
+<html><head><title>Hand Gesture Flappy Bird</title>
+<style>body {{ background: #111; color: #eee; font-family: sans-serif; }}
+img {{ margin: 8px; vertical-align: top; }}</style></head>
+<body>{images}</body></html>
+"""
+
+class StreamChannel:
+    def __init__(self, name, max_fps=SPECTATOR_MAX_FPS, scale=SPECTATOR_SCALE):
+        """
+        One stream: the latest frame offered by the game thread and its
+        JPEG, shared by every client
+
+        Args:
+            name: served at /<name>.mjpg
+            max_fps: most frames taken from the game per second
+            scale: integer downscale factor
+        """
+        self.name = name
+        self.interval = 1.0 / max_fps
+        self.scale = max(1, int(scale))
+        self.clients = 0
+        self.offered = 0
+        self.taken = 0
+        self.encoded = 0
+
+        # Game thread fills `back`; the encoder swaps it for `front`
+        self._lock = threading.Lock()
+        self._back = None
+        self._front = None
+        # 'xrgb' / 'rgb' (pygame, transposed) or 'bgr' (OpenCV)
+        self._pending = None
+        self._next_take = 0.0
+
+        # Latest JPEG, numbered, for client threads to wait on
+        self._jpeg_ready = threading.Condition()
+        self.jpeg = None
+        self.jpeg_seq = 0
+
+    def due(self):
+        """Whether a new frame is wanted now (game thread)"""
+        self.offered += 1
+        if not self.clients:
+            return False
+        return time.perf_counter() >= self._next_take
+
+    def _store(self, view, layout, wake):
+        with self._lock:
+            if (self._back is None or self._back.shape != view.shape or
+                    self._back.dtype != view.dtype):
+                self._back = np.empty(view.shape, dtype=view.dtype)
+            np.copyto(self._back, view)
+            self._pending = layout
+        # Keep to the cap on average (a frame that comes a little late does
+        # not push the next one back), but never burst after a pause
+        now = time.perf_counter()
+        self._next_take += self.interval
+        if self._next_take <= now:
+            self._next_take = now + self.interval * 0.75
+        self.taken += 1
+        wake.set()
+
+    def offer_surface(self, surface, wake):
+        """Take a pygame surface's pixels if a frame is due (game thread)"""
+        if not self.due():
+            return False
+        if (surface.get_bitsize() == 32 and sys.byteorder == 'little' and
+                surface.get_masks()[:3] == (0xFF0000, 0xFF00, 0xFF)):
+            # Copying whole 32-bit pixels is ~10x faster than pixels3d's
+            # byte-strided view; in memory they are B, G, R, unused
+            pixels = pygame.surfarray.pixels2d(surface)
+            layout = 'xrgb'
+        else:
+            pixels = pygame.surfarray.pixels3d(surface)
+            layout = 'rgb'
+        self._store(pixels[::self.scale, ::self.scale], layout, wake)
+        del pixels  # unlocks the surface
+        return True
+
+    def offer_array(self, frame, wake):
+        """Take a BGR camera frame if a frame is due (game thread)"""
+        if frame is None or not self.due():
+            return False
+        self._store(frame[::self.scale, ::self.scale], 'bgr', wake)
+        return True
+
+    def encode(self, cv2, params):
+        """Encode the pending frame, if any (encoder thread)"""
+        with self._lock:
+            layout = self._pending
+            if layout is None:
+                return False
+            self._back, self._front = self._front, self._back
+            self._pending = None
+        frame = self._front
+        if layout == 'xrgb':
+            bgra = frame.view(np.uint8).reshape(frame.shape + (4,))
+            frame = cv2.cvtColor(bgra.transpose(1, 0, 2), cv2.COLOR_BGRA2BGR)
+        elif layout == 'rgb':
+            frame = cv2.cvtColor(frame.transpose(1, 0, 2), cv2.COLOR_RGB2BGR)
+        ok, jpeg = cv2.imencode('.jpg', frame, params)
+        if not ok:
+            return False
+        with self._jpeg_ready:
+            self.jpeg = jpeg.tobytes()
+            self.jpeg_seq += 1
+            self._jpeg_ready.notify_all()
+        self.encoded += 1
+        return True
+
+    def wait(self, seen, timeout=1.0):
+        """
+        Block until a JPEG newer than `seen` exists (client thread)
+
+        Returns: (seq, jpeg bytes), or (seen, None) on timeout
+        """
+        with self._jpeg_ready:
+            self._jpeg_ready.wait_for(lambda: self.jpeg_seq > seen, timeout)
+            if self.jpeg_seq > seen:
+                return self.jpeg_seq, self.jpeg
+        return seen, None
+
+    def wake_clients(self):
+        with self._jpeg_ready:
+            self._jpeg_ready.notify_all()
+
+    def stats(self):
+        return {
+            'clients': self.clients,
+            'taken': self.taken,
+            'encoded': self.encoded,
+        }
+
+class StreamHandler(BaseHTTPRequestHandler):
+    """Serves /, /game.mjpg and /hand.mjpg"""
+
+    def do_GET(self):
+        spectator = self.server.spectator
+        if self.path in ('/', '/index.html'):
+            images = ''.join(f'<img src="/{name}.mjpg">' for name in spectator.channels)
+            body = INDEX_PAGE.format(images=images).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        name = self.path.lstrip('/').split('?')[0].removesuffix('.mjpg')
+        channel = spectator.channels.get(name)
+        if channel is None or not self.path.split('?')[0].endswith('.mjpg'):
+            self.send_error(404)
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', f'multipart/x-mixed-replace; boundary={BOUNDARY}')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        spectator.attach(channel)
+        try:
+            seen = 0
+            while not spectator.closed:
+                seen, jpeg = channel.wait(seen)
+                if jpeg is None:
+                    continue
+                self.wfile.write(
+                    f'--{BOUNDARY}\r\nContent-Type: image/jpeg\r\n'
+                    f'Content-Length: {len(jpeg)}\r\n\r\n'.encode()
+                    + jpeg + b'\r\n'
+                )
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            spectator.detach(channel)
+
+    def log_message(self, format, *args):
+        pass
+
+class SpectatorServer:
+    def __init__(self, port=SPECTATOR_PORT, host=SPECTATOR_HOST,
+                 max_fps=SPECTATOR_MAX_FPS, quality=SPECTATOR_JPEG_QUALITY,
+                 scale=SPECTATOR_SCALE, hand=True):
+        """
+        Local MJPEG server for spectators
+
+        Args:
+            port: HTTP port (0 picks a free one; see address)
+            host: interface to listen on ('0.0.0.0' to reach it from other
+                machines on the network)
+            max_fps: most frames per second taken from the game per stream
+            quality: JPEG quality (0-100)
+            scale: integer downscale factor
+            hand: also serve the annotated hand-tracking frame
+        """
+        self.channels = {'game': StreamChannel('game', max_fps, scale)}
+        if hand:
+            self.channels['hand'] = StreamChannel('hand', max_fps, scale)
+        self.quality = quality
+        self.closed = False
+        self._wake = threading.Event()
+        self._clients_lock = threading.Lock()
+
+        self.httpd = ThreadingHTTPServer((host, port), StreamHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.spectator = self
+        self.address = self.httpd.server_address
+        self._threads = []
+
+    def start(self):
+        for target, name in ((self.httpd.serve_forever, 'spectator-http'),
+                             (self._encode_loop, 'spectator-encoder')):
+            thread = threading.Thread(target=target, name=name, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    @property
+    def url(self):
+        host, port = self.address[:2]
+        return f"http://{'localhost' if host == '0.0.0.0' else host}:{port}/"
+
+    def attach(self, channel):
+        with self._clients_lock:
+            channel.clients += 1
+
+    def detach(self, channel):
+        with self._clients_lock:
+            channel.clients -= 1
+
+    def watching(self, name):
+        """Whether a stream has clients (e.g. to annotate hand frames for it)"""
+        channel = self.channels.get(name)
+        return channel is not None and channel.clients > 0
+
+    def offer_game(self, surface):
+        """
+        Offer the frame just drawn (game thread); returns at once when
+        nobody watches or the last frame was taken too recently
+        """
+        return self.channels['game'].offer_surface(surface, self._wake)
+
+    def offer_hand(self, frame):
+        """Offer the (annotated) camera frame (game thread)"""
+        channel = self.channels.get('hand')
+        return channel is not None and channel.offer_array(frame, self._wake)
+
+    def _encode_loop(self):
+        import cv2
+
+        params = [cv2.IMWRITE_JPEG_QUALITY, self.quality]
+        while not self.closed:
+            if not self._wake.wait(0.5):
+                continue
+            self._wake.clear()
+            for channel in self.channels.values():
+                channel.encode(cv2, params)
+
+    def stats(self):
+        return {name: channel.stats() for name, channel in self.channels.items()}
+
+    def close(self):
+        self.closed = True
+        self._wake.set()
+        for channel in self.channels.values():
+            channel.wake_clients()
+        if self._threads:
+            self.httpd.shutdown()
+        self.httpd.server_close()
+        for thread in self._threads:
+            thread.join(2.0)
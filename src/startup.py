@@ -0,0 +1,95 @@
+"""
+Startup Module
+Opens the camera and builds the hand detector in the background so the
+game window can appear before OpenCV and MediaPipe have finished loading
+"""
+
+import threading
+import time
+from config import *
+
+class CameraStartup:
+    def __init__(self, camera_index=CAMERA_INDEX):
+        """Prepare background camera and hand detection setup"""
+        self.camera_index = camera_index
+        self.cap = None
+        self.camera = None
+        self.hand_detector = None
+        self.error = None
+        self._detector_error = None
+        self.status = "Waiting"
+        self.timings = {}
+        self.done = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start setup on a daemon thread and return immediately"""
+        self._thread = threading.Thread(
+            target=self._run, name="camera-startup", daemon=True
+        )
+        self._started_at = time.perf_counter()
+        self._thread.start()
+        return self
+
+    def _mark(self, stage, status):
+        """Record how long we have been running when a stage completes"""
+        self.timings[stage] = time.perf_counter() - self._started_at
+        self.status = status
+
+    def _run(self):
+        """Open and test the camera while the detector is built alongside"""
+        # Opening a camera waits on the device and loading MediaPipe waits on
+        # its model files; neither needs the other, so they overlap
+        detector = threading.Thread(
+            target=self._build_detector, name="detector-startup", daemon=True
+        )
+        detector.start()
+        cap = None
+        try:
+            self.status = "Loading OpenCV"
+            import cv2
+            self._mark('import_cv2', "Opening camera")
+
+            # Find (or reuse the cached) best camera; this reads its first frame
+            from camera_discovery import open_camera
+            self.camera = open_camera(self.camera_index)
+            cap = self.camera.cap
+            self._mark('first_camera_frame', "Loading hand tracking")
+
+            detector.join()
+            if self._detector_error is not None:
+                raise self._detector_error
+            self._mark('ready', "Ready")
+
+            self.cap = cap
+        except Exception as e:
+            if cap is not None:
+                cap.release()
+            # Wait for the detector, so it can't be built after we gave up
+            # and then never closed
+            detector.join()
+            if self.hand_detector is not None:
+                self.hand_detector.close()
+                self.hand_detector = None
+            self.error = e
+            self._mark('failed', "Not Available")
+        finally:
+            self.done.set()
+
+    def _build_detector(self):
+        """Import MediaPipe and build the hand detector (detector thread)"""
+        try:
+            from hand_gesture_detector import HandGestureDetector
+            self.hand_detector = HandGestureDetector()
+            self.timings['detector_ready'] = time.perf_counter() - self._started_at
+        except Exception as e:
+            self._detector_error = e
+
+    @property
+    def ready(self):
+        """True once setup finished successfully"""
+        return self.done.is_set() and self.error is None
+
+    def wait(self, timeout=None):
+        """Block until setup has finished; returns False on timeout"""
+        return self.done.wait(timeout)
@@ -0,0 +1,268 @@
+"""
+Telemetry Module
+Collects gameplay events in a fixed-size in-memory ring and writes them
+from a background thread to rotating, gzip-compressed JSON-lines files
+
+Each flushed batch is a complete gzip member, so the files are readable
+while the writer still has them open, or after the process was killed.
+"""
+
+import glob
+import gzip
+import json
+import os
+import threading
+from collections import deque
+import time
+import uuid
+import zlib
+from config import *
+
+class Telemetry:
+    def __init__(self, directory=TELEMETRY_DIR, capacity=TELEMETRY_RING_SIZE,
+                 flush_interval=TELEMETRY_FLUSH_INTERVAL,
+                 max_file_bytes=TELEMETRY_MAX_FILE_BYTES,
+                 max_files=TELEMETRY_MAX_FILES, enabled=TELEMETRY_ENABLED):
+        """
+        Args:
+            directory: where telemetry-*.jsonl.gz files are written
+            capacity: ring size; when the writer falls behind by more than
+                this many events, the oldest ones are dropped (and counted)
+            flush_interval: seconds between background flushes
+            max_file_bytes: uncompressed bytes per file before rotating
+            max_files: number of files kept; older ones are deleted
+            enabled: False makes emit() a no-op and starts no thread
+        """
+        self.enabled = enabled
+        self.directory = directory
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.max_file_bytes = max_file_bytes
+        self.max_files = max_files
+        self.run_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+        # Single producer (game thread) / single consumer (writer thread).
+        # The producer only ever writes a slot and then bumps `written`; the
+        # consumer only moves `read`. No locks are taken on the hot path.
+        self.ring = [None] * capacity
+        self.written = 0
+        self.read = 0
+        self.dropped = 0
+
+        self._file = None
+        self._file_bytes = 0
+        self._file_index = 0
+        self._stop = threading.Event()
+        self._thread = None
+        if enabled:
+            self._thread = threading.Thread(
+                target=self._flush_loop, name="telemetry-writer", daemon=True
+            )
+            self._thread.start()
+
+    def emit(self, kind, **fields):
+        """Record one event (game thread; never blocks)"""
+        if not self.enabled:
+            return
+        index = self.written
+        self.ring[index % self.capacity] = (time.time(), kind, fields)
+        self.written = index + 1
+
+    def drain(self):
+        """
+        Take every event not yet consumed (writer thread)
+        Returns: list of (timestamp, kind, fields) tuples, oldest first
+        """
+        written = self.written
+        start = max(self.read, written - self.capacity)
+        batch = [self.ring[i % self.capacity] for i in range(start, written)]
+
+        # Slots the producer overwrote while we were copying are unreliable
+        overwritten = self.written - self.capacity - start
+        if overwritten > 0:
+            batch = batch[overwritten:]
+            start += overwritten
+
+        self.dropped += start - self.read
+        self.read = written
+        return batch
+
+    def _flush_loop(self):
+        """Write batches until closed, then write whatever is left"""
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def flush(self):
+        """Write all pending events to disk"""
+        dropped_before = self.dropped
+        batch = self.drain()
+        if self.dropped > dropped_before:
+            batch.append((time.time(), 'telemetry_dropped',
+                          {'count': self.dropped - dropped_before}))
+        if not batch:
+            return
+
+        lines = []
+        for timestamp, kind, fields in batch:
+            record = {'t': round(timestamp, 4), 'kind': kind, 'run': self.run_id}
+            record.update(fields)
+            lines.append(json.dumps(record, separators=(',', ':')))
+        data = ('\n'.join(lines) + '\n').encode('utf-8')
+
+        try:
+            if self._file is None or self._file_bytes >= self.max_file_bytes:
+                self._rotate()
+            self._file.write(gzip.compress(data))
+            self._file.flush()
+            self._file_bytes += len(data)
+        except OSError as e:
+            print(f"Warning: telemetry write failed - {e}")
+
+    def _rotate(self):
+        """Start a new file and delete the oldest beyond max_files"""
+        if self._file is not None:
+            self._file.close()
+        os.makedirs(self.directory, exist_ok=True)
+        self._file_index += 1
+        path = os.path.join(
+            self.directory, f"telemetry-{self.run_id}-{self._file_index:04d}.jsonl.gz"
+        )
+        self._file = open(path, 'ab')
+        self._file_bytes = 0
+
+        files = sorted(glob.glob(os.path.join(self.directory, 'telemetry-*.jsonl.gz')))
+        for old in files[:-self.max_files]:
+            try:
+                os.remove(old)
+            except OSError:
+                pass
+
+    def close(self):
+        """Stop the writer thread after a final flush"""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+class CameraSnapshotter:
+    def __init__(self, telemetry, frame_bus, interval=TELEMETRY_SNAPSHOT_INTERVAL,
+                 width=TELEMETRY_SNAPSHOT_WIDTH, max_snapshots=TELEMETRY_MAX_SNAPSHOTS):
+        """
+        Saves a small JPEG of the camera every `interval` seconds next to the
+        telemetry files (lighting and framing problems on fleet machines)
+
+        A frame bus subscriber on its own thread: it takes the newest frame
+        when it wakes and skips the rest, so it never holds up the camera.
+
+        Args:
+            telemetry: Telemetry whose directory and run id are used
+            frame_bus: FrameBus the camera frames are published on
+            interval: seconds between snapshots
+            width: snapshot width in pixels (height keeps the aspect ratio)
+            max_snapshots: number of snapshots kept; older ones are deleted
+        """
+        self.telemetry = telemetry
+        self.subscription = frame_bus.subscribe('telemetry_snapshot')
+        self.interval = interval
+        self.width = width
+        self.max_snapshots = max_snapshots
+        self.count = 0
+        # Taken on the game thread by take_results(), which emits them: the
+        # telemetry ring only has a single producer
+        self.results = deque()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._snapshot_loop, name="telemetry-snapshots", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def _snapshot_loop(self):
+        while not self._stop.wait(self.interval):
+            self.snapshot()
+
+    def snapshot(self):
+        """
+        Save the newest frame not yet seen, if any
+
+        Returns: dict {'file', 'brightness', 'skipped'}, or None
+        """
+        import cv2
+
+        frame = self.subscription.poll()
+        if frame is None:
+            return None
+        with frame:
+            height, width = frame.array.shape[:2]
+            size = (self.width, max(1, height * self.width // width))
+            small = cv2.resize(frame.array, size, interpolation=cv2.INTER_AREA)
+
+        self.count += 1
+        name = f"snapshot-{self.telemetry.run_id}-{self.count:04d}.jpg"
+        try:
+            os.makedirs(self.telemetry.directory, exist_ok=True)
+            cv2.imwrite(os.path.join(self.telemetry.directory, name), small)
+            files = sorted(glob.glob(os.path.join(self.telemetry.directory, 'snapshot-*.jpg')))
+            for old in files[:-self.max_snapshots]:
+                os.remove(old)
+        except OSError as e:
+            print(f"Warning: camera snapshot failed - {e}")
+            return None
+
+        result = {
+            'file': name,
+            'brightness': round(float(small.mean()), 1),
+            'skipped': self.subscription.skipped,
+        }
+        self.results.append(result)
+        return result
+
+    def take_results(self):
+        """Snapshots saved since the last call (game thread)"""
+        results = []
+        while self.results:
+            results.append(self.results.popleft())
+        return results
+
+    def close(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+def read_batches(path):
+    """
+    Decompress a telemetry file one gzip member (flushed batch) at a time
+
+    Returns: list of bytes; a batch cut short (the writer was killed
+        mid-write) is skipped
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    batches = []
+    while data:
+        member = zlib.decompressobj(wbits=31)
+        try:
+            batch = member.decompress(data)
+        except zlib.error:
+            break
+        if not member.eof:
+            break
+        batches.append(batch)
+        data = member.unused_data
+    return batches
+
+def read_telemetry(directory=TELEMETRY_DIR):
+    """Read every event from the telemetry files in a directory, oldest first"""
+    events = []
+    for path in sorted(glob.glob(os.path.join(directory, 'telemetry-*.jsonl.gz'))):
+        for batch in read_batches(path):
+            events.extend(json.loads(line) for line in batch.splitlines() if line.strip())
+    return events
@@ -0,0 +1,103 @@
+"""
+Turbo Module
+Runs the real game loop headless, with scripted input and no frame cap,
+for fast end-to-end tests and throughput measurements
+"""
+
+import os
+import random
+import tempfile
+import time
+import zlib
+
+def configure_headless():
+    """Use SDL's dummy drivers; must run before the game initializes pygame"""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+class TurboRunner:
+    def __init__(self, input_source, render=True, seed=0, score_store=None,
+                 telemetry=None):
+        """
+        Create a headless, camera-less game driven by input_source
+
+        Args:
+            input_source: object with begin_tick(tick) and poll(game)
+            render: False skips drawing until the final frame
+            seed: seed for pipe placement, so runs are reproducible
+            score_store: ScoreStore to use (default: a throwaway database)
+            telemetry: Telemetry to use (default: disabled)
+        """
+        configure_headless()
+        from game_engine import HandGestureFlappyBird
+        from score_store import ScoreStore
+        from telemetry import Telemetry
+
+        if telemetry is None:
+            telemetry = Telemetry(enabled=False)
+
+        # A throwaway score database, removed again by close()
+        self.temp_dir = None
+        if score_store is None:
+            self.temp_dir = tempfile.TemporaryDirectory(prefix='flappy-turbo-')
+            score_store = ScoreStore(os.path.join(self.temp_dir.name, 'scores.db'))
+
+        random.seed(seed)
+        self.input_source = input_source
+        self.game = HandGestureFlappyBird(
+            use_camera=False, score_store=score_store, telemetry=telemetry
+        )
+        self.game.input_source = input_source
+        self.game.render_enabled = render
+        self.game.scheduler.uncapped = True
+        self.game.scheduler.enabled = False  # draw every tick, like play
+
+    def run(self, ticks):
+        """
+        Run up to `ticks` loop iterations as fast as possible
+
+        Returns: dict {
+            'ticks', 'seconds', 'ticks_per_second',
+            'state': final state name, 'score', 'high_score',
+            'transitions': list of (tick, state name) state changes,
+            'checksum': CRC32 of the final rendered frame
+        }
+        """
+        game = self.game
+        transitions = [(0, game.game_state.name)]
+        start = time.perf_counter()
+        tick = 0
+        while tick < ticks:
+            self.input_source.begin_tick(tick)
+            running = game.step()
+            tick += 1
+            if game.game_state.name != transitions[-1][1]:
+                transitions.append((tick, game.game_state.name))
+            if not running:
+                break
+        seconds = time.perf_counter() - start
+
+        return {
+            'ticks': tick,
+            'seconds': seconds,
+            'ticks_per_second': tick / seconds if seconds > 0 else float('inf'),
+            'state': game.game_state.name,
+            'score': game.score_manager.score,
+            'high_score': game.score_manager.high_score,
+            'transitions': transitions,
+            'checksum': self.frame_checksum(),
+        }
+
+    def frame_checksum(self):
+        """Render the current state and return a CRC32 of the pixels"""
+        import pygame
+
+        self.game.draw()
+        return zlib.crc32(pygame.image.tobytes(self.game.screen, 'RGB'))
+
+    def close(self):
+        """Release the game's resources and the throwaway score database"""
+        self.game.cleanup()
+        if self.temp_dir is not None:
+            self.temp_dir.cleanup()
+            self.temp_dir = None
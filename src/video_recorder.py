@@ -0,0 +1,204 @@
+"""
+Video Recorder Module
+Records gameplay from the pygame screen without slowing the game loop: the
+game thread only copies pixels into a pooled buffer, and a background
+thread converts, encodes and writes them
+"""
+
+import os
+import queue
+import threading
+import time
+from collections import deque
+
+import numpy as np
+import pygame
+from config import *
+
+class VideoRecorder:
+    def __init__(self, path=None, preroll=RECORDING_PREROLL, every=RECORDING_EVERY,
+                 scale=RECORDING_SCALE, fps=FPS, queue_size=RECORDING_QUEUE_SIZE,
+                 directory=RECORDING_DIR):
+        """
+        Args:
+            path: video file that receives every recorded frame, or None to
+                keep only the pre-roll
+            preroll: seconds of recent frames kept in memory (as JPEG) for
+                save_highlight; 0 disables it
+            every: record every k-th displayed frame
+            scale: integer downscale factor (2 = half width and height)
+            fps: display rate; the video runs at fps / every
+            queue_size: frames waiting for the encoder; when it falls behind
+                further, new frames are dropped (and counted), never waited on
+            directory: where highlight clips are saved
+        """
+        self.path = path
+        self.every = max(1, int(every))
+        self.scale = max(1, int(scale))
+        self.fps = fps / self.every
+        self.directory = directory
+        self.preroll = deque(maxlen=int(preroll * self.fps)) if preroll > 0 else None
+
+        # Buffers cycle pool -> queue -> encoder -> pool (list append and
+        # pop are atomic); the game thread never allocates once it is warm
+        self.pool = [None] * (queue_size + 2)
+        self.queue = queue.Queue(queue_size)
+        self.displayed = 0
+        self.captured = 0
+        self.dropped = 0
+        self.encoded = 0
+        self.highlights = []
+
+        self._writer = None
+        self._highlight_requests = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._encode_loop, name="video-recorder", daemon=True
+        )
+        self._thread.start()
+
+    def _take_buffer(self, shape):
+        """A pooled buffer of this shape, or None if all are in use"""
+        if not self.pool:
+            return None
+        buffer = self.pool.pop()
+        if buffer is None or buffer.shape != shape:
+            buffer = np.empty(shape, dtype=np.uint8)
+        return buffer
+
+    def capture(self, surface):
+        """
+        Record the frame just drawn to surface (game thread; never blocks)
+
+        Returns: bool - True if the frame was queued for encoding
+        """
+        self.displayed += 1
+        if (self.displayed - 1) % self.every:
+            return False
+
+        # A (width, height, 3) view of the surface; strided slicing keeps
+        # the downscale to a single copy
+        pixels = pygame.surfarray.pixels3d(surface)
+        view = pixels[::self.scale, ::self.scale]
+        buffer = self._take_buffer(view.shape)
+        if buffer is not None:
+            np.copyto(buffer, view)
+        del pixels, view  # unlocks the surface
+        if buffer is None:
+            self.dropped += 1
+            return False
+
+        try:
+            self.queue.put_nowait(buffer)
+        except queue.Full:
+            self.pool.append(buffer)
+            self.dropped += 1
+            return False
+        self.captured += 1
+        return True
+
+    def save_highlight(self, name=None):
+        """
+        Save the pre-roll (the last `preroll` seconds) as a clip; the
+        encoder thread writes it once every frame queued so far is encoded,
+        so the clip ends with the frame just captured
+
+        Args:
+            name: file name (default: highlight-<date>-<time>.avi)
+        """
+        if self.preroll is None:
+            return
+        name = name or f"highlight-{time.strftime('%Y%m%d-%H%M%S')}.avi"
+        self._highlight_requests.put((os.path.join(self.directory, name), self.captured))
+
+    def _encode_loop(self):
+        """Convert and write queued frames until closed, then finish the queue"""
+        import cv2
+
+        quality = [cv2.IMWRITE_JPEG_QUALITY, RECORDING_JPEG_QUALITY]
+        pending = []  # (path, frames captured when it was requested)
+        while True:
+            try:
+                buffer = self.queue.get(timeout=0.1)
+            except queue.Empty:
+                buffer = None
+
+            if buffer is not None:
+                # pygame arrays are (width, height) RGB; OpenCV wants rows of BGR
+                frame = cv2.cvtColor(buffer.transpose(1, 0, 2), cv2.COLOR_RGB2BGR)
+                self.pool.append(buffer)
+                try:
+                    self._write(frame)
+                    if self.preroll is not None:
+                        self.preroll.append(cv2.imencode('.jpg', frame, quality)[1])
+                except (OSError, cv2.error) as e:
+                    print(f"Warning: video recording stopped - {e}")
+                    self.path = None
+                self.encoded += 1
+
+            while not self._highlight_requests.empty():
+                pending.append(self._highlight_requests.get())
+            stopping = buffer is None and self._stop.is_set()
+            # Frames queued before a request was made are part of its clip
+            while pending and (stopping or self.encoded >= pending[0][1]):
+                self._write_highlight(pending.pop(0)[0])
+
+            if stopping:
+                break
+
+        if self._writer is not None:
+            self._writer.release()
+            self._writer = None
+
+    def _open_writer(self, path, frame):
+        import cv2
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        height, width = frame.shape[:2]
+        writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*RECORDING_FOURCC),
+                                 self.fps, (width, height))
+        if not writer.isOpened():
+            raise OSError(f"cannot write video to {path}")
+        return writer
+
+    def _write(self, frame):
+        if self.path is None:
+            return
+        if self._writer is None:
+            self._writer = self._open_writer(self.path, frame)
+        self._writer.write(frame)
+
+    def _write_highlight(self, path):
+        """Decode the pre-roll into a clip (encoder thread)"""
+        import cv2
+
+        clip = list(self.preroll)
+        if not clip:
+            return
+        try:
+            writer = None
+            for jpeg in clip:
+                frame = cv2.imdecode(jpeg, cv2.IMREAD_COLOR)
+                if writer is None:
+                    writer = self._open_writer(path, frame)
+                writer.write(frame)
+            writer.release()
+            self.highlights.append(path)
+            print(f"Saved highlight clip: {path}")
+        except (OSError, cv2.error) as e:
+            print(f"Warning: could not save highlight - {e}")
+
+    def stats(self):
+        return {
+            'displayed': self.displayed,
+            'captured': self.captured,
+            'dropped': self.dropped,
+            'encoded': self.encoded,
+            'highlights': len(self.highlights),
+        }
+
+    def close(self, timeout=5.0):
+        """Encode what is queued, write pending highlights and stop"""
+        self._stop.set()
+        self._thread.join(timeout)
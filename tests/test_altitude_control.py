@@ -0,0 +1,95 @@
+"""
+Tests for analog altitude control
+Run with: python -m pytest tests/
+"""
+
+import sys
+import os
+import numpy as np
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from config import (
+    SCREEN_HEIGHT, BIRD_RADIUS, FLAP_COOLDOWN, ALTITUDE_HAND_RANGE,
+    ALTITUDE_MAX_SPEED
+)
+from altitude_control import OneEuroFilter, AltitudeControl
+from game_objects import Bird
+
+def test_one_euro_smooths_a_still_hand():
+    """Test the One-Euro filter halves the jitter of a hand held still"""
+    rng = np.random.default_rng(0)
+    samples = 0.5 + rng.normal(0, 0.01, 300)
+    one_euro = OneEuroFilter(min_cutoff=1.0, beta=8.0)
+    filtered = [one_euro(x, i / 30) for i, x in enumerate(samples)]
+    assert np.std(filtered[30:]) < np.std(samples) / 2
+
+def test_one_euro_follows_fast_moves():
+    """A jump in hand height is mostly followed within a few frames"""
+    one_euro = OneEuroFilter(min_cutoff=1.0, beta=8.0)
+    for i in range(30):
+        one_euro(0.2, i / 30)
+    values = [one_euro(0.8, (30 + i) / 30) for i in range(5)]
+    assert values[-1] > 0.7
+
+def test_dead_zone_and_mapping():
+    """Test hand height maps onto the screen with a dead zone for small moves"""
+    control = AltitudeControl(min_cutoff=1000.0, beta=0.0, dead_zone=10)
+    top, bottom = ALTITUDE_HAND_RANGE
+    assert control.update(top, 0.0) == BIRD_RADIUS
+    # Tiny moves are ignored, larger ones move the target
+    assert control.update(top + 0.001, 0.1) == BIRD_RADIUS
+    assert control.update(bottom, 0.2) == pytest.approx(SCREEN_HEIGHT - BIRD_RADIUS, abs=1)
+
+def test_target_held_then_dropped_when_hand_lost():
+    """Test the target is held briefly after the hand is lost, then dropped"""
+    control = AltitudeControl(hold_time=0.5)
+    control.update(0.5, 0.0)
+    assert control.update(None, 0.3) is not None
+    assert control.update(None, 0.6) is None
+
+def test_bird_steers_with_speed_limit():
+    """Test the bird steers to its target no faster than ALTITUDE_MAX_SPEED"""
+    bird = Bird()
+    start = bird.y
+    bird.update(target_y=start + 500)
+    assert bird.y - start == ALTITUDE_MAX_SPEED
+    for _ in range(200):
+        bird.update(target_y=200)
+    assert abs(bird.y - 200) < 1
+
+def test_gesture_flaps_ignored_while_steering(tmp_path):
+    """Test flap gestures are neither counted nor applied while steering"""
+    from turbo import configure_headless
+    configure_headless()
+    from game_engine import HandGestureFlappyBird
+    from score_store import ScoreStore
+    from telemetry import Telemetry
+
+    game = HandGestureFlappyBird(
+        use_camera=False, control_mode='altitude',
+        score_store=ScoreStore(str(tmp_path / 'scores.db')),
+        telemetry=Telemetry(enabled=False)
+    )
+    try:
+        flap = {'should_flap': True, 'gesture': 'peace', 'confidence': 1.0}
+        game.last_flap_time = -FLAP_COOLDOWN - 1
+        assert game.apply_flap_cooldown(flap)  # starts a game from the menu
+        game.start_game()
+
+        game.altitude_control.update(0.5, 0.0)
+        game.last_flap_time = -FLAP_COOLDOWN - 1
+        assert not game.apply_flap_cooldown(flap)
+        game.update_game_playing(True)
+        assert game.score_manager.gesture_flaps == 0
+
+        # With no hand to steer by, a flap gesture flaps again
+        game.altitude_control.reset()
+        assert game.last_flap_time < 0  # the ignored gesture left no cooldown
+        assert game.apply_flap_cooldown(flap)
+        game.update_game_playing(True)
+        assert game.score_manager.gesture_flaps == 1
+    finally:
+        game.cleanup()
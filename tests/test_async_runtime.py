@@ -0,0 +1,147 @@
+"""
+Tests for the asyncio game runtime
+Run with: python -m pytest tests/
+"""
+
+import sys
+import os
+import asyncio
+import numpy as np
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from async_runtime import AsyncGameRunner, DropQueue
+
+def test_drop_queue_policies():
+    """Test full queues drop the oldest or the newest item"""
+    async def scenario():
+        oldest = DropQueue(2, 'drop_oldest')
+        newest = DropQueue(2, 'drop_newest')
+        for i in range(5):
+            oldest.put(i)
+            newest.put(i)
+        return oldest.drain(), oldest.dropped, newest.drain(), newest.dropped
+
+    assert asyncio.run(scenario()) == ([3, 4], 3, [0, 1], 3)
+
+class FakeCapture:
+    def read(self, image=None):
+        return True, np.zeros((48, 64, 3), dtype=np.uint8)
+
+    def grab(self):
+        return True
+
+    def set(self, prop, value):
+        return True
+
+    def release(self):
+        pass
+
+class FakeDetector:
+    def process_frame(self, frame, annotate=True):
+        return {'should_flap': True, 'gesture': 'peace', 'frame': frame}
+
+    def set_model_complexity(self, model_complexity):
+        pass
+
+def test_runner_starts_game_from_gesture(tmp_path):
+    """Test frames flow capture -> inference -> tick and start the game"""
+    from game_engine import HandGestureFlappyBird, GameState
+    from score_store import ScoreStore
+    from telemetry import Telemetry
+
+    game = HandGestureFlappyBird(
+        use_camera=False,
+        score_store=ScoreStore(str(tmp_path / 'scores.db')),
+        telemetry=Telemetry(enabled=False)
+    )
+    game.cap = FakeCapture()
+    game.hand_detector = FakeDetector()
+    game.camera_available = True
+    game.show_preview = False
+    game.scheduler.enabled = False  # full tick rate on the game over screen too
+
+    # Flaps are ignored for FLAP_COOLDOWN ms after pygame starts, so run
+    # for about a second of game time
+    runner = AsyncGameRunner(game, fps=240, max_ticks=240)
+    runner.run()
+
+    assert runner.counters['ticks'] == 240
+    assert runner.counters['inferences'] > 0
+    assert game.game_state != GameState.MENU
+
+class AlwaysFlap:
+    name = 'always'
+
+    def __init__(self):
+        self.polls = 0
+
+    def poll(self, game):
+        self.polls += 1
+        return True
+
+def test_runner_polls_the_input_source(tmp_path):
+    """Test an input source (e.g. --autopilot) drives the async runtime"""
+    from game_engine import HandGestureFlappyBird, GameState
+    from score_store import ScoreStore
+    from telemetry import Telemetry
+
+    game = HandGestureFlappyBird(
+        use_camera=False,
+        score_store=ScoreStore(str(tmp_path / 'scores.db')),
+        telemetry=Telemetry(enabled=False)
+    )
+    game.input_source = source = AlwaysFlap()
+    runner = AsyncGameRunner(game, fps=240, max_ticks=120)
+    runner.run()
+
+    assert game.game_state != GameState.MENU
+    assert source.polls >= 100
+    assert game.bird.y < 100  # flapping every tick keeps it near the top
+
+def test_profiler_times_tick_and_render_stages(tmp_path):
+    """Test --profile works with the async runtime too"""
+    from game_engine import HandGestureFlappyBird
+    from profiler import Profiler
+    from score_store import ScoreStore
+    from telemetry import Telemetry
+
+    game = HandGestureFlappyBird(
+        use_camera=False,
+        score_store=ScoreStore(str(tmp_path / 'scores.db')),
+        telemetry=Telemetry(enabled=False)
+    )
+    game.profiler = Profiler(slow_frame_ms=0, directory=str(tmp_path / 'profiles'))
+    game.scheduler.enabled = False  # tick the menu at full rate
+    runner = AsyncGameRunner(game, fps=240, max_ticks=30)
+    runner.run()
+
+    stages = game.profiler.stage_totals
+    assert game.profiler.frames == 30 + runner.counters['renders']
+    assert {'events', 'camera', 'update', 'bookkeeping', 'draw', 'preview'} <= set(stages)
+    assert game.profiler.dumps
+
+def test_idle_screens_tick_slowly_and_draw_once(tmp_path):
+    """Test the async runtime follows the idle scheduler when paused"""
+    import time
+    from config import ASYNC_IDLE_FPS
+    from game_engine import HandGestureFlappyBird, GameState
+    from score_store import ScoreStore
+    from telemetry import Telemetry
+
+    game = HandGestureFlappyBird(
+        use_camera=False,
+        score_store=ScoreStore(str(tmp_path / 'scores.db')),
+        telemetry=Telemetry(enabled=False)
+    )
+    game.start_game()
+    game.game_state = GameState.PAUSED
+    runner = AsyncGameRunner(game, fps=240, max_ticks=10)
+    start = time.perf_counter()
+    runner.run()
+
+    assert time.perf_counter() - start >= 8 / ASYNC_IDLE_FPS
+    assert runner.counters['renders'] == 1
@@ -0,0 +1,100 @@
+"""
+Tests for the autopilot policy, headless rules and neuroevolution trainer
+Run with: python -m pytest tests/
+"""
+
+import sys
+import os
+import numpy as np
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from autopilot import (
+    PolicyNetwork, HeadlessGame, Trainer, AutopilotInput, evaluate_policy
+)
+
+class AlwaysFlap:
+    def act(self, features):
+        return True
+
+class GapSeeker:
+    """
+    Flaps when below the next gap's centre and falling; stops flying after
+    `pipes` pipes, so the game ends on a pipe or the ground. Works only
+    from the observed features, so it acts the same in both game loops.
+    """
+
+    def __init__(self, pipes=4):
+        self.pipes = pipes
+        self.passed = 0
+        self.distance = None
+
+    def act(self, features):
+        _, velocity, gap_offset, distance = features
+        if self.distance is not None and distance > self.distance + 0.1:
+            self.passed += 1  # the next pipe became the target
+        self.distance = distance
+        if self.passed >= self.pipes:
+            return False
+        return gap_offset < -0.05 and velocity > 0
+
+def test_policy_roundtrip(tmp_path):
+    """Test a saved policy loads with the same weights and actions"""
+    policy = PolicyNetwork(hidden=4)
+    path = str(tmp_path / 'policy.npz')
+    policy.save(path)
+    loaded = PolicyNetwork.load(path)
+    features = np.array([0.1, -0.2, 0.3, 0.5])
+    assert loaded.act(features) == policy.act(features)
+    assert np.array_equal(loaded.vector, policy.vector)
+
+def test_headless_game_is_deterministic():
+    """Test the headless rules replay the same game for the same course"""
+    policy = PolicyNetwork(vector=np.random.default_rng(3).normal(0, 1, PolicyNetwork.size()))
+    assert HeadlessGame(7).play(policy) == HeadlessGame(7).play(policy)
+    # Flapping non-stop pins the bird to the ceiling until the first pipe
+    score, ticks = HeadlessGame(7).play(AlwaysFlap())
+    assert score == 0 and ticks < 400
+
+def test_headless_matches_live_game():
+    """A pilot passes the same pipes and dies on the same tick in the real loop"""
+    from turbo import TurboRunner
+
+    score, ticks = HeadlessGame(2).play(GapSeeker(), max_ticks=3000)
+    assert score >= 3 and ticks < 3000
+
+    runner = TurboRunner(AutopilotInput(GapSeeker()), render=False, seed=2)
+    report = runner.run(3000)
+    runner.close()
+    assert report['score'] == score
+    assert report['transitions'][-1] == (ticks, 'GAME_OVER')
+
+def test_attract_mode_restarts_after_game_over():
+    """Test an autopilot with a restart delay starts the next game by itself"""
+    from turbo import TurboRunner
+
+    runner = TurboRunner(AutopilotInput(GapSeeker(pipes=1), restart_delay=0),
+                         render=False, seed=2)
+    report = runner.run(1500)
+    runner.close()
+    states = [state for _, state in report['transitions']]
+    assert states[:4] == ['MENU', 'PLAYING', 'GAME_OVER', 'PLAYING']
+    assert states.count('GAME_OVER') >= 2
+
+def test_training_improves_and_resumes(tmp_path):
+    """Test training beats the initial population on unseen courses and resumes"""
+    checkpoint = str(tmp_path / 'checkpoint.npz')
+    trainer = Trainer(population=16, elite=4, games=2, max_ticks=1500, seed=0)
+    held_out = [100, 101, 102]  # courses training never plays
+    initial = max(evaluate_policy((vector, trainer.hidden, held_out, 1500))
+                  for vector in trainer.population)
+    trainer.run(4, workers=2, checkpoint=checkpoint, report=None)
+    assert evaluate_policy((trainer.best, trainer.hidden, held_out, 1500)) > initial
+    assert all(h['games_per_second_per_core'] > 0 for h in trainer.history)
+
+    resumed = Trainer.load_checkpoint(checkpoint)
+    assert resumed.generation == 4
+    assert np.array_equal(resumed.population, trainer.population)
+    task = (resumed.best, resumed.hidden, [0], 1500)
+    assert evaluate_policy(task) > 0
@@ -0,0 +1,56 @@
+"""
+Tests for low-latency camera capture and the glass-to-flap measurement
+Run with: python -m pytest tests/
+"""
+
+import sys
+import os
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from camera_capture import LowLatencyCapture, configure_capture
+from flap_latency import (
+    SimulatedCamera, MarkerDetector, flash_video_frames, measure_flap_latency
+)
+
+def test_drain_returns_freshest_frame():
+    """A read after falling behind skips every queued frame"""
+    frames = [f.copy() for f in flash_video_frames([], 2.0, fps=50, size=(8, 8))]
+    for i, frame in enumerate(frames):
+        frame[0, 0, 0] = i
+    camera = SimulatedCamera(frames, fps=50, buffer_frames=4)
+    camera.start()
+
+    time.sleep(0.2)  # ten frames exposed, four of them queued
+    ret, frame = LowLatencyCapture(camera).read()
+    assert ret
+    # Plain reads would return frame 0; the drain reaches the newest
+    assert frame[0, 0, 0] >= 9
+    assert camera.dropped >= 6
+
+def test_buffer_size_is_used_when_honoured():
+    """Test configure_capture reports whether the one-frame buffer was honoured"""
+    camera = SimulatedCamera([], fps=30, honour_buffer_size=True)
+    assert configure_capture(camera)
+    assert camera.buffer_frames == 1
+    assert not configure_capture(SimulatedCamera([], fps=30))
+
+def test_low_latency_capture_cuts_flap_delay():
+    """Glass-to-flap delay with a slow detector: buffered vs low-latency"""
+    events = [0.4, 1.0, 1.6]
+    results = {}
+    for low_latency in (False, True):
+        camera = SimulatedCamera(
+            flash_video_frames(events, 2.2, size=(64, 48)), fps=30, buffer_frames=4
+        )
+        results[low_latency] = measure_flap_latency(
+            camera, events, MarkerDetector(cost_ms=50), low_latency
+        )
+
+    assert results[True]['missed'] == 0
+    buffered = sorted(results[False]['delays_ms'])
+    fresh = sorted(results[True]['delays_ms'])
+    assert fresh[len(fresh) // 2] < buffered[len(buffered) // 2]
+    assert max(fresh) < 150
@@ -0,0 +1,99 @@
+"""
+Tests for concurrent camera probing and best-camera selection
+Run with: python -m pytest tests/
+"""
+
+import sys
+import os
+import time
+import numpy as np
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from camera_discovery import (
+    discover_cameras, select_camera, open_camera, load_camera_cache
+)
+
+class FakeCapture:
+    """Delivers frames at a fixed rate; open_delay simulates a slow driver"""
+
+    def __init__(self, fps, open_delay=0.0, working=True):
+        time.sleep(open_delay)
+        self.interval = 1.0 / fps
+        self.working = working
+        self.released = False
+
+    def read(self):
+        if not self.working:
+            return False, None
+        time.sleep(self.interval)
+        return True, np.zeros((48, 64, 3), dtype=np.uint8)
+
+    def release(self):
+        self.released = True
+
+def make_opener(devices, opened=None):
+    """Opener for a dict of index -> FakeCapture kwargs"""
+    def opener(index, size):
+        cap = FakeCapture(**devices[index])
+        if opened is not None:
+            opened.append(cap)
+        return cap
+    return opener
+
+DEVICES = {
+    0: {'fps': 15},
+    1: {'fps': 60},
+    2: {'fps': 30, 'working': False},
+    3: {'fps': 60, 'open_delay': 5.0},  # hangs in the driver
+}
+
+def test_fastest_working_camera_is_selected():
+    """The 60 fps device wins; the dead and hung ones are rejected"""
+    started = time.perf_counter()
+    probes = discover_cameras(
+        DEVICES, timeout=1.0, duration=0.3, opener=make_opener(DEVICES)
+    )
+    elapsed = time.perf_counter() - started
+
+    # Probes ran concurrently and the hung device only cost the timeout
+    assert elapsed < 2.0
+    by_index = {p.index: p for p in probes}
+    assert by_index[0].ok and by_index[1].ok
+    assert not by_index[2].ok and not by_index[3].ok
+    assert isinstance(by_index[3].error, TimeoutError)
+    assert by_index[1].fps > by_index[0].fps
+    assert by_index[1].first_frame_ms is not None
+
+    assert select_camera(probes).index == 1
+
+def test_open_camera_caches_choice(tmp_path):
+    """The winner is cached, other captures released, and the cache reused"""
+    cache = str(tmp_path / 'camera.json')
+    devices = {0: {'fps': 15}, 1: {'fps': 60}}
+    opened = []
+
+    probe = open_camera(
+        None, cache_path=cache, timeout=2.0,
+        opener=make_opener(devices, opened), indices=devices
+    )
+
+    assert probe.index == 1 and probe.cap is not None
+    assert len(opened) == 2
+    assert [cap.released for cap in opened].count(False) == 1
+    assert load_camera_cache(cache)['index'] == 1
+
+    # Next run opens only the cached device
+    opened.clear()
+    probe = open_camera(None, cache_path=cache, opener=make_opener(devices, opened))
+    assert probe.index == 1
+    assert len(opened) == 1
+
+def test_open_camera_without_cameras_raises(tmp_path):
+    """Test opening fails when no probed camera works"""
+    devices = {0: {'fps': 30, 'working': False}}
+    with pytest.raises(Exception):
+        open_camera(0, cache_path=str(tmp_path / 'camera.json'),
+                    opener=make_opener(devices))
@@ -0,0 +1,159 @@
+"""
+Tests for the fixed-point versus simulation
+Run with: python -m pytest tests/
+"""
+
+import sys
+import os
+import random
+import struct
+import zlib
+
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from config import (
+    SCREEN_HEIGHT, PIPE_GAP, BIRD_RADIUS, BIRD_START_Y, PIPE_WIDTH,
+    FIXED_POINT_SCALE
+)
+from netplay import VersusSim, RollbackSession
+from fixed_physics import FixedVersusSim, make_versus_sim, snapshot_table
+
+def random_match(seed, ticks=3000):
+    rng = random.Random(seed)
+    every = rng.randint(8, 40)
+    return [(rng.random() < 1 / every, rng.random() < 1 / every) for _ in range(ticks)]
+
+def piloted_match(seed, ticks=3000):
+    """
+    Flaps from a gap-seeking pilot flying the float sim, so matches pass
+    many pipes (scoring) before each bird steers into the top or bottom
+    of a gap after a random number of pipes
+    """
+    rng = random.Random(seed)
+    sim = VersusSim(seed)
+    quit = [(rng.randint(3, 10), rng.choice((-80, 80))) for _ in sim.birds]
+    inputs = []
+    for _ in range(ticks):
+        flaps = []
+        for i, bird in enumerate(sim.birds):
+            ahead = [gap for _, x, gap in sim.pipes()
+                     if x + PIPE_WIDTH >= bird.x - bird.radius]
+            target = ahead[0] + PIPE_GAP * 0.7 if ahead else SCREEN_HEIGHT / 2
+            if sim.scores[i] >= quit[i][0]:
+                target += quit[i][1]
+            flaps.append(bird.y > target + rng.uniform(-10, 10) and bird.velocity > 0)
+        inputs.append(tuple(flaps))
+        sim.step(inputs[-1])
+        if sim.over:
+            break
+    return inputs
+
+def play_both(seed):
+    float_sim, fixed_sim = VersusSim(seed), FixedVersusSim(seed)
+    for flaps in piloted_match(seed):
+        float_sim.step(flaps)
+        fixed_sim.step(flaps)
+        assert fixed_sim.alive == float_sim.alive
+        assert fixed_sim.scores == float_sim.scores
+        for fixed_bird, float_bird in zip(fixed_sim.birds, float_sim.birds):
+            assert fixed_bird.y == pytest.approx(float_bird.y, abs=1e-6)
+            assert fixed_bird.velocity == pytest.approx(float_bird.velocity, abs=1e-6)
+    assert fixed_sim.tick == float_sim.tick
+    return float_sim
+
+@pytest.mark.parametrize('seed', range(20))
+def test_fixed_matches_float_rules(seed):
+    """Test fixed-point and float physics play the same piloted match"""
+    sim = play_both(seed)
+    assert sim.over
+    # Both birds died on a pipe, not the floor or the ceiling
+    assert all(BIRD_RADIUS < bird.y < SCREEN_HEIGHT - BIRD_RADIUS for bird in sim.birds)
+
+def test_parity_matches_pass_many_pipes():
+    """Test the parity matches get past pipes, not just the first one"""
+    scores = [min(play_both(seed).scores) for seed in range(20)]
+    assert sum(score >= 3 for score in scores) >= 15
+
+def test_checksum_is_platform_independent():
+    """Test the checksum is a CRC of the packed little-endian int32 state"""
+    sim = FixedVersusSim()
+    start = struct.pack('<9i', 0, BIRD_START_Y * FIXED_POINT_SCALE, 0, 1, 0,
+                        BIRD_START_Y * FIXED_POINT_SCALE, 0, 1, 0)
+    assert sim.checksum() == zlib.crc32(start)
+
+def test_snapshot_restore_and_diff():
+    """Test a restored snapshot replays to the same state and diffs clean"""
+    sim = FixedVersusSim(seed=3)
+    inputs = random_match(1, 300)
+    for flaps in inputs[:150]:
+        sim.step(flaps)
+    snapshot = sim.save()
+    assert len(snapshot) == 4 * len(FixedVersusSim.FIELDS)
+
+    for flaps in inputs[150:]:
+        sim.step(flaps)
+    final = sim.save()
+    assert set(sim.diff(snapshot)) >= {'tick'}
+
+    sim.load(snapshot)
+    assert sim.diff(snapshot) == {}
+    for flaps in inputs[150:]:
+        sim.step(flaps)
+    assert sim.save() == final
+
+def test_snapshot_table():
+    """Test snapshots stack into a table with one row per tick"""
+    sim = FixedVersusSim()
+    snapshots = []
+    for flaps in random_match(2, 50):
+        snapshots.append(sim.save())
+        sim.step(flaps)
+    table = snapshot_table(snapshots)
+    assert table.shape == (50, len(FixedVersusSim.FIELDS))
+    assert list(table[:, 0]) == list(range(50))
+
+class LoopbackTransport:
+    """Delivers packets to the other session after a fixed number of polls"""
+
+    def __init__(self, delay=3):
+        self.peer = None
+        self.delay = delay
+        self.inbox = []
+        self.bytes_sent = self.bytes_received = 0
+
+    def send(self, data):
+        self.peer.inbox.append([self.delay, data])
+
+    def receive(self):
+        for item in self.inbox:
+            item[0] -= 1
+        ready = [data for due, data in self.inbox if due <= 0]
+        self.inbox = [item for item in self.inbox if item[0] > 0]
+        return ready
+
+def test_rollback_with_fixed_sim():
+    """Test rollback sessions converge with the fixed-point simulation"""
+    transports = [LoopbackTransport(), LoopbackTransport()]
+    transports[0].peer, transports[1].peer = transports[1], transports[0]
+    sessions = [RollbackSession(make_versus_sim('fixed', seed=4), p, transports[p])
+                for p in (0, 1)]
+    # The pilot flies without the input delay; shifting its flaps still
+    # keeps the birds in the air for a few pipes
+    match = piloted_match(4, 600)
+    ticks = 600
+    for t in range(ticks):
+        for p, session in enumerate(sessions):
+            session.advance(match[t][p] if t < len(match) else False)
+    for _ in range(10):
+        for session in sessions:
+            session.sync()
+            session.send()
+
+    assert all(s.confirmed for s in sessions)
+    assert sum(s.rollbacks for s in sessions) > 0
+    assert sessions[0].sim.save() == sessions[1].sim.save()
+    assert sessions[0].sim.checksum() == sessions[1].sim.checksum()
+    assert min(sessions[0].sim.scores) >= 2
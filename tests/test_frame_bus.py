@@ -0,0 +1,81 @@
+"""
+Tests for the shared camera frame bus
+Run with: python -m pytest tests/
+"""
+
+import sys
+import os
+import numpy as np
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from frame_bus import FrameBus
+
+def publish(bus, value):
+    """Fill a pooled buffer with value and publish it"""
+    buffer = bus.acquire_buffer((4, 4, 3))
+    buffer.fill(value)
+    return bus.publish(buffer)
+
+def test_published_frames_are_read_only():
+    """Test consumers can't write into a published frame, only a copy"""
+    bus = FrameBus()
+    frame = publish(bus, 7)
+    with pytest.raises(ValueError):
+        frame.array[0, 0, 0] = 1
+
+    copy = frame.copy()
+    copy[0, 0, 0] = 1
+    assert frame.array[0, 0, 0] == 7
+
+def test_buffers_are_reused_once_released():
+    """Test steady-state publishing doesn't allocate"""
+    bus = FrameBus(pool_size=2)
+    for value in range(100):
+        publish(bus, value)
+    # One buffer is held as "latest", the previous one was recycled
+    assert bus.allocated <= 2
+
+def test_held_frames_are_not_recycled():
+    """Test a frame a consumer holds keeps its pixels while newer ones arrive"""
+    bus = FrameBus()
+    consumer = bus.subscribe('slow')
+    publish(bus, 1)
+    held = consumer.poll()
+    for value in range(2, 10):
+        publish(bus, value)
+    assert np.all(held.array == 1)
+    held.release()
+
+def test_latest_frame_is_held_until_released():
+    """Test the newest frame can be read (e.g. for a dump) without recycling"""
+    bus = FrameBus(pool_size=2)
+    assert bus.latest() is None
+    publish(bus, 1)
+    with bus.latest() as frame:
+        for value in range(2, 10):
+            publish(bus, value)
+        assert np.all(frame.array == 1)
+    with bus.latest() as frame:
+        assert frame.array[0, 0, 0] == 9
+
+def test_slow_consumer_skips_to_latest():
+    """Test each subscriber gets the newest frame and counts what it skipped"""
+    bus = FrameBus()
+    fast = bus.subscribe('fast')
+    slow = bus.subscribe('slow')
+
+    for value in range(1, 11):
+        publish(bus, value)
+        with fast.poll() as frame:
+            assert frame.array[0, 0, 0] == value
+        if value % 5 == 0:
+            with slow.poll() as frame:
+                assert frame.array[0, 0, 0] == value
+
+    assert fast.poll() is None
+    stats = bus.stats()['consumers']
+    assert stats['fast'] == {'received': 10, 'skipped': 0}
+    assert stats['slow'] == {'received': 2, 'skipped': 8}
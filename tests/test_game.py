@@ -52,19 +52,232 @@ def test_pipe_creation():
     assert pipe.gap_start > 0
     assert pipe.gap_end > pipe.gap_start
 
-def test_score_manager():
+def test_pipe_manager_recycles_pool():
+    """Test pipes are recycled from the pool instead of reallocated"""
+    from game_objects import PipeManager
+
+    manager = PipeManager(pool_size=6)
+    manager.spawn(800)
+    seen = set()
+    for _ in range(5000):
+        manager.update(100)
+        seen.update(id(pipe) for pipe in manager)
+
+    assert len(seen) <= 6
+    xs = [pipe.x for pipe in manager]
+    assert xs == sorted(xs)
+
+    manager.reset()
+    assert len(manager) == 0
+    assert len(manager.pool) == 6
+
+def test_pipe_manager_steady_state_allocation():
+    """Test that long-running pipe updates do not grow traced memory"""
+    import tracemalloc
+    from game_objects import PipeManager
+
+    manager = PipeManager()
+    manager.spawn(1000)
+
+    tracemalloc.start()
+    try:
+        for _ in range(2000):  # warm up until the pool is in steady state
+            manager.update(100)
+        before = tracemalloc.get_traced_memory()[0]
+        for _ in range(100000):  # ~800 pipe spawns
+            manager.update(100)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    # The deque may hold one extra internal block (~0.5 KB) depending on
+    # where the rolling window sits, but nothing accumulates per spawn
+    assert after - before < 2048
+
+def test_game_objects_are_slotted():
+    """Test game objects use compact slotted representations"""
+    from game_objects import Bird, Pipe, Background
+
+    for obj in (Bird(), Pipe(400), Background()):
+        assert not hasattr(obj, '__dict__')
+
+def test_score_manager(tmp_path):
     """Test score manager functionality"""
+    import pygame
     from game_objects import ScoreManager
+    from score_store import ScoreStore
 
-    score_manager = ScoreManager()
+    pygame.font.init()
+    store = ScoreStore(str(tmp_path / 'scores.db'))
+    score_manager = ScoreManager(store)
     assert score_manager.score == 0
 
+    score_manager.reset_score()
     score_manager.update_score()
+    score_manager.record_flap('gesture')
+    score_manager.record_flap('keyboard')
+    score_manager.record_flap('autopilot')  # not a player flap
     assert score_manager.score == 1
+    assert score_manager.input_flaps == 1
 
     score_manager.reset_score()
     assert score_manager.score == 0
 
+    store.flush()
+    assert store.high_score() == 1
+    session = store.top_scores(1)[0]
+    assert (session['gesture_flaps'], session['keyboard_flaps']) == (1, 1)
+    score_manager.close()
+
+def test_game_engine_import_is_lazy():
+    """Test that importing the engine does not pull in OpenCV or MediaPipe"""
+    import subprocess
+
+    src = os.path.join(os.path.dirname(__file__), '..', 'src')
+    code = (
+        f"import sys; sys.path.insert(0, {src!r}); import game_engine; "
+        "print('cv2' in sys.modules, 'mediapipe' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip().splitlines()[-1] == "False False"
+
+def test_camera_startup_reports_failure():
+    """Test background camera setup finishes and reports a missing camera"""
+    from startup import CameraStartup
+
+    startup = CameraStartup(camera_index=99).start()
+    assert startup.wait(timeout=30)
+    assert not startup.ready
+    assert startup.error is not None
+    assert startup.cap is None
+    assert 'failed' in startup.timings
+
+class SlowCapture:
+    """Stands in for a cv2.VideoCapture"""
+    def __init__(self):
+        self.released = False
+
+    def release(self):
+        self.released = True
+
+def slow_startup(monkeypatch, detector_error=None, camera_error=None, delay=0.3):
+    """CameraStartup with a camera and a detector that each take `delay` s"""
+    import time
+    import types
+    import camera_discovery
+    from startup import CameraStartup
+
+    cap = SlowCapture()
+
+    def open_camera(index):
+        time.sleep(delay)
+        if camera_error:
+            raise camera_error
+        return types.SimpleNamespace(cap=cap)
+
+    class Detector:
+        def __init__(self):
+            time.sleep(delay)
+            if detector_error:
+                raise detector_error
+            self.closed = False
+
+        def close(self):
+            self.closed = True
+
+    monkeypatch.setattr(camera_discovery, 'open_camera', open_camera)
+    monkeypatch.setitem(sys.modules, 'hand_gesture_detector',
+                        types.SimpleNamespace(HandGestureDetector=Detector))
+    return CameraStartup(), cap
+
+def test_camera_startup_overlaps_camera_and_detector(monkeypatch):
+    """Test the camera opens while the detector is being built"""
+    import cv2  # loaded up front so only the two slow steps are timed
+
+    startup, cap = slow_startup(monkeypatch)
+    startup.start()
+    assert startup.wait(timeout=5)
+    assert startup.ready and startup.cap is cap
+    assert startup.hand_detector is not None
+    assert startup.timings['ready'] < 0.5  # sequential setup takes 0.6 s
+    assert startup.timings['detector_ready'] < 0.5
+
+def test_camera_startup_releases_camera_when_detector_fails(monkeypatch):
+    """Test a detector failure fails setup and releases the opened camera"""
+    startup, cap = slow_startup(monkeypatch, detector_error=RuntimeError('no model'))
+    startup.start()
+    assert startup.wait(timeout=5)
+    assert not startup.ready
+    assert str(startup.error) == 'no model'
+    assert startup.cap is None and cap.released
+
+def test_camera_startup_closes_detector_when_camera_fails(monkeypatch):
+    """Test a camera failure closes the detector built alongside it"""
+    import time
+
+    startup, _ = slow_startup(monkeypatch, camera_error=OSError('no camera'), delay=0.1)
+    detectors = []
+    build = startup._build_detector
+
+    def build_slowly():
+        time.sleep(0.3)  # finishes after the camera has already failed
+        build()
+        detectors.append(startup.hand_detector)
+
+    startup._build_detector = build_slowly
+    startup.start()
+    assert startup.wait(timeout=5)
+    assert str(startup.error) == 'no camera'
+    assert startup.hand_detector is None
+    assert len(detectors) == 1 and detectors[0].closed
+
+class QueuedCapture:
+    """A camera with `queued` frames waiting; later grabs wait 20 ms"""
+    def __init__(self, queued):
+        self.queued = queued
+        self.grabs = 0
+
+    def grab(self):
+        import time
+
+        self.grabs += 1
+        if self.queued:
+            self.queued -= 1
+        else:
+            time.sleep(0.02)
+        return True
+
+def test_camera_flush_stops_at_the_first_waiting_grab(tmp_path):
+    """Test resuming drops only queued frames, never waiting more than once"""
+    from turbo import configure_headless
+    configure_headless()
+    from camera_capture import LowLatencyCapture
+    from game_engine import HandGestureFlappyBird
+    from score_store import ScoreStore
+    from telemetry import Telemetry
+
+    game = HandGestureFlappyBird(
+        use_camera=False, score_store=ScoreStore(str(tmp_path / 'scores.db')),
+        telemetry=Telemetry(enabled=False)
+    )
+    try:
+        game.camera_available = True
+        for queued, grabs in [(0, 1), (2, 3), (10, 4)]:
+            game.cap = QueuedCapture(queued)
+            game.flush_camera_buffer()
+            assert game.cap.grabs == grabs
+
+        # A one-frame driver buffer has nothing stale to flush
+        camera = QueuedCapture(0)
+        game.cap = LowLatencyCapture(camera, drain=False)
+        game.flush_camera_buffer()
+        assert camera.grabs == 0
+    finally:
+        game.cap = None
+        game.cleanup()
+
 def test_finger_tips_config():
     """Test hand landmark configuration"""
     import config
@@ -0,0 +1,57 @@
+"""
+Tests for gesture classifiers and landmark features
+Run with: python -m pytest tests/
+"""
+
+import sys
+import os
+import numpy as np
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from gesture_classifier import CentroidClassifier, HeuristicClassifier, landmark_features
+from landmark_data import GESTURE_LABELS, canonical_hand, synthetic_dataset, synthetic_hand
+
+def test_heuristics_on_upright_right_hand():
+    """Test the rule heuristics agree with the canonical poses"""
+    heuristics = HeuristicClassifier()
+    for label in GESTURE_LABELS:
+        hand = (canonical_hand(label) * 100 + 300).tolist()
+        assert heuristics.classify(hand) == label
+
+def test_features_are_pose_invariant():
+    """Test features ignore position, scale, rotation and handedness"""
+    reference = landmark_features(canonical_hand('peace'))
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        hand = synthetic_hand('peace', rng, max_rotation=np.pi, noise=0.0)
+        assert np.allclose(landmark_features(hand), reference)
+
+def test_centroid_classifier_beats_heuristics_on_rotated_hands():
+    """Test the learned model handles rotated and left hands"""
+    train = synthetic_dataset(1000, seed=0)
+    test = synthetic_dataset(500, seed=1)
+    model = CentroidClassifier().fit(train['landmarks'], train['labels'])
+    heuristics = HeuristicClassifier()
+
+    def accuracy(classifier):
+        return np.mean([
+            classifier.classify(hand.tolist()) == label
+            for hand, label in zip(test['landmarks'], test['labels'])
+        ])
+
+    assert accuracy(model) > 0.95
+    assert accuracy(model) > accuracy(heuristics)
+
+def test_centroid_classifier_save_load(tmp_path):
+    """Test a trained model round-trips through .npz"""
+    train = synthetic_dataset(200, seed=0)
+    model = CentroidClassifier().fit(train['landmarks'], train['labels'])
+    path = str(tmp_path / 'model.npz')
+    model.save(path)
+
+    loaded = CentroidClassifier.load(path)
+    assert loaded.labels == model.labels
+    for hand in train['landmarks'][:20]:
+        assert loaded.classify(hand) == model.classify(hand)
@@ -0,0 +1,115 @@
+"""
+Tests for the versus simulation and rollback netcode over a loopback relay
+Run with: python -m pytest tests/
+"""
+
+import sys
+import os
+import random
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, PIPE_GAP, PIPE_WIDTH, NET_INPUT_DELAY,
+    NET_MAX_ROLLBACK
+)
+from netplay import VersusSim, UdpTransport, RelayServer, RollbackSession
+
+def flap_script(seed, ticks, every=25):
+    """Random single-tick flaps, roughly every `every` ticks"""
+    rng = random.Random(seed)
+    return [rng.random() < 1 / every for _ in range(ticks)]
+
+def pilot_scripts(seed, ticks, delay=NET_INPUT_DELAY):
+    """
+    Both players' flaps from a gap-seeking pilot that allows for the input
+    delay, so the birds pass pipes and every late flap changes the outcome
+    """
+    rng = random.Random(seed)
+    sim = VersusSim(seed)
+    scripts = [[], []]
+    for t in range(ticks):
+        for p, bird in enumerate(sim.birds):
+            ahead = [gap for _, x, gap in sim.pipes()
+                     if x + PIPE_WIDTH >= bird.x - bird.radius]
+            target = (ahead[0] + PIPE_GAP * 0.6 if ahead else SCREEN_HEIGHT / 2)
+            target += rng.uniform(-10, 10)
+            pending = any(scripts[p][-delay:])  # flaps not applied yet
+            scripts[p].append(not pending and bird.y > target and bird.velocity > 0)
+        sim.step(tuple(delayed(scripts[p], t, delay) for p in (0, 1)))
+    return scripts
+
+def delayed(script, tick, delay=NET_INPUT_DELAY):
+    """The flap a session applies at `tick` (local inputs run `delay` late)"""
+    return script[tick - delay] if tick >= delay else False
+
+def test_snapshot_restores_exact_state():
+    """Test a restored snapshot replays to exactly the same state"""
+    sim = VersusSim(seed=3)
+    flaps = flap_script(1, 300), flap_script(2, 300)
+    for t in range(150):
+        sim.step((flaps[0][t], flaps[1][t]))
+    snapshot = sim.save()
+    assert len(snapshot) == VersusSim.STATE.size
+
+    for t in range(150, 300):
+        sim.step((flaps[0][t], flaps[1][t]))
+    final = sim.save()
+
+    sim.load(snapshot)
+    for t in range(150, 300):
+        sim.step((flaps[0][t], flaps[1][t]))
+    assert sim.save() == final
+
+def test_same_seed_same_course():
+    """Test both cabinets build the same pipe course from the seed"""
+    assert [VersusSim(7).gap_start(n) for n in range(20)] == \
+           [VersusSim(7).gap_start(n) for n in range(20)]
+    assert VersusSim(7).pipes(0) == [(0, SCREEN_WIDTH + 200, VersusSim(7).gap_start(0))]
+
+def test_rollback_sessions_converge_over_lossy_relay():
+    """Both cabinets end in the state an offline run with the real inputs reaches"""
+    relay = RelayServer(delay=0.02, jitter=0.01, loss=0.1, seed=1).start()
+    sessions = [
+        RollbackSession(VersusSim(seed=3), player, UdpTransport(relay.address))
+        for player in (0, 1)
+    ]
+    ticks = 720
+    scripts = pilot_scripts(3, ticks)
+    try:
+        deadline = time.perf_counter() + 20
+        while (min(s.sim.tick for s in sessions) < ticks and
+               time.perf_counter() < deadline):
+            for p, session in enumerate(sessions):
+                if session.sim.tick < ticks:
+                    session.advance(scripts[p][session.sim.tick])
+            time.sleep(0.004)
+
+        # Keep exchanging (resending unacknowledged inputs) until confirmed
+        while (not all(s.confirmed for s in sessions) and
+               time.perf_counter() < deadline):
+            for session in sessions:
+                session.sync()
+                session.send()
+            time.sleep(0.004)
+    finally:
+        relay.stop()
+        for session in sessions:
+            session.transport.close()
+
+    assert all(s.sim.tick == ticks for s in sessions)
+    assert all(s.confirmed for s in sessions)
+
+    # Offline reference run with each player's scripted inputs, delayed
+    reference = VersusSim(seed=3)
+    for t in range(ticks):
+        reference.step((delayed(scripts[0], t), delayed(scripts[1], t)))
+    assert reference.alive == [True, True] and min(reference.scores) >= 4
+    assert sessions[0].sim.save() == sessions[1].sim.save() == reference.save()
+
+    metrics = sessions[0].metrics()
+    assert sum(s.metrics()['rollbacks'] for s in sessions) > 0
+    assert metrics['max_rollback_depth'] <= NET_MAX_ROLLBACK
+    assert metrics['bytes_sent_per_second'] > 0
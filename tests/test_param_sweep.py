@@ -0,0 +1,85 @@
+"""
+Tests for the offline gesture parameter sweep
+Run with: python -m pytest tests/
+"""
+
+import sys
+import os
+import numpy as np
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from landmark_data import save_session, load_session, synthetic_session
+from param_sweep import (
+    ParameterSweep, apply_cooldown, intended_flaps, score_flaps, evaluate_session
+)
+
+def test_session_roundtrip(tmp_path):
+    """Test recorded sessions save and load with their metadata"""
+    session = synthetic_session(seconds=2.0, seed=1)
+    path = str(tmp_path / 'session.npz')
+    save_session(path, session['landmarks'], session['labels'], session['timestamps'],
+                 video='session.avi', confidence=(0.6, 0.4))
+    loaded = load_session(path)
+    assert np.array_equal(loaded['landmarks'], session['landmarks'], equal_nan=True)
+    assert list(loaded['labels']) == list(session['labels'])
+    assert loaded['video'] == str(tmp_path / 'session.avi')
+    assert loaded['confidence'] == (0.6, 0.4)
+
+def test_cooldown_and_matching():
+    """Test the cooldown and the matching of flaps against labelled gestures"""
+    times = np.arange(10) / 10
+    assert list(apply_cooldown(times, 250)) == pytest.approx([0.0, 0.3, 0.6, 0.9])
+
+    segments = intended_flaps(['none', 'open', 'open', 'none', 'peace', 'none'],
+                              np.array([0.0, 1.0, 1.1, 1.2, 5.0, 5.1]))
+    assert segments == [(1.0, 1.1), (5.0, 5.0)]
+
+    result = score_flaps(np.array([0.5, 1.05, 1.5, 3.0]), segments, grace=0.5)
+    assert result['false_flaps'] == 2  # 0.5 and 3.0
+    assert result['repeat_flaps'] == 1  # 1.5, still inside the first window
+    assert result['missed_flaps'] == 1  # the peace sign at 5.0
+    assert result['latencies_ms'] == [pytest.approx(50)]
+
+def test_finger_threshold_trades_false_flaps():
+    """Test a stricter finger threshold trades false flaps for missed ones"""
+    session = synthetic_session(seconds=30.0, seed=2)
+    args = session['landmarks'], session['labels'], session['timestamps']
+    loose = evaluate_session(*args, min_fingers=1, cooldown_ms=300)
+    strict = evaluate_session(*args, min_fingers=5, cooldown_ms=300)
+    assert loose['false_flaps'] > strict['false_flaps']
+    assert loose['missed_flaps'] <= strict['missed_flaps']
+
+def test_sweep_caches_by_content(tmp_path):
+    """Test a repeated sweep reuses cached results keyed by session content"""
+    sessions = [synthetic_session(seconds=10.0, seed=i) for i in range(2)]
+    grid = {'FLAP_COOLDOWN': [200, 300], 'MIN_FINGERS_FOR_FLAP': [2, 3]}
+
+    first = ParameterSweep(sessions, grid, str(tmp_path), workers=2)
+    summaries = first.run()
+    assert len(summaries) == 4
+    assert first.computed == 8 and first.cached == 0
+    assert all(s['sessions'] == 2 for s in summaries)
+
+    again = ParameterSweep(sessions, grid, str(tmp_path), workers=2)
+    assert again.run() == summaries
+    assert again.computed == 0 and again.cached == 8
+
+    # Changing a session's content invalidates only its results
+    sessions[1]['labels'] = sessions[1]['labels'].copy()
+    sessions[1]['labels'][0] = 'open' if sessions[1]['labels'][0] != 'open' else 'none'
+    changed = ParameterSweep(sessions, grid, str(tmp_path), workers=2)
+    changed.run()
+    assert changed.computed == 4 and changed.cached == 4
+
+def test_other_confidences_need_video(tmp_path):
+    """Test confidence settings other than the recorded ones are skipped"""
+    sessions = [synthetic_session(seconds=5.0)]
+    sweep = ParameterSweep(sessions, {'MIN_DETECTION_CONFIDENCE': [0.5, 0.7]},
+                           str(tmp_path), workers=1)
+    summaries = sweep.run()
+    # Landmark-only sessions are replayed at the settings they were recorded with
+    assert [s['MIN_DETECTION_CONFIDENCE'] for s in summaries] == [0.7]
+    assert sweep.skipped == 1
@@ -0,0 +1,63 @@
+"""
+Tests for the sampling profiler and slow-frame dumps
+Run with: python -m pytest tests/
+"""
+
+import sys
+import os
+import json
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from profiler import Profiler
+
+def busy_stage(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+def test_sampler_attributes_time_to_functions(tmp_path):
+    """Test the sampler finds the function that burns the time"""
+    profiler = Profiler(interval=0.001, directory=str(tmp_path)).start()
+    busy_stage(0.2)
+    profiler.stop()
+
+    assert profiler.samples > 20
+    hottest = profiler.self_counts.most_common(1)[0][0]
+    assert hottest.co_name == 'busy_stage'
+    assert 'busy_stage' in profiler.report()
+
+def test_slow_frames_are_dumped_with_stages_and_stacks(tmp_path):
+    """Test a frame over the threshold writes a dump; fast frames don't"""
+    import numpy as np
+
+    profiler = Profiler(interval=0.001, slow_frame_ms=20,
+                        directory=str(tmp_path)).start()
+
+    profiler.begin_frame()
+    profiler.mark('events')
+    assert profiler.end_frame() is None
+
+    profiler.begin_frame()
+    busy_stage(0.05)
+    profiler.mark('draw')
+    path = profiler.end_frame(np.zeros((8, 8, 3), dtype=np.uint8))
+    profiler.stop()
+
+    with open(path) as f:
+        record = json.load(f)
+    assert record['frame_ms'] >= 20
+    assert record['stages_ms']['draw'] >= 20
+    assert any('busy_stage' in frame for stack in record['stack_samples']
+               for frame in stack)
+
+def test_dumps_are_rate_limited(tmp_path):
+    """Test slow frames dump at most once per cooldown and max_dumps total"""
+    profiler = Profiler(slow_frame_ms=0, directory=str(tmp_path), max_dumps=5)
+    for _ in range(10):
+        profiler.begin_frame()
+        profiler.mark('update')
+        profiler.end_frame()
+    assert len(profiler.dumps) == 1
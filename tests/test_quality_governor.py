@@ -0,0 +1,59 @@
+"""
+Tests for the adaptive quality governor
+Run with: python -m pytest tests/
+"""
+
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from config import QUALITY_TIERS, QUALITY_UPGRADE_HOLD
+from quality_governor import QualityGovernor
+
+BUDGET = 1.0 / 60
+WINDOW = 10
+
+def feed(governor, frame_time, inference_time=0.0, frames=WINDOW):
+    """Record the same timings for a number of frames"""
+    for _ in range(frames):
+        governor.record(frame_time, inference_time)
+
+def test_steps_down_one_tier_per_window_when_over_budget():
+    """Test slow frames step quality down one tier at a time"""
+    changes = []
+    governor = QualityGovernor(frame_budget=BUDGET, window=WINDOW,
+                               on_change=changes.append)
+    feed(governor, BUDGET * 1.5)
+    assert governor.level == 1
+    feed(governor, BUDGET * 1.5, frames=WINDOW * 10)
+    assert governor.level == len(QUALITY_TIERS) - 1
+    assert [t['name'] for t in changes] == [t['name'] for t in QUALITY_TIERS[1:]]
+
+def test_slow_inference_alone_steps_down():
+    """Test inference over its share of the budget triggers a downgrade"""
+    governor = QualityGovernor(frame_budget=BUDGET, window=WINDOW)
+    feed(governor, BUDGET * 0.8, inference_time=BUDGET * 0.7)
+    assert governor.level == 1
+
+def test_steps_up_only_after_sustained_headroom():
+    """Test upgrades need several windows of headroom"""
+    governor = QualityGovernor(frame_budget=BUDGET, window=WINDOW)
+    feed(governor, BUDGET * 2)
+    feed(governor, BUDGET * 2)
+    assert governor.level == 2
+
+    feed(governor, BUDGET * 0.3, frames=WINDOW * (QUALITY_UPGRADE_HOLD - 1))
+    assert governor.level == 2
+    feed(governor, BUDGET * 0.3)
+    assert governor.level == 1
+
+def test_no_oscillation_between_thresholds():
+    """Test frame times between the up and down thresholds change nothing"""
+    governor = QualityGovernor(frame_budget=BUDGET, window=WINDOW)
+    feed(governor, BUDGET * 2)
+    assert governor.level == 1
+    for _ in range(50):
+        feed(governor, BUDGET * 0.8)
+    assert governor.level == 1
@@ -0,0 +1,77 @@
+"""
+Tests for the state-aware idle scheduler
+Run with: python -m pytest tests/
+"""
+
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from config import FPS
+from scheduler import IdleScheduler
+
+class FakeClock:
+    def __init__(self):
+        self.ticks = []
+
+    def tick(self, fps=0):
+        self.ticks.append(fps)
+        return 0
+
+def make_scheduler():
+    return IdleScheduler(FakeClock(), active_states=['playing'],
+                         wake_states=['menu'], enabled=True)
+
+def test_static_states_redraw_only_on_change():
+    """Test idle states skip redraws until the scene changes"""
+    scheduler = make_scheduler()
+    scheduler.begin_frame('paused')
+    assert scheduler.should_redraw(('paused',))
+    assert not scheduler.should_redraw(('paused',))
+
+    scheduler.mark_dirty()
+    assert scheduler.should_redraw(('paused',))
+    assert scheduler.should_redraw(('paused', 'new status'))
+
+    scheduler.begin_frame('playing')
+    assert scheduler.should_redraw(('playing',))
+    assert scheduler.should_redraw(('playing',))
+
+def test_camera_polling_is_throttled_in_menu():
+    """Test the menu only polls the camera at the wake-check rate"""
+    scheduler = make_scheduler()
+    scheduler.begin_frame('menu')
+    assert scheduler.should_poll_camera()
+    assert not scheduler.should_poll_camera()
+
+    scheduler.begin_frame('paused')
+    scheduler.last_camera_poll = 0.0
+    assert not scheduler.should_poll_camera()
+
+    scheduler.begin_frame('playing')
+    assert all(scheduler.should_poll_camera() for _ in range(5))
+
+def test_resume_is_reported_and_timed():
+    """Test resuming from idle asks for a flush and records latency"""
+    scheduler = make_scheduler()
+    assert not scheduler.begin_frame('menu')
+    assert scheduler.begin_frame('playing')
+    assert not scheduler.begin_frame('playing')
+    scheduler.frame_processed()
+    scheduler.frame_processed()
+
+    stats = scheduler.stats()
+    assert len(stats['resume_latency_ms']) == 1
+    assert set(stats['states']) == {'menu', 'playing'}
+
+def test_disabled_scheduler_keeps_every_frame_behaviour():
+    """Test disabling idle scheduling redraws and ticks every frame"""
+    clock = FakeClock()
+    scheduler = IdleScheduler(clock, active_states=['playing'], enabled=False)
+    scheduler.begin_frame('paused')
+    assert scheduler.should_redraw(('paused',))
+    assert scheduler.should_redraw(('paused',))
+    scheduler.wait()
+    assert clock.ticks == [FPS]
@@ -0,0 +1,95 @@
+"""
+Tests for the SQLite score store
+Run with: python -m pytest tests/
+"""
+
+import sys
+import os
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from score_store import ScoreStore
+
+def test_record_and_leaderboard(tmp_path):
+    """Test sessions are written in the background and ranked by score"""
+    store = ScoreStore(str(tmp_path / 'scores.db'))
+    for score in [3, 10, 7]:
+        store.record(score, duration=12.5, gesture_flaps=4, keyboard_flaps=1)
+    store.flush()
+
+    assert store.high_score() == 10
+    top = store.top_scores(2)
+    assert [s['score'] for s in top] == [10, 7]
+    assert top[0]['flaps'] == 5
+    store.close()
+
+def test_daily_queries(tmp_path):
+    """Test per-day leaderboard and summary"""
+    store = ScoreStore(str(tmp_path / 'scores.db'))
+    day1 = time.mktime((2026, 3, 1, 12, 0, 0, 0, 0, -1))
+    day2 = time.mktime((2026, 3, 2, 12, 0, 0, 0, 0, -1))
+    store.record(5, duration=10, started_at=day1)
+    store.record(9, duration=20, started_at=day1)
+    store.record(50, duration=60, started_at=day2)
+    store.close()
+
+    store = ScoreStore(str(tmp_path / 'scores.db'))
+    assert [s['score'] for s in store.top_scores(day='2026-03-01')] == [9, 5]
+    summary = store.daily_summary('2026-03-01')
+    assert summary['sessions'] == 2
+    assert summary['best'] == 9
+    assert summary['total_duration'] == 30
+    assert store.daily_summary('2025-01-01')['sessions'] == 0
+    store.close()
+
+def test_queries_use_indexes(tmp_path):
+    """Test leaderboard queries stay index-backed as the table grows"""
+    store = ScoreStore(str(tmp_path / 'scores.db'))
+    for i in range(5000):
+        store.record(i % 97, duration=1.0)
+    store.flush()
+
+    conn = store._reader()
+    plans = [
+        conn.execute(
+            "EXPLAIN QUERY PLAN SELECT score FROM sessions "
+            "ORDER BY score DESC LIMIT 10"
+        ).fetchall(),
+        conn.execute(
+            "EXPLAIN QUERY PLAN SELECT score FROM sessions WHERE day = ? "
+            "ORDER BY score DESC LIMIT 10", ('2026-03-01',)
+        ).fetchall(),
+    ]
+    for plan in plans:
+        detail = ' '.join(row[-1] for row in plan)
+        assert 'USING' in detail and 'INDEX' in detail
+        assert 'TEMP B-TREE' not in detail
+    store.close()
+
+def test_legacy_high_score_is_imported_once(tmp_path):
+    """Test high_score.txt from before the store carries over into an empty store"""
+    legacy = tmp_path / 'high_score.txt'
+    legacy.write_text('42')
+    missing = str(tmp_path / 'missing.txt')
+
+    store = ScoreStore(str(tmp_path / 'scores.db'))
+    assert store.import_legacy_high_score([missing, str(legacy)]) == 42
+    assert store.high_score() == 42
+    assert store.top_scores(1)[0]['flaps'] == 0
+
+    # Not again once the store has sessions, even if the file changes
+    legacy.write_text('99')
+    assert store.import_legacy_high_score([str(legacy)]) == 0
+    assert store.high_score() == 42
+    store.close()
+
+def test_bad_legacy_file_is_ignored(tmp_path):
+    """Test an unreadable high_score.txt imports nothing"""
+    legacy = tmp_path / 'high_score.txt'
+    legacy.write_text('not a number')
+    store = ScoreStore(str(tmp_path / 'scores.db'))
+    assert store.import_legacy_high_score([str(legacy)]) == 0
+    assert store.high_score() == 0
+    store.close()
@@ -0,0 +1,122 @@
+"""
+Tests for the soak test harness (short runs; a real soak takes hours)
+Run with: python -m pytest tests/
+"""
+
+import sys
+import os
+import types
+
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from turbo import configure_headless
+configure_headless()
+
+import numpy as np
+from config import FPS
+from input_sources import RandomInput
+from soak import LoopingCapture, SoakTest, rss_bytes
+
+SAMPLE_MINUTES = 200 / FPS / 60  # 200 ticks per sample
+
+class LeakyInput(RandomInput):
+    """Random play that also keeps 20 KB per tick alive forever"""
+    name = 'leaky'
+
+    def __init__(self):
+        super().__init__(seed=1)
+        self.kept = []
+
+    def begin_tick(self, tick):
+        self.kept.append(bytearray(20_000))
+
+def short_soak(**kwargs):
+    kwargs.setdefault('max_p99_growth', 100.0)  # CI machines are noisy
+    return SoakTest(sample_minutes=SAMPLE_MINUTES, warmup_minutes=SAMPLE_MINUTES,
+                    restart_delay=5, report=None, **kwargs)
+
+def test_short_soak_passes_and_samples():
+    """Test a short soak passes and samples every window after the warm-up"""
+    soak = short_soak()
+    result = soak.run(hours=1000 / FPS / 3600)
+
+    assert result['passed'], result['failures']
+    samples = result['samples']
+    assert [s['tick'] for s in samples] == [200, 400, 600, 800, 1000]
+    assert samples[0]['baseline'] and not samples[1]['baseline']
+    assert samples[-1]['restarts'] > 0
+    for sample in samples:
+        assert sample['rss_mb'] > 0
+        assert sample['traced_mb'] > 0
+        assert 0 < sample['frame_ms_p50'] <= sample['frame_ms_p99'] <= sample['frame_ms_max']
+        assert len(sample['gc_collections']) == 3
+
+def test_heap_growth_fails_and_names_the_site():
+    """Test a leak fails the soak and names the allocating line"""
+    soak = short_soak(input_source=LeakyInput(), max_traced_growth_mb=1.0)
+    result = soak.run(hours=600 / FPS / 3600)
+
+    assert not result['passed']
+    assert any('Python heap grew' in failure and 'test_soak.py' in failure
+               for failure in result['failures'])
+    assert 'test_soak.py' in result['samples'][-1]['top_allocators'][0]['where']
+
+def test_p99_drift_compares_late_windows_with_early_ones():
+    """Test p99 drift compares late windows with the early ones"""
+    soak = SoakTest(sample_minutes=1, warmup_minutes=1, report=None)
+
+    def sample(tick, p99):
+        return {'tick': tick, 'rss_mb': 100.0, 'traced_mb': 5.0, 'top_allocators': [],
+                'frame_ms_p99': p99}
+
+    ticks = [soak.warmup_ticks * (i + 1) for i in range(7)]
+    soak.samples = [sample(t, p99) for t, p99 in zip(ticks, [9, 4, 4, 4, 4, 4, 4])]
+    assert soak.check_drift() == []  # the warm-up window itself doesn't count
+
+    soak.samples = [sample(t, p99) for t, p99 in zip(ticks, [4, 4, 4, 4, 7, 8, 9])]
+    failures = soak.check_drift()
+    assert len(failures) == 1 and 'p99 frame time rose from 4.00 to 8.00' in failures[0]
+
+def test_looping_capture_replays_frames():
+    """Test LoopingCapture replays its frames in a loop"""
+    frames = [np.full((4, 4, 3), i, dtype=np.uint8) for i in range(3)]
+    cap = LoopingCapture(frames)
+    image = np.zeros((4, 4, 3), dtype=np.uint8)
+    values = []
+    for _ in range(7):
+        ok, image = cap.read(image)
+        values.append(int(image[0, 0, 0]))
+    assert ok and values == [0, 1, 2, 0, 1, 2, 0]
+    assert rss_bytes() > 0
+
+def looping_soak_run(capture, hours=300 / FPS / 3600):
+    soak = short_soak(capture=capture, trace=False)
+    return soak, soak.run(hours=hours)
+
+def test_looping_capture_with_default_detector():
+    """Test a looped video soaks through the real hand detector"""
+    mp = pytest.importorskip('mediapipe')
+    if not hasattr(mp, 'solutions'):
+        pytest.skip('this MediaPipe build has no solutions API')
+    frames = [np.full((240, 320, 3), 40 * i, dtype=np.uint8) for i in range(5)]
+    soak, result = looping_soak_run(LoopingCapture(frames))
+
+    assert result['passed'], result['failures']
+    assert type(soak.detector).__name__ == 'HandGestureDetector'
+    assert [s['tick'] for s in result['samples']] == [200, 300]
+
+def test_detector_failure_cleans_up(tmp_path, monkeypatch):
+    """Test a detector that fails to build leaves no temporary files"""
+    class BrokenDetector:
+        def __init__(self):
+            raise RuntimeError('no model')
+
+    monkeypatch.setitem(sys.modules, 'hand_gesture_detector',
+                        types.SimpleNamespace(HandGestureDetector=BrokenDetector))
+    monkeypatch.setattr('tempfile.tempdir', str(tmp_path))
+    with pytest.raises(RuntimeError):
+        looping_soak_run(LoopingCapture([np.zeros((4, 4, 3), dtype=np.uint8)]))
+    assert not [name for name in os.listdir(tmp_path) if name.startswith('flappy-soak-')]
@@ -0,0 +1,157 @@
+"""
+Tests for the local MJPEG spectator stream
+Run with: python -m pytest tests/
+"""
+
+import sys
+import os
+import http.client
+import time
+
+import numpy as np
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from turbo import configure_headless
+configure_headless()
+
+import cv2
+import pygame
+from spectator_stream import SpectatorServer
+
+def open_stream(server, name='game'):
+    conn = http.client.HTTPConnection(*server.address[:2], timeout=5)
+    conn.request('GET', f'/{name}.mjpg')
+    response = conn.getresponse()
+    assert response.status == 200
+    assert 'multipart/x-mixed-replace' in response.getheader('Content-Type')
+    return conn, response
+
+def read_part(response):
+    """Read one JPEG part of a multipart MJPEG response"""
+    assert response.fp.readline().strip() == b'--frame'
+    headers = {}
+    while True:
+        line = response.fp.readline().strip()
+        if not line:
+            break
+        key, _, value = line.decode().partition(':')
+        headers[key.lower()] = value.strip()
+    jpeg = response.fp.read(int(headers['content-length']))
+    response.fp.readline()
+    return cv2.imdecode(np.frombuffer(jpeg, np.uint8), cv2.IMREAD_COLOR)
+
+def wait_for(condition, timeout=5.0):
+    end = time.time() + timeout
+    while not condition():
+        assert time.time() < end
+        time.sleep(0.01)
+
+def test_no_clients_no_work():
+    """Test frames are neither copied nor encoded with nobody watching"""
+    server = SpectatorServer(port=0).start()
+    try:
+        surface = pygame.Surface((40, 30))
+        for _ in range(10):
+            assert not server.offer_game(surface)
+        assert server.stats()['game']['taken'] == 0
+    finally:
+        server.close()
+
+@pytest.mark.parametrize('depth', [32, 24])
+def test_clients_share_one_encode_per_frame(depth):
+    """Test every client gets the same single encode of a frame"""
+    server = SpectatorServer(port=0, max_fps=1000).start()
+    clients = [open_stream(server) for _ in range(3)]
+    try:
+        wait_for(lambda: server.channels['game'].clients == 3)
+        surface = pygame.Surface((40, 30), depth=depth)
+        surface.fill((255, 0, 0))
+        assert server.offer_game(surface)
+
+        for _, response in clients:
+            frame = read_part(response)
+            assert frame.shape == (30, 40, 3)
+            # Red in BGR, give or take JPEG error
+            assert frame[15, 20, 2] > 200 and frame[15, 20, 0] < 60
+        stats = server.stats()['game']
+        assert stats['taken'] == stats['encoded'] == 1
+    finally:
+        for conn, _ in clients:
+            conn.close()
+        server.close()
+
+def test_rate_cap_and_hand_stream():
+    """Test the hand stream is capped at max_fps"""
+    server = SpectatorServer(port=0, max_fps=10).start()
+    conn, response = open_stream(server, 'hand')
+    try:
+        wait_for(lambda: server.channels['hand'].clients == 1)
+        camera = np.zeros((24, 32, 3), dtype=np.uint8)
+        camera[:, :, 1] = 255
+        taken = sum(server.offer_hand(camera) for _ in range(100))
+        assert taken == 1  # the rest come faster than 10 per second
+        assert read_part(response)[12, 16, 1] > 200
+    finally:
+        conn.close()
+        server.close()
+
+def test_index_and_unknown_paths():
+    """Test the index lists the streams and unknown paths are 404"""
+    server = SpectatorServer(port=0, hand=False).start()
+    try:
+        conn = http.client.HTTPConnection(*server.address[:2], timeout=5)
+        conn.request('GET', '/')
+        page = conn.getresponse().read().decode()
+        assert '/game.mjpg' in page and '/hand.mjpg' not in page
+        conn.request('GET', '/hand.mjpg')
+        assert conn.getresponse().status == 404
+        conn.close()
+    finally:
+        server.close()
+
+def test_async_runtime_streams_annotated_hand_frames(tmp_path):
+    """Test the async runtime feeds annotated frames to /hand.mjpg"""
+    from async_runtime import AsyncGameRunner
+    from game_engine import HandGestureFlappyBird
+    from score_store import ScoreStore
+    from telemetry import Telemetry
+
+    class Capture:
+        def read(self, image=None):
+            return True, np.zeros((24, 32, 3), dtype=np.uint8)
+
+        def grab(self):
+            return True
+
+        def release(self):
+            pass
+
+    class Detector:
+        """Marks the frame green when asked to annotate"""
+        def process_frame(self, frame, annotate=True):
+            output = frame.copy() if annotate else frame
+            if annotate:
+                output[:, :, 1] = 255
+            return {'should_flap': False, 'gesture': 'none', 'frame': output}
+
+    game = HandGestureFlappyBird(
+        use_camera=False, score_store=ScoreStore(str(tmp_path / 'scores.db')),
+        telemetry=Telemetry(enabled=False)
+    )
+    game.cap = Capture()
+    game.hand_detector = Detector()
+    game.camera_available = True
+    game.show_preview = False
+    game.spectator = server = SpectatorServer(port=0, max_fps=1000).start()
+    conn, response = open_stream(server, 'hand')
+    try:
+        wait_for(lambda: server.channels['hand'].clients == 1)
+        AsyncGameRunner(game, fps=240, max_ticks=60).run()
+        assert server.stats()['hand']['taken'] > 0
+        assert read_part(response)[12, 16, 1] > 200
+    finally:
+        conn.close()
+        server.close()
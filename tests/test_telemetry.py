@@ -0,0 +1,119 @@
+"""
+Tests for the telemetry ring and background writer
+Run with: python -m pytest tests/
+"""
+
+import sys
+import os
+import glob
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from telemetry import Telemetry, read_telemetry
+
+def test_events_are_written_as_compressed_json_lines(tmp_path):
+    """Test emitted events reach disk with their fields"""
+    telemetry = Telemetry(str(tmp_path), flush_interval=0.05)
+    telemetry.emit('flap', source='gesture', gesture='peace', confidence=0.9)
+    telemetry.emit('death', cause='ground', score=3)
+    telemetry.close()
+
+    events = read_telemetry(str(tmp_path))
+    assert [e['kind'] for e in events] == ['flap', 'death']
+    assert events[0]['gesture'] == 'peace'
+    assert events[1]['score'] == 3
+    assert glob.glob(str(tmp_path / 'telemetry-*.jsonl.gz'))
+
+def test_ring_is_bounded_when_writer_falls_behind(tmp_path):
+    """Test a stalled writer drops the oldest events instead of growing"""
+    telemetry = Telemetry(str(tmp_path), capacity=100, enabled=False)
+    telemetry.enabled = True  # emit without a writer thread
+    for i in range(1000):
+        telemetry.emit('frame', index=i)
+
+    assert len(telemetry.ring) == 100
+    batch = telemetry.drain()
+    assert [fields['index'] for _, _, fields in batch] == list(range(900, 1000))
+    assert telemetry.dropped == 900
+
+def test_files_rotate_and_old_ones_are_removed(tmp_path):
+    """Test rotation keeps at most max_files files"""
+    telemetry = Telemetry(str(tmp_path), max_file_bytes=200, max_files=3,
+                          enabled=False)
+    telemetry.enabled = True
+    for i in range(20):
+        telemetry.emit('frame', index=i, padding='x' * 100)
+        telemetry.flush()
+    telemetry._file.close()
+
+    assert len(glob.glob(str(tmp_path / 'telemetry-*.jsonl.gz'))) == 3
+    events = read_telemetry(str(tmp_path))
+    assert events[-1]['index'] == 19
+
+def test_emit_is_cheap():
+    """Test emitting stays in the low-microsecond range"""
+    telemetry = Telemetry(enabled=False)
+    telemetry.enabled = True
+    start = time.perf_counter()
+    for _ in range(10000):
+        telemetry.emit('frame', frame_ms=16.6, inference_ms=8.1)
+    per_event = (time.perf_counter() - start) / 10000
+    assert per_event < 20e-6
+
+def test_files_are_readable_while_open_and_after_a_crash(tmp_path):
+    """Test a live file reads back, and a batch cut short is skipped"""
+    telemetry = Telemetry(str(tmp_path), enabled=False)
+    telemetry.enabled = True
+    for i in range(3):
+        telemetry.emit('frame', index=i)
+        telemetry.flush()
+    assert [e['index'] for e in read_telemetry(str(tmp_path))] == [0, 1, 2]
+
+    # Killed in the middle of writing the next batch
+    telemetry.emit('frame', index=3)
+    telemetry.flush()
+    path = telemetry._file.name
+    telemetry._file.close()
+    with open(path, 'r+b') as f:
+        f.truncate(os.path.getsize(path) - 5)
+    assert [e['index'] for e in read_telemetry(str(tmp_path))] == [0, 1, 2]
+
+def test_read_while_the_writer_thread_runs(tmp_path):
+    """Test events already flushed read back before close()"""
+    telemetry = Telemetry(str(tmp_path), flush_interval=0.02)
+    try:
+        telemetry.emit('death', cause='ground', score=1)
+        deadline = time.perf_counter() + 2
+        while not read_telemetry(str(tmp_path)) and time.perf_counter() < deadline:
+            time.sleep(0.02)
+        assert [e['kind'] for e in read_telemetry(str(tmp_path))] == ['death']
+    finally:
+        telemetry.close()
+
+def test_camera_snapshots_subscribe_to_the_frame_bus(tmp_path):
+    """Test snapshots take the newest frame, skip the rest and rotate"""
+    import numpy as np
+    from frame_bus import FrameBus
+    from telemetry import CameraSnapshotter
+
+    bus = FrameBus()
+    telemetry = Telemetry(str(tmp_path), enabled=False)
+    snapshotter = CameraSnapshotter(telemetry, bus, width=32, max_snapshots=2)
+    assert snapshotter.snapshot() is None  # nothing published yet
+
+    for round_ in range(3):
+        for value in range(5):
+            buffer = bus.acquire_buffer((48, 64, 3))
+            buffer.fill(50 * round_ + value)
+            bus.publish(buffer)
+        result = snapshotter.snapshot()
+        assert result['brightness'] == 50 * round_ + 4
+    assert snapshotter.snapshot() is None  # no new frame since
+
+    assert result['skipped'] == 12
+    assert [r['brightness'] for r in snapshotter.take_results()] == [4, 54, 104]
+    files = sorted(glob.glob(str(tmp_path / 'snapshot-*.jpg')))
+    assert len(files) == 2 and files[-1].endswith('-0003.jpg')
+    assert bus.allocated <= 2  # the snapshotter released what it took
@@ -0,0 +1,80 @@
+"""
+End-to-end tests of the real game loop in headless turbo mode
+Run with: python -m pytest tests/
+"""
+
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from input_sources import ScriptedInput
+from score_store import ScoreStore
+from turbo import TurboRunner
+
+def run_script(tmp_path, script, ticks, **kwargs):
+    store = ScoreStore(str(tmp_path / 'scores.db'))
+    runner = TurboRunner(ScriptedInput(script), score_store=store, **kwargs)
+    try:
+        return runner.run(ticks)
+    finally:
+        runner.close()
+
+def test_menu_play_game_over_restart(tmp_path):
+    """Test the full state cycle driven by scripted keys"""
+    # Start with SPACE, fall to the ground, restart with R
+    report = run_script(tmp_path, [(0, 'space'), (100, 'r')], 120, render=False)
+    states = [state for _, state in report['transitions']]
+    assert states == ['MENU', 'PLAYING', 'GAME_OVER', 'PLAYING']
+    assert report['ticks'] == 120
+
+def test_gesture_flap_starts_and_pause_resumes(tmp_path):
+    """Test scripted gesture flaps and pausing through the real loop"""
+    script = [(0, 'flap'), (5, 'p'), (20, 'p')]
+    report = run_script(tmp_path, script, 25)
+    states = [state for _, state in report['transitions']]
+    assert states == ['MENU', 'PLAYING', 'PAUSED', 'PLAYING']
+
+def test_quit_key_stops_the_loop(tmp_path):
+    """Test Q ends the run early"""
+    report = run_script(tmp_path, [(3, 'q')], 100)
+    assert report['ticks'] == 4
+
+def test_runs_are_reproducible(tmp_path):
+    """Test the same script and seed render the same final frame"""
+    script = [(0, 'space')] + [(t, 'flap') for t in range(10, 400, 22)]
+    first = run_script(tmp_path, script, 400, render=False)
+    second = run_script(tmp_path, script, 400, render=False)
+    assert first['checksum'] == second['checksum']
+    assert first['state'] == second['state']
+    assert first['ticks_per_second'] > 0
+
+def test_script_round_trip(tmp_path):
+    """Test scripts save and load as JSON"""
+    path = str(tmp_path / 'script.json')
+    ScriptedInput([(0, 'space'), (4, 'flap')]).save(path)
+    assert ScriptedInput.load(path).actions == {0: ['space'], 4: ['flap']}
+
+def test_default_score_store_is_removed_on_close(tmp_path, monkeypatch):
+    """Test a runner without a score store cleans up its temporary database"""
+    monkeypatch.setattr('tempfile.tempdir', str(tmp_path))
+    runner = TurboRunner(ScriptedInput([(0, 'space')]), render=False)
+    try:
+        runner.run(10)
+        assert [n for n in os.listdir(tmp_path) if n.startswith('flappy-turbo-')]
+    finally:
+        runner.close()
+    assert not [n for n in os.listdir(tmp_path) if n.startswith('flappy-turbo-')]
+
+def test_input_source_flaps_are_not_gesture_flaps(tmp_path):
+    """Test scripted flaps are kept out of the player's gesture count"""
+    store = ScoreStore(str(tmp_path / 'scores.db'))
+    runner = TurboRunner(ScriptedInput([(0, 'flap'), (10, 'flap')]), score_store=store,
+                         render=False)
+    try:
+        runner.run(20)
+        manager = runner.game.score_manager
+        assert (manager.gesture_flaps, manager.input_flaps) == (0, 2)
+    finally:
+        runner.close()
@@ -0,0 +1,116 @@
+"""
+Tests for the background gameplay video recorder
+Run with: python -m pytest tests/
+"""
+
+import sys
+import os
+import threading
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from turbo import configure_headless
+configure_headless()
+
+import cv2
+import pygame
+from video_recorder import VideoRecorder
+
+def frame_count(path):
+    cap = cv2.VideoCapture(path)
+    count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    cap.release()
+    return count, width
+
+def draw_frames(recorder, count, size=(200, 120)):
+    surface = pygame.Surface(size)
+    for i in range(count):
+        surface.fill((i % 256, 80, 160))
+        recorder.capture(surface)
+
+def test_records_every_kth_frame_downscaled(tmp_path):
+    """Test every k-th frame is recorded at the downscaled size"""
+    path = str(tmp_path / 'play.avi')
+    recorder = VideoRecorder(path, preroll=0, every=2, scale=2, fps=60)
+    draw_frames(recorder, 40)
+    recorder.close()
+
+    assert recorder.stats()['captured'] + recorder.stats()['dropped'] == 20
+    count, width = frame_count(path)
+    assert count == recorder.stats()['encoded'] == recorder.stats()['captured']
+    assert width == 100
+
+def test_full_queue_drops_instead_of_blocking(tmp_path):
+    """Test a stalled encoder makes capture drop frames, never wait"""
+    recorder = VideoRecorder(str(tmp_path / 'play.avi'), preroll=0, every=1,
+                             queue_size=4)
+    stalled = threading.Event()
+    write = recorder._write
+    recorder._write = lambda frame: (stalled.wait(), write(frame))
+
+    start = time.perf_counter()
+    draw_frames(recorder, 50)
+    elapsed = time.perf_counter() - start
+    stalled.set()
+    recorder.close()
+
+    stats = recorder.stats()
+    assert elapsed < 1.0
+    assert stats['dropped'] >= 40
+    assert stats['captured'] + stats['dropped'] == 50
+    assert stats['encoded'] == stats['captured']
+
+def test_highlight_saves_the_preroll(tmp_path):
+    """Test a highlight clip holds the most recent pre-roll frames"""
+    recorder = VideoRecorder(preroll=0.5, every=1, fps=30, directory=str(tmp_path))
+    for _ in range(3):
+        draw_frames(recorder, 10)
+        time.sleep(0.05)  # let the encoder keep up, so nothing is dropped
+    recorder.save_highlight('best.avi')
+    recorder.close()
+
+    count, _ = frame_count(str(tmp_path / 'best.avi'))
+    assert count == 15  # 0.5 s at 30 fps, the most recent frames only
+
+def test_highlight_waits_for_queued_frames(tmp_path):
+    """Test a highlight includes frames still queued when it was requested"""
+    recorder = VideoRecorder(preroll=0.5, every=1, fps=30, queue_size=30,
+                             directory=str(tmp_path))
+    write = recorder._write
+    recorder._write = lambda frame: (time.sleep(0.005), write(frame))
+    draw_frames(recorder, 20)  # faster than the encoder keeps up
+    recorder.save_highlight('best.avi')
+    assert recorder.stats()['encoded'] < 20
+    recorder.close()
+
+    count, _ = frame_count(str(tmp_path / 'best.avi'))
+    assert recorder.stats()['dropped'] == 0
+    assert count == 15  # the most recent frames, not the first encoded ones
+
+def test_new_high_score_saves_a_clip(tmp_path):
+    """Test a new high score saves a clip and an ordinary game over doesn't"""
+    from input_sources import ScriptedInput
+    from turbo import TurboRunner
+
+    runner = TurboRunner(ScriptedInput([]))
+    game = runner.game
+    game.recorder = VideoRecorder(preroll=1.0, every=1, directory=str(tmp_path))
+    try:
+        game.start_game()
+        for _ in range(5):
+            game.draw()
+            time.sleep(0.01)
+        game.score_manager.score = game.high_score_at_start + 1
+        game.game_over('pipe_top')
+
+        game.start_game()
+        game.draw()
+        game.game_over('ground')  # score 0: no new clip
+    finally:
+        runner.close()
+
+    clips = os.listdir(tmp_path)
+    assert len(clips) == 1 and clips[0].endswith('score1.avi')
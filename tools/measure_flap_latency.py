@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Measure glass-to-flap latency by replaying a video with known flap events
+
+The video is paced like a live camera that queues frames in its driver,
+and the real game loop reads, detects and flaps. Reports the delay from
+each event's frame exposure to Bird.update applying the flap, with plain
+buffered reads and with low-latency capture.
+
+Usage:
+    python tools/measure_flap_latency.py --make-test-video flashes.avi
+    python tools/measure_flap_latency.py flashes.avi --events flashes.json
+    python tools/measure_flap_latency.py hand.mp4 --events hand.json --detector hands
+
+The events file is JSON: {"events": [seconds into the video, ...]}.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from flap_latency import (
+    SimulatedCamera, MarkerDetector, flash_video_frames,
+    measure_flap_latency, summarize
+)
+
+def make_test_video(path, seconds=10.0, fps=30, interval=0.7):
+    """Write a flash video and its events file (same name, .json)"""
+    import cv2
+
+    events = [round(0.5 + i * interval, 3) for i in range(int((seconds - 1) / interval))]
+    frames = flash_video_frames(events, seconds, fps)
+    height, width = frames[0].shape[:2]
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'MJPG'), fps, (width, height))
+    for frame in frames:
+        writer.write(frame)
+    writer.release()
+
+    events_path = os.path.splitext(path)[0] + '.json'
+    with open(events_path, 'w') as f:
+        json.dump({'events': events}, f)
+    print(f"Wrote {path} and {events_path} ({len(events)} events)")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('video', nargs='?', help='recorded video to replay')
+    parser.add_argument('--events', help='JSON file with event times')
+    parser.add_argument('--detector', choices=['marker', 'hands'], default='marker',
+                        help='marker: bright frame = flap; hands: MediaPipe')
+    parser.add_argument('--cost-ms', type=float, default=40.0,
+                        help='emulated inference time for the marker detector')
+    parser.add_argument('--buffer-frames', type=int, default=4,
+                        help='simulated driver queue length')
+    parser.add_argument('--make-test-video', metavar='PATH',
+                        help='write a synthetic flash video and exit')
+    args = parser.parse_args()
+
+    if args.make_test_video:
+        make_test_video(args.make_test_video)
+        return
+    if not args.video or not args.events:
+        parser.error("video and --events are required")
+
+    with open(args.events) as f:
+        events = json.load(f)['events']
+
+    if args.detector == 'hands':
+        from hand_gesture_detector import HandGestureDetector
+        detector = HandGestureDetector()
+    else:
+        detector = MarkerDetector(args.cost_ms)
+
+    print(f"{'mode':12} {'events':>6} {'missed':>6} {'mean':>8} {'p50':>8} "
+          f"{'p90':>8} {'p99':>8} {'max':>8}  (ms)")
+    for name, low_latency in (('buffered', False), ('low-latency', True)):
+        camera = SimulatedCamera.from_video(args.video, buffer_frames=args.buffer_frames)
+        result = measure_flap_latency(camera, events, detector, low_latency)
+        stats = summarize(result['delays_ms'])
+        if not stats['count']:
+            print(f"{name:12} {len(events):6d} {result['missed']:6d}  (no flaps detected)")
+            continue
+        print(f"{name:12} {len(events):6d} {result['missed']:6d} {stats['mean']:8.1f} "
+              f"{stats['p50']:8.1f} {stats['p90']:8.1f} {stats['p99']:8.1f} "
+              f"{stats['max']:8.1f}")
+
+if __name__ == "__main__":
+    main()
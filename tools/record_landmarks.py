@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Record labelled hand landmarks from the camera for classifier training
+
+Hold a gesture and press its key to record it; press it again to stop.
+    o = open hand   p = peace   t = thumbs up   f = fist   n = none
+    s = save and quit   q = quit without saving
+
+With --session every frame is recorded, hand or not, as a continuous play
+session for tools/sweep_gesture_params.py: the key sets the gesture you
+are making (n when not gesturing), and the raw frames are saved as a
+video next to the .npz so hand detection can be re-run at other settings.
+
+Usage: python tools/record_landmarks.py --out recording.npz
+       python tools/record_landmarks.py --session --out session1.npz
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from config import CAMERA_INDEX, MIN_DETECTION_CONFIDENCE, MIN_TRACKING_CONFIDENCE
+from camera_discovery import open_camera
+from hand_gesture_detector import HandGestureDetector
+from landmark_data import save_landmarks, save_session
+
+KEYS = {'o': 'open', 'p': 'peace', 't': 'thumbs_up', 'f': 'fist', 'n': 'none'}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--out', required=True, help='.npz file to write')
+    parser.add_argument('--camera', type=int, default=CAMERA_INDEX,
+                        help='device index (default: discover the best camera)')
+    parser.add_argument('--session', action='store_true',
+                        help='record every frame and the raw video (for parameter sweeps)')
+    args = parser.parse_args()
+
+    cap = open_camera(args.camera).cap
+    detector = HandGestureDetector()
+    landmarks, labels, timestamps = [], [], []
+    label = 'none' if args.session else None
+    video = writer = None
+    if args.session:
+        video = os.path.splitext(os.path.basename(args.out))[0] + '.avi'
+        video_path = os.path.join(os.path.dirname(os.path.abspath(args.out)), video)
+
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frame = cv2.flip(frame, 1)
+        if args.session:
+            if writer is None:
+                fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+                writer = cv2.VideoWriter(video_path, cv2.VideoWriter_fourcc(*'MJPG'),
+                                         fps, (frame.shape[1], frame.shape[0]))
+            writer.write(frame)
+        data = detector.process_frame(frame)
+        frame = data['frame']
+
+        if args.session:
+            landmarks.append(data['landmarks'] or np.full((21, 2), np.nan))
+            labels.append(label)
+            timestamps.append(time.time())
+        elif label and data['landmarks']:
+            landmarks.append(data['landmarks'])
+            labels.append(label)
+            timestamps.append(time.time())
+
+        status = f"Recording: {label}" if label else "Paused"
+        cv2.putText(frame, f"{status} ({len(labels)} samples)", (10, 110),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
+        cv2.imshow("Record Landmarks", frame)
+
+        key = chr(cv2.waitKey(1) & 0xFF)
+        if key in KEYS and args.session:
+            label = KEYS[key]
+        elif key in KEYS:
+            label = None if label == KEYS[key] else KEYS[key]
+        elif key == 's' and args.session:
+            save_session(args.out, landmarks, labels, timestamps, video=video,
+                         confidence=(MIN_DETECTION_CONFIDENCE, MIN_TRACKING_CONFIDENCE))
+            print(f"Saved {len(labels)} frames to {args.out} and {video}")
+            break
+        elif key == 's':
+            save_landmarks(args.out, landmarks, labels, timestamps)
+            print(f"Saved {len(labels)} samples to {args.out}")
+            break
+        elif key == 'q':
+            break
+
+    cap.release()
+    if writer is not None:
+        writer.release()
+    cv2.destroyAllWindows()
+
+if __name__ == "__main__":
+    main()
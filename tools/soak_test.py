@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Soak test: hours of headless play, failing on memory or frame-time drift
+
+Plays the real game loop as fast as the machine allows, restarting after
+every game over, and prints a sample of resident memory, Python heap,
+GC counters and frame-time percentiles every few simulated minutes. Exits
+with status 1 if memory or p99 frame time grew beyond the bounds after the
+warm-up.
+
+Usage:
+    python tools/soak_test.py --hours 4
+    python tools/soak_test.py --hours 2 --autopilot autopilot.npz --json soak.jsonl
+    python tools/soak_test.py --hours 1 --video session.avi --detector hands
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from config import (
+    SOAK_SAMPLE_MINUTES, SOAK_WARMUP_MINUTES, SOAK_MAX_RSS_GROWTH_MB,
+    SOAK_MAX_TRACED_GROWTH_MB, SOAK_MAX_P99_GROWTH
+)
+from soak import LoopingCapture, SoakTest
+
+def make_input(args):
+    """Returns: (input_source, capture, detector) for the chosen player"""
+    if args.video:
+        capture = LoopingCapture.from_video(args.video)
+        if args.detector == 'marker':
+            from flap_latency import MarkerDetector
+            return None, capture, MarkerDetector(cost_ms=0)
+        return None, capture, None
+    if args.autopilot:
+        from autopilot import AutopilotInput
+        return AutopilotInput.load(args.autopilot), None, None
+    if args.script:
+        from input_sources import ScriptedInput
+        return ScriptedInput.load(args.script), None, None
+    from input_sources import RandomInput
+    return RandomInput(args.seed), None, None
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--hours', type=float, default=1.0, help='simulated play time')
+    player = parser.add_mutually_exclusive_group()
+    player.add_argument('--autopilot', metavar='POLICY', help='trained policy (.npz) plays')
+    player.add_argument('--script', metavar='FILE', help='scripted input (JSON) plays')
+    player.add_argument('--video', metavar='FILE',
+                        help='recorded camera video, looped through the detector')
+    parser.add_argument('--detector', choices=['hands', 'marker'], default='hands',
+                        help='detector for --video (marker: bright frame = flap)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--sample-minutes', type=float, default=SOAK_SAMPLE_MINUTES)
+    parser.add_argument('--warmup-minutes', type=float, default=SOAK_WARMUP_MINUTES)
+    parser.add_argument('--max-rss-growth-mb', type=float, default=SOAK_MAX_RSS_GROWTH_MB)
+    parser.add_argument('--max-heap-growth-mb', type=float, default=SOAK_MAX_TRACED_GROWTH_MB)
+    parser.add_argument('--max-p99-growth', type=float, default=SOAK_MAX_P99_GROWTH)
+    parser.add_argument('--no-tracemalloc', action='store_true',
+                        help='skip allocation tracing (faster; no heap bound)')
+    parser.add_argument('--json', metavar='FILE', help='write each sample as a JSON line')
+    args = parser.parse_args()
+
+    input_source, capture, detector = make_input(args)
+    out = open(args.json, 'w') if args.json else None
+
+    def report(line):
+        print(line, flush=True)
+        if out:
+            out.write(json.dumps(soak.samples[-1]) + '\n')
+            out.flush()
+
+    soak = SoakTest(
+        input_source, capture, detector,
+        sample_minutes=args.sample_minutes, warmup_minutes=args.warmup_minutes,
+        max_rss_growth_mb=args.max_rss_growth_mb,
+        max_traced_growth_mb=args.max_heap_growth_mb,
+        max_p99_growth=args.max_p99_growth,
+        trace=not args.no_tracemalloc, seed=args.seed, report=report
+    )
+    print(f"Soaking for {args.hours} h of play, sampling every "
+          f"{args.sample_minutes} min after a {args.warmup_minutes} min warm-up")
+    try:
+        result = soak.run(args.hours)
+    finally:
+        if out:
+            out.close()
+
+    if result['passed']:
+        print("PASSED: no drift beyond the bounds")
+        return 0
+    for failure in result['failures']:
+        print(f"FAILED: {failure}")
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
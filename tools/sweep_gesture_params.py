@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Sweep gesture settings over recorded play sessions, in parallel
+
+Every configuration in the grid is replayed against every session and
+scored for false flaps, missed flaps and gesture-to-flap latency. Results
+are cached on disk by content hash, so re-running a sweep (or widening
+its grid) only evaluates the new points. Confidence values other than
+the recording's re-run the hand model over the session video.
+
+Record sessions with:
+    python tools/record_landmarks.py --session --out session1.npz
+
+Usage:
+    python tools/sweep_gesture_params.py session1.npz session2.npz \\
+        --grid FLAP_COOLDOWN=200,300,400 --grid MIN_FINGERS_FOR_FLAP=2,3,4
+    python tools/sweep_gesture_params.py --synthetic 3 --grid FLAP_COOLDOWN=150,300
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from config import SWEEP_CACHE_DIR
+from landmark_data import load_session, synthetic_session
+from param_sweep import PARAMETERS, ParameterSweep
+
+def parse_grid(items):
+    grid = {}
+    for item in items:
+        name, _, values = item.partition('=')
+        name = name.strip().upper()
+        if name not in PARAMETERS or not values:
+            raise SystemExit(f"--grid expects NAME=v1,v2,... with NAME one of "
+                             f"{', '.join(PARAMETERS)}")
+        cast = int if name in ('FLAP_COOLDOWN', 'MIN_FINGERS_FOR_FLAP') else float
+        grid[name] = [cast(v) for v in values.split(',')]
+    return grid
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('sessions', nargs='*', help='session recordings (.npz)')
+    parser.add_argument('--grid', action='append', default=[], metavar='NAME=V1,V2',
+                        help='values to try for a parameter (repeatable)')
+    parser.add_argument('--synthetic', type=int, default=0, metavar='N',
+                        help='also sweep N synthetic one-minute sessions')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--cache-dir', default=SWEEP_CACHE_DIR)
+    parser.add_argument('--top', type=int, default=10, help='configurations to print')
+    parser.add_argument('--json', help='write every configuration\'s results here')
+    args = parser.parse_args()
+
+    sessions = [load_session(path) for path in args.sessions]
+    sessions += [synthetic_session(seed=i) for i in range(args.synthetic)]
+    if not sessions:
+        raise SystemExit("No sessions: pass recordings or --synthetic N")
+
+    sweep = ParameterSweep(sessions, parse_grid(args.grid), args.cache_dir, args.workers)
+    start = time.perf_counter()
+    summaries = sweep.run(report=print)
+    print(f"{len(summaries)} configurations in {time.perf_counter() - start:.1f} s: "
+          f"{sweep.computed} points computed, {sweep.cached} cached, "
+          f"{sweep.reinferred} videos re-inferred, {sweep.skipped} skipped "
+          f"(no video to re-run at other confidences)")
+
+    print(f"{'det':>5} {'track':>5} {'cool':>5} {'fing':>4}  {'false/min':>9} "
+          f"{'miss %':>6} {'lat ms':>7} {'p90 ms':>7}")
+    for s in summaries[:args.top]:
+        latency = s['latency_mean_ms']
+        p90 = s['latency_p90_ms']
+        print(f"{s['MIN_DETECTION_CONFIDENCE']:5.2f} {s['MIN_TRACKING_CONFIDENCE']:5.2f} "
+              f"{s['FLAP_COOLDOWN']:5d} {s['MIN_FINGERS_FOR_FLAP']:4d}  "
+              f"{s['false_per_minute']:9.2f} {s['miss_rate'] * 100:6.1f} "
+              f"{latency if latency is not None else float('nan'):7.0f} "
+              f"{p90 if p90 is not None else float('nan'):7.0f}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(summaries, f, indent=2)
+        print(f"Wrote {args.json}")
+
+if __name__ == "__main__":
+    main()
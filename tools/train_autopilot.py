@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Train the autopilot policy by neuroevolution on a process pool
+
+Each generation every policy plays AUTOPILOT_GAMES fresh courses of the
+real game rules, headless, spread across worker processes. Progress and
+throughput (games evaluated per second per core) are printed each
+generation; a checkpoint lets a long run be resumed.
+
+Usage:
+    python tools/train_autopilot.py --generations 50 --out autopilot.npz
+    python tools/train_autopilot.py --resume autopilot-checkpoint.npz --generations 50
+    python main.py --autopilot autopilot.npz
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from autopilot import Trainer, HeadlessGame
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--generations', type=int, default=50)
+    parser.add_argument('--population', type=int, default=64)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--checkpoint', default='autopilot-checkpoint.npz',
+                        help='checkpoint file (.npz), written every 5 generations')
+    parser.add_argument('--resume', metavar='CHECKPOINT',
+                        help='continue training from a checkpoint')
+    parser.add_argument('--out', default='autopilot.npz', help='policy to write')
+    args = parser.parse_args()
+
+    if args.resume:
+        trainer = Trainer.load_checkpoint(args.resume)
+        print(f"Resuming at generation {trainer.generation}")
+    else:
+        trainer = Trainer(population=args.population, seed=args.seed)
+
+    policy = trainer.run(args.generations, args.workers, checkpoint=args.checkpoint)
+    policy.save(args.out)
+
+    # Validate on courses never used in training
+    results = [HeadlessGame(10_000 + i).play(policy) for i in range(20)]
+    scores = sorted(score for score, _ in results)
+    print(f"Saved {args.out}; validation scores: median {scores[len(scores) // 2]}, "
+          f"min {scores[0]}, max {scores[-1]}")
+
+if __name__ == "__main__":
+    main()
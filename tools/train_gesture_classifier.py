@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Train the nearest-centroid gesture classifier from recorded landmarks
+
+Usage:
+    python tools/train_gesture_classifier.py recording.npz [...] --out model.npz
+    python tools/train_gesture_classifier.py --synthetic 5000 --out model.npz
+
+Set GESTURE_MODEL_PATH in src/config.py to the output file to use it.
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from gesture_classifier import CentroidClassifier
+from landmark_data import load_landmarks, synthetic_dataset
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('data', nargs='*', help='labelled .npz recordings')
+    parser.add_argument('--synthetic', type=int, default=0,
+                        help='train on this many synthetic hands instead')
+    parser.add_argument('--out', required=True, help='model file to write')
+    parser.add_argument('--holdout', type=float, default=0.2,
+                        help='fraction of samples kept back for evaluation')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    if args.data:
+        data = load_landmarks(*args.data)
+        if 'labels' not in data:
+            parser.error("recordings must contain labels")
+    elif args.synthetic:
+        data = synthetic_dataset(args.synthetic, seed=args.seed)
+    else:
+        parser.error("give recordings or --synthetic N")
+
+    rng = np.random.default_rng(args.seed)
+    order = rng.permutation(len(data['labels']))
+    split = int(len(order) * (1 - args.holdout))
+    train, test = order[:split], order[split:]
+
+    model = CentroidClassifier().fit(data['landmarks'][train], data['labels'][train])
+    model.save(args.out)
+
+    print(f"Trained on {len(train)} samples, labels: {', '.join(model.labels)}")
+    if len(test):
+        correct = sum(
+            model.classify(data['landmarks'][i]) == data['labels'][i] for i in test
+        )
+        print(f"Held-out accuracy: {correct / len(test):.1%} ({len(test)} samples)")
+    print(f"Saved model to {args.out}")
+
+if __name__ == "__main__":
+    main()